@@ -0,0 +1,127 @@
+"""
+Unit tests for the vectorized backtester.
+"""
+
+import unittest
+import time
+import numpy as np
+import pandas as pd
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.backtest.vectorized import (
+    BacktestConfig,
+    VectorizedBacktester,
+    compute_risk_stats
+)
+
+class MomentumStrategy(BaseStrategy):
+    """Buys after up bars, sells after down bars."""
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        if state['change'] > 0:
+            return {'action': 'buy', 'confidence': 0.8}
+        if state['change'] < 0:
+            return {'action': 'sell', 'confidence': 0.8}
+        return {'action': 'hold', 'confidence': 0.0}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestVectorizedBacktester(unittest.TestCase):
+    """Test vectorized backtester."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(3)
+        self.close = 100 * np.exp(rng.normal(0, 0.01, 500).cumsum())
+        self.bars = pd.DataFrame({'close': self.close})
+
+    def _reference(self, signals, cfg):
+        """Bar-by-bar loop reference implementation."""
+        cost_rate = cfg.fee_rate + cfg.slippage_bps / 10_000
+        target, position, returns = 0.0, 0.0, []
+        targets = []
+        for s in signals:
+            if not np.isnan(s):
+                target = s
+            targets.append(target)
+        for t in range(len(signals)):
+            new_position = targets[t - cfg.execution_lag] if t >= cfg.execution_lag else 0.0
+            r = position * (self.close[t] / self.close[t - 1] - 1) if t else 0.0
+            r -= abs(new_position - position) * cost_rate
+            returns.append(r)
+            position = new_position
+        return np.array(returns)
+
+    def test_matches_loop_reference(self):
+        """Test vectorized returns match a loop implementation."""
+        rng = np.random.default_rng(4)
+        signals = rng.choice([1.0, -1.0, 0.0, np.nan], size=len(self.close))
+        cfg = BacktestConfig(fee_rate=0.001, slippage_bps=2, execution_lag=1)
+
+        result = VectorizedBacktester(cfg).run(self.bars, signals=signals)
+        np.testing.assert_allclose(result.returns, self._reference(signals, cfg))
+        np.testing.assert_allclose(result.equity[-1], cfg.initial_capital * np.prod(1 + result.returns))
+        self.assertEqual(result.stats['n_trades'], np.count_nonzero(result.trades))
+        self.assertTrue(np.isnan(result.fill_prices[result.trades == 0]).all())
+
+    def test_execution_lag_bounds(self):
+        """Test lags match the reference and lags beyond the history stay flat."""
+        rng = np.random.default_rng(5)
+        signals = rng.choice([1.0, -1.0, np.nan], size=len(self.close))
+        for lag in (0, 3, len(self.close) - 1):
+            cfg = BacktestConfig(execution_lag=lag)
+            result = VectorizedBacktester(cfg).run(self.bars, signals=signals)
+            np.testing.assert_allclose(result.returns, self._reference(signals, cfg))
+        for lag in (len(self.close), len(self.close) + 1, 2 * len(self.close) + 5):
+            result = VectorizedBacktester(BacktestConfig(execution_lag=lag)).run(self.bars, signals=signals)
+            self.assertTrue((result.positions == 0).all())
+        with self.assertRaises(ValueError):
+            BacktestConfig(execution_lag=-1)
+
+    def test_strategy_signals(self):
+        """Test strategies are evaluated through predict_batch."""
+        states = pd.DataFrame({'change': np.diff(self.close, prepend=self.close[0])})
+        result = VectorizedBacktester().run(self.bars, strategy=MomentumStrategy(), states=states)
+
+        expected = np.sign(states['change'].to_numpy())
+        self.assertTrue(np.all(result.positions[2:] == expected[1:-1]))
+        self.assertEqual(len(result.to_frame()), len(self.close))
+
+    def test_long_only_and_multi_asset(self):
+        """Test short clipping and 2-D bars."""
+        close = np.column_stack([self.close, self.close[::-1]])
+        signals = np.tile([[-1.0, 1.0]], (len(self.close), 1))
+        cfg = BacktestConfig(allow_short=False, fee_rate=0, slippage_bps=0)
+        result = VectorizedBacktester(cfg).run({'close': close}, signals=signals)
+
+        self.assertTrue((result.positions[:, 0] == 0).all())
+        self.assertAlmostEqual(result.equity[-1] / cfg.initial_capital,
+                               close[-1, 1] / close[1, 1], places=6)
+
+    def test_risk_stats(self):
+        """Test risk statistics."""
+        stats = compute_risk_stats(np.array([0.1, -0.5, 0.2]), periods_per_year=3)
+        self.assertAlmostEqual(stats['total_return'], 1.1 * 0.5 * 1.2 - 1)
+        self.assertAlmostEqual(stats['max_drawdown'], -0.5)
+        self.assertAlmostEqual(stats['win_rate'], 2 / 3)
+
+    def test_minute_bar_speed(self):
+        """Test a multi-year minute-bar run finishes quickly."""
+        n = 3 * 252 * 390
+        rng = np.random.default_rng(5)
+        close = 100 * np.exp(rng.normal(0, 1e-4, n).cumsum())
+        signals = np.sign(rng.standard_normal(n))
+        cfg = BacktestConfig(periods_per_year=252 * 390)
+
+        start = time.perf_counter()
+        VectorizedBacktester(cfg).run({'close': close}, signals=signals)
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
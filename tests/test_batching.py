@@ -0,0 +1,141 @@
+"""
+Unit tests for micro-batching inference.
+"""
+
+import unittest
+import asyncio
+import time
+import numpy as np
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.batching import MicroBatcher
+
+class EchoStrategy(BaseStrategy):
+    """Strategy recording the size of each batch it serves."""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.batches = []
+        self.fail = fail
+        self.delay = delay
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        return {'action': 'buy' if state['price'] > 0 else 'sell', 'confidence': 0.5}
+
+    def predict_batch(self, states, feature_names=None):
+        if self.fail:
+            raise RuntimeError("model failure")
+        time.sleep(self.delay)
+        self.batches.append(len(states))
+        prices = np.array([s['price'] for s in states])
+        return {
+            'action': np.where(prices > 0, 'buy', 'sell'),
+            'confidence': np.abs(prices) / 100,
+            'price': prices
+        }
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test micro-batching front-end."""
+
+    def test_concurrent_requests_are_batched(self):
+        """Test concurrent calls share forward passes and get their own result."""
+        strategy = EchoStrategy()
+
+        async def run():
+            async with MicroBatcher(strategy, max_batch_size=16, max_wait_ms=5) as batcher:
+                prices = list(range(-20, 20))
+                results = await asyncio.gather(*(batcher.predict({'price': p}) for p in prices))
+                return prices, results, batcher.get_statistics()
+
+        prices, results, stats = asyncio.run(run())
+        for price, result in zip(prices, results):
+            self.assertEqual(result['price'], price)
+            self.assertEqual(result['action'], 'buy' if price > 0 else 'sell')
+            self.assertIsInstance(result['confidence'], float)
+        self.assertLessEqual(max(strategy.batches), 16)
+        self.assertLess(len(strategy.batches), len(prices))
+        self.assertEqual(stats['total_requests'], len(prices))
+        self.assertIn('p99_latency', stats)
+
+    def test_max_wait_bounds_latency(self):
+        """Test a lone request is dispatched after the wait limit."""
+        strategy = EchoStrategy()
+
+        async def run():
+            async with MicroBatcher(strategy, max_batch_size=64, max_wait_ms=2) as batcher:
+                start = time.perf_counter()
+                await batcher.predict({'price': 1.0})
+                return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+        self.assertEqual(strategy.batches, [1])
+        self.assertLess(elapsed, 0.5)
+
+    def test_errors_propagate(self):
+        """Test model errors reach every waiting caller."""
+        strategy = EchoStrategy(fail=True)
+
+        async def run():
+            async with MicroBatcher(strategy, max_wait_ms=1) as batcher:
+                return await asyncio.gather(
+                    batcher.predict({'price': 1}),
+                    batcher.predict({'price': 2}),
+                    return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_bad_batch_keeps_worker_running(self):
+        """Test malformed batch outputs fail their callers but not later requests."""
+        strategy = EchoStrategy()
+        predict_batch = strategy.predict_batch
+
+        async def run():
+            async with MicroBatcher(strategy, max_wait_ms=5) as batcher:
+                strategy.predict_batch = lambda states, names=None: {
+                    key: values[:1] for key, values in predict_batch(states, names).items()
+                }
+                short = await asyncio.wait_for(asyncio.gather(
+                    batcher.predict({'price': 1}),
+                    batcher.predict({'price': 2}),
+                    return_exceptions=True
+                ), 1.0)
+                strategy.predict_batch = lambda states, names=None: {'action': np.array(['buy'] * len(states)),
+                                                                     'confidence': np.empty(0)}
+                ragged = await asyncio.wait_for(asyncio.gather(
+                    batcher.predict({'price': 3}), return_exceptions=True
+                ), 1.0)
+                strategy.predict_batch = predict_batch
+                return short, ragged, await asyncio.wait_for(batcher.predict({'price': 4}), 1.0)
+
+        short, ragged, result = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in short + ragged))
+        self.assertEqual(result['price'], 4)
+
+    def test_stop_fails_in_flight_requests(self):
+        """Test requests being collected or mid forward pass fail on stop."""
+        async def run(strategy, max_wait_ms):
+            batcher = MicroBatcher(strategy, max_wait_ms=max_wait_ms)
+            await batcher.start()
+            tasks = [asyncio.create_task(batcher.predict({'price': p})) for p in range(3)]
+            await asyncio.sleep(0.05)
+            await batcher.stop()
+            return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1.0)
+
+        # Forward pass running in the executor
+        results = asyncio.run(run(EchoStrategy(delay=0.3), max_wait_ms=1))
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        # Batch still waiting to fill
+        results = asyncio.run(run(EchoStrategy(), max_wait_ms=10000))
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for the strategy checkpoint format.
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import torch
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.checkpoint import AsyncCheckpointWriter, load_checkpoint, read_header, save_checkpoint
+from tradeAI.utils.tools import compute_hash
+
+class LinearStrategy(BaseStrategy):
+    """Torch linear model exposing its parameters."""
+
+    def __init__(self):
+        self.model = torch.nn.Linear(4, 3)
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        return {'action': 'hold', 'confidence': 1.0}
+
+    def save(self, path):
+        self.save_checkpoint(path)
+
+    def load(self, path):
+        self.load_checkpoint(path)
+
+    def get_parameters(self):
+        return self.model.state_dict()
+
+    def set_parameters(self, parameters):
+        self.model.load_state_dict(parameters)
+
+    def get_checkpoint_metadata(self):
+        return {'in_features': 4}
+
+class TestCheckpoint(unittest.TestCase):
+    """Test checkpoint save/load."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'model.ckpt')
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.tmp.cleanup()
+
+    def test_roundtrip_mmap(self):
+        """Test arrays and tensors survive a memory-mapped roundtrip."""
+        tensors = {
+            'w': np.arange(12, dtype=np.float32).reshape(3, 4),
+            'steps': np.array(7, dtype=np.int64),
+            'b': torch.randn(5, dtype=torch.bfloat16)
+        }
+        content_hash = save_checkpoint(self.path, tensors, {'step': 7})
+        checkpoint = load_checkpoint(self.path, verify=True)
+
+        self.assertEqual(checkpoint.content_hash, content_hash)
+        self.assertEqual(checkpoint.metadata, {'step': 7})
+        self.assertIsInstance(checkpoint.tensors['w'].base, np.memmap)
+        np.testing.assert_array_equal(checkpoint.tensors['w'], tensors['w'])
+        self.assertEqual(checkpoint.tensors['steps'], 7)
+        self.assertEqual(checkpoint.tensors['b'].dtype, torch.bfloat16)
+        self.assertTrue(torch.equal(checkpoint.tensors['b'], tensors['b']))
+
+        # Copy-on-write: in-place edits do not reach the file
+        checkpoint.tensors['w'][0, 0] = -1
+        np.testing.assert_array_equal(load_checkpoint(self.path).tensors['w'], tensors['w'])
+
+    def test_hash_dedupe_and_integrity(self):
+        """Test unchanged content is not rewritten and corruption is detected."""
+        tensors = {'w': np.ones(100, dtype=np.float32)}
+        first = save_checkpoint(self.path, tensors)
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertEqual(save_checkpoint(self.path, tensors), first)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+        self.assertNotEqual(save_checkpoint(self.path, {'w': np.zeros(100, dtype=np.float32)}), first)
+
+        with open(self.path, 'r+b') as f:
+            f.seek(-4, os.SEEK_END)
+            f.write(b'\x00\x00\x80\x7f')
+        with self.assertRaises(ValueError):
+            load_checkpoint(self.path, verify=True)
+        self.assertEqual(compute_hash(b'abc'), compute_hash(bytearray(b'abc')))
+
+    def test_strategy_background_save(self):
+        """Test background saves snapshot parameters and load restores them."""
+        strategy = LinearStrategy()
+        expected = {k: v.clone() for k, v in strategy.model.state_dict().items()}
+        future = strategy.save_checkpoint(self.path, background=True)
+        with torch.no_grad():
+            strategy.model.weight.zero_()
+        future.result()
+        self.assertEqual(read_header(self.path)['metadata']['strategy'], 'LinearStrategy')
+
+        restored = LinearStrategy()
+        metadata = restored.load_checkpoint(self.path, verify=True)
+        self.assertEqual(metadata['content_hash'], future.result())
+        self.assertEqual(metadata['in_features'], 4)
+        for name, value in restored.model.state_dict().items():
+            self.assertTrue(torch.equal(value, expected[name]))
+
+    def test_async_writer_wait(self):
+        """Test the writer flushes pending saves."""
+        writer = AsyncCheckpointWriter()
+        for i in range(3):
+            writer.save(self.path, {'w': np.full(10, i, dtype=np.float32)}, {'i': i})
+        writer.wait()
+        writer.close()
+        self.assertEqual(load_checkpoint(self.path).metadata['i'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
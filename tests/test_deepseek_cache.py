@@ -0,0 +1,285 @@
+"""
+Unit tests for the DeepSeek response cache and request coalescing.
+"""
+
+import time
+import asyncio
+import threading
+import tempfile
+import unittest
+import numpy as np
+from aiohttp import web
+from tradeAI.core.deepseek.cache import ResponseCache, SingleFlight
+from tradeAI.core.deepseek.client import AsyncDeepSeekClient
+from tradeAI.core.deepseek.mock import LatencyModel, MockConfig, MockDeepSeekServer
+from tradeAI.core.exceptions import APIKeyError, APIResponseError
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ttls = {'/v1/rl/evaluate': 60.0, '/v1/rl': 1.0}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_canonical_key(self):
+        """Test logically identical requests share a key."""
+        a = ResponseCache.make_key('post', '/v1/rl/evaluate', {'b': 1, 'a': np.arange(2)})
+        b = ResponseCache.make_key('POST', '/v1/rl/evaluate', {'a': [0, 1], 'b': 1})
+        c = ResponseCache.make_key('POST', '/v1/rl/evaluate', {'a': [0, 1], 'b': 2})
+
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+        scope = ResponseCache.make_scope('key', 'https://api.deepseek.com')
+        self.assertNotEqual(ResponseCache.make_key('GET', '/v1/models', scope=scope),
+                            ResponseCache.make_key('GET', '/v1/models',
+                                                   scope=ResponseCache.make_scope('other', 'https://api.deepseek.com')))
+        self.assertNotEqual(scope, ResponseCache.make_scope('key', 'http://127.0.0.1:8080'))
+        self.assertNotIn('key', scope)
+
+    def test_endpoint_ttls(self):
+        """Test TTLs resolve by longest prefix and uncached endpoints are skipped."""
+        cache = ResponseCache(ttls=self.ttls)
+
+        self.assertEqual(cache.ttl_for('/v1/rl/evaluate'), 60.0)
+        self.assertEqual(cache.ttl_for('/v1/rl/train'), 1.0)
+        self.assertEqual(cache.ttl_for('/v1/chat/completions'), 0.0)
+
+        cache.put('k', '/v1/chat/completions', b'{}')
+        self.assertIsNone(cache.get('k'))
+
+    def test_expiry(self):
+        """Test entries expire after their endpoint's TTL."""
+        cache = ResponseCache(ttls={'/v1/models': 0.05})
+        cache.put('k', '/v1/models', b'{"data": []}')
+        self.assertEqual(cache.get('k'), b'{"data": []}')
+
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get('k'))
+        self.assertEqual(cache.get_statistics()['expirations'], 1)
+
+    def test_lru_eviction(self):
+        """Test the memory tier evicts least recently used entries."""
+        cache = ResponseCache(max_size=2, ttls=self.ttls)
+        for key in ('a', 'b'):
+            cache.put(key, '/v1/rl/evaluate', key.encode())
+        cache.get('a')
+        cache.put('c', '/v1/rl/evaluate', b'c')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), b'a')
+        self.assertEqual(cache.get_statistics()['evictions'], 1)
+
+    def test_disk_tier(self):
+        """Test entries survive in the disk tier and are promoted to memory."""
+        writer = ResponseCache(directory=self.temp_dir.name, ttls=self.ttls)
+        writer.put('abc', '/v1/rl/evaluate', b'{"sharpe": 1.5}')
+
+        reader = ResponseCache(directory=self.temp_dir.name, ttls=self.ttls)
+        self.assertEqual(reader.get('abc'), b'{"sharpe": 1.5}')
+        self.assertEqual(reader.get('abc'), b'{"sharpe": 1.5}')
+
+        stats = reader.get_statistics()
+        self.assertEqual(stats['disk_hits'], 1)
+        self.assertEqual(stats['memory_hits'], 1)
+        self.assertEqual(stats['bytes_saved'], 2 * len(b'{"sharpe": 1.5}'))
+
+        reader.clear()
+        self.assertIsNone(ResponseCache(directory=self.temp_dir.name, ttls=self.ttls).get('abc'))
+
+    def test_prune(self):
+        """Test pruning deletes expired entries on disk."""
+        cache = ResponseCache(directory=self.temp_dir.name, ttls={'/v1/models': 0.05, '/v1/rl': 60.0})
+        cache.put('a', '/v1/models', b'a')
+        cache.put('b', '/v1/rl/evaluate', b'b')
+
+        time.sleep(0.1)
+
+        self.assertEqual(cache.prune(), 2)
+        self.assertEqual(cache.get('b'), b'b')
+        self.assertEqual(cache.get_statistics()['expirations'], 2)
+
+    def test_concurrent_counters(self):
+        """Test counters from the memory and disk paths add up under threads."""
+        writer = ResponseCache(directory=self.temp_dir.name, ttls={'/v1/models': 0.05})
+        for i in range(200):
+            writer.put(f"k{i}", '/v1/models', b'x')
+        time.sleep(0.1)
+
+        cache = ResponseCache(directory=self.temp_dir.name, ttls={'/v1/models': 60.0})
+        cache.put('hot', '/v1/models', b'x')
+
+        def worker(offset):
+            for i in range(offset, 200, 8):
+                cache.get(f"k{i}")
+                cache.get('hot')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_statistics()
+        self.assertEqual(stats['expirations'], 200)
+        self.assertEqual(stats['misses'], 200)
+        self.assertEqual(stats['memory_hits'], 200)
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_calls_share_result(self):
+        """Test concurrent callers with one key share one call."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return b'result'
+
+        async def main():
+            flights = SingleFlight()
+            return await asyncio.gather(*(flights.do('k', fetch) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r for r, _ in results], [b'result'] * 5)
+        self.assertEqual(sum(shared for _, shared in results), 4)
+
+    def test_failure_propagates(self):
+        """Test a failed call raises for every waiting caller."""
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        async def main():
+            flights = SingleFlight()
+            results = await asyncio.gather(*(flights.do('k', fail) for _ in range(3)), return_exceptions=True)
+            return results, len(flights)
+
+        results, pending = asyncio.run(main())
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(pending, 0)
+
+    def test_leader_cancellation(self):
+        """Test a cancelled leader hands the call to a waiting caller."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return b'result'
+
+        async def main():
+            flights = SingleFlight()
+            leader = asyncio.create_task(flights.do('k', fetch))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(flights.do('k', fetch)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            return leader.cancelled(), results, len(flights)
+
+        leader_cancelled, results, pending = asyncio.run(main())
+
+        self.assertTrue(leader_cancelled)
+        self.assertEqual([r for r, _ in results], [b'result'] * 3)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(pending, 0)
+
+class TestCachedClient(unittest.TestCase):
+    """Test cases for the client with a response cache."""
+
+    def run_with_server(self, func, cache):
+        calls = []
+
+        async def evaluate(request):
+            calls.append(await request.json())
+            await asyncio.sleep(0.05)
+            if request.query.get('fail'):
+                return web.json_response({'error': 'boom'}, status=500)
+            return web.json_response({'sharpe': 1.5})
+
+        async def main():
+            app = web.Application()
+            app.router.add_post('/v1/rl/evaluate', evaluate)
+            app.router.add_post('/v1/rl/train', evaluate)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            try:
+                async with AsyncDeepSeekClient('key', f"http://127.0.0.1:{port}", cache=cache) as client:
+                    return await func(client)
+            finally:
+                await runner.cleanup()
+
+        return asyncio.run(main()), calls
+
+    def test_identical_requests_share_one_call(self):
+        """Test concurrent and repeated identical requests hit the server once."""
+        cache = ResponseCache(ttls={'/v1/rl/evaluate': 60.0})
+
+        async def burst(client):
+            first = await asyncio.gather(*(client.post('/v1/rl/evaluate', {'strategy': 'ma'}) for _ in range(4)))
+            again = await client.post('/v1/rl/evaluate', {'strategy': 'ma'})
+            return first + [again]
+
+        results, calls = self.run_with_server(burst, cache)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'sharpe': 1.5}] * 5)
+        stats = cache.get_statistics()
+        self.assertEqual(stats['coalesced'], 3)
+        self.assertEqual(stats['memory_hits'], 1)
+        self.assertEqual(stats['hit_rate'], 0.8)
+
+    def test_uncached_endpoints_and_errors(self):
+        """Test endpoints without a TTL and failed responses are not cached."""
+        cache = ResponseCache(ttls={'/v1/rl/evaluate': 60.0})
+
+        async def requests(client):
+            for _ in range(2):
+                await client.post('/v1/rl/train', {'steps': 10})
+            for _ in range(2):
+                with self.assertRaises(APIResponseError):
+                    await client.request('POST', '/v1/rl/evaluate', {'strategy': 'ma'}, {'fail': '1'})
+
+        _, calls = self.run_with_server(requests, cache)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(cache.get_statistics()['size'], 0)
+
+    def test_credentials_are_not_shared(self):
+        """Test a cached response is never served to another API key."""
+        async def main(directory):
+            server = MockDeepSeekServer(MockConfig(latency=LatencyModel('constant', mean=0.0), api_key='key'))
+            url = await server.start()
+            try:
+                async with AsyncDeepSeekClient('key', url, cache=ResponseCache(directory=directory)) as good:
+                    await good.list_models()
+                    valid = await good.validate_api_key()
+                async with AsyncDeepSeekClient('wrong', url, cache=ResponseCache(directory=directory)) as bad:
+                    invalid = await bad.validate_api_key()
+                    with self.assertRaises(APIKeyError):
+                        await bad.list_models()
+                return valid, invalid
+            finally:
+                await server.stop()
+
+        with tempfile.TemporaryDirectory() as directory:
+            valid, invalid = asyncio.run(main(directory))
+
+        self.assertTrue(valid)
+        self.assertFalse(invalid)
+
+if __name__ == '__main__':
+    unittest.main()
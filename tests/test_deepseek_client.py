@@ -0,0 +1,236 @@
+"""
+Unit tests for the async DeepSeek API client.
+"""
+
+import asyncio
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from aiohttp import web
+from tradeAI.core.deepseek.base import DeepSeekAPI, DeepSeekDistill, DeepSeekRL
+from tradeAI.core.deepseek.client import AsyncDeepSeekClient, ClientConfig
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.exceptions import APIKeyError, APIResponseError, RateLimitError
+
+class FixedStrategy(BaseStrategy):
+    """Strategy without settable parameters."""
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        return {'action': 'hold', 'confidence': 1.0}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class FakeServer:
+    """Local DeepSeek-like API on a background loop."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.peers = set()
+        self.requests = []
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def _track(self, request):
+        self.requests.append((request.method, request.path))
+        self.peers.add(request.transport.get_extra_info('peername'))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+    async def models(self, request):
+        if request.headers.get('Authorization') != 'Bearer good':
+            return web.json_response({'error': 'bad key'}, status=401)
+        await self._track(request)
+        return web.json_response({'data': [{'id': 'deepseek-chat'}]})
+
+    async def echo(self, request):
+        await self._track(request)
+        return web.json_response({'received': await request.json()})
+
+    async def optimize(self, request):
+        await self._track(request)
+        return web.json_response({'parameters': {'weights': [1.0, 2.0]}})
+
+    async def limited(self, request):
+        return web.json_response({'error': 'slow down'}, status=429, headers={'Retry-After': '2'})
+
+    async def broken(self, request):
+        return web.json_response({'error': 'boom'}, status=500)
+
+    def start(self):
+        self.thread.start()
+        app = web.Application()
+        app.router.add_get('/v1/models', self.models)
+        app.router.add_post('/v1/echo', self.echo)
+        app.router.add_post('/v1/rl/evaluate', self.echo)
+        app.router.add_post('/v1/rl/optimize', self.optimize)
+        app.router.add_post('/v1/distill', self.echo)
+        app.router.add_post('/v1/distill/validate', self.echo)
+        app.router.add_get('/v1/limited', self.limited)
+        app.router.add_get('/v1/broken', self.broken)
+        self.runner = web.AppRunner(app)
+
+        async def setup():
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, '127.0.0.1', 0)
+            await site.start()
+            return self.runner.addresses[0][1]
+
+        port = asyncio.run_coroutine_threadsafe(setup(), self.loop).result()
+        self.url = f"http://127.0.0.1:{port}"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+class TestAsyncDeepSeekClient(unittest.TestCase):
+    """Test cases for AsyncDeepSeekClient."""
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def run_client(self, func, api_key='good', **config):
+        async def main():
+            async with AsyncDeepSeekClient(api_key, self.server.url, ClientConfig(**config)) as client:
+                return await func(client), client
+        return asyncio.run(main())
+
+    def test_fan_out_runs_concurrently(self):
+        """Test fan-out overlaps requests up to the concurrency cap."""
+        async def fan_out(client):
+            return await client.fan_out(lambda s: client.post('/v1/echo', {'symbol': s}), range(8))
+
+        results, client = self.run_client(fan_out, max_concurrency=4)
+
+        self.assertEqual([r['received']['symbol'] for r in results], list(range(8)))
+        self.assertEqual(self.server.max_active, 4)
+        self.assertEqual(client.get_statistics()['max_in_flight'], 4)
+
+    def test_keep_alive_reuses_connections(self):
+        """Test sequential requests share one pooled connection."""
+        async def sequential(client):
+            for _ in range(5):
+                await client.get('/v1/models')
+
+        self.run_client(sequential)
+
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.server.peers), 1)
+
+    def test_validate_api_key(self):
+        """Test key validation against the models endpoint."""
+        valid, _ = self.run_client(lambda c: c.validate_api_key())
+        invalid, _ = self.run_client(lambda c: c.validate_api_key(), api_key='bad')
+
+        self.assertTrue(valid)
+        self.assertFalse(invalid)
+
+    def test_error_mapping(self):
+        """Test error statuses map to API exceptions."""
+        async def check(client):
+            with self.assertRaises(RateLimitError) as limited:
+                await client.get('/v1/limited')
+            with self.assertRaises(APIResponseError) as broken:
+                await client.get('/v1/broken')
+            return limited.exception, broken.exception
+
+        (limited, broken), client = self.run_client(check)
+
+        self.assertEqual(limited.status, 429)
+        self.assertEqual(limited.retry_after, 2.0)
+        self.assertEqual(broken.status, 500)
+        self.assertEqual(client.get_statistics()['errors'], 2)
+
+    def test_numpy_payload(self):
+        """Test NumPy values are serialized in request bodies."""
+        result, _ = self.run_client(lambda c: c.post('/v1/echo', {'x': np.arange(3), 'y': np.float32(1.5)}))
+
+        self.assertEqual(result['received'], {'x': [0, 1, 2], 'y': 1.5})
+
+    def test_timestamp_payload(self):
+        """Test timestamp columns and datetime64 values are sent as ISO strings."""
+        frame = pd.DataFrame({
+            'time': pd.to_datetime(['2024-01-01 09:30', None]),
+            'close': [1.0, 2.0]
+        })
+        payload = {'bars': frame, 'at': np.datetime64('2024-01-02T00:00:00'),
+                   'times': frame['time'].to_numpy()}
+        result, _ = self.run_client(lambda c: c.post('/v1/echo', payload))
+
+        self.assertEqual(result['received'], {
+            'bars': [{'time': '2024-01-01T09:30:00', 'close': 1.0}, {'time': None, 'close': 2.0}],
+            'at': '2024-01-02T00:00:00',
+            'times': ['2024-01-01T09:30:00', None]
+        })
+
+class TestDeepSeekAPI(unittest.TestCase):
+    """Test cases for the synchronous DeepSeekAPI facade."""
+
+    def setUp(self):
+        self.server = FakeServer(delay=0.0)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_sync_wrappers(self):
+        """Test sync calls share the pooled client across calls."""
+        with DeepSeekAPI('good', self.server.url) as api:
+            for _ in range(3):
+                self.assertTrue(api.validate_api_key())
+            self.assertEqual(len(self.server.peers), 1)
+            results = api.fan_out(lambda s: api.client.post('/v1/echo', {'symbol': s}), ['BTC', 'ETH'])
+            self.assertEqual([r['received']['symbol'] for r in results], ['BTC', 'ETH'])
+
+        with DeepSeekAPI('bad', self.server.url) as api:
+            self.assertFalse(api.validate_api_key())
+            with self.assertRaises(APIKeyError):
+                api.run(api.client.list_models())
+
+    def test_interfaces(self):
+        """Test RL and distillation interfaces are concrete."""
+        with DeepSeekAPI('good', self.server.url) as api:
+            rl = api.get_rl_interface()
+            distill = api.get_distill_interface()
+            self.assertIsInstance(rl, DeepSeekRL)
+            self.assertIsInstance(distill, DeepSeekDistill)
+
+            rl.initialize_model('deepseek-rl')
+            result = rl.evaluate_strategy(object(), {'returns': [0.1]})
+            self.assertEqual(result['received']['model'], 'deepseek-rl')
+
+            strategy = FixedStrategy()
+            with self.assertLogs('tradeAI.core.deepseek.client', 'WARNING'):
+                self.assertIs(rl.optimize_strategy(strategy, {}), strategy)
+
+            distill.initialize_model('deepseek-distill')
+            self.assertEqual(distill.distill_model(None, {})['received']['teacher'], 'deepseek-distill')
+            self.assertEqual(distill.distill_model('teacher-v2', {})['received']['teacher'], 'teacher-v2')
+            result = distill.validate_distilled_model('student-v1', {'x': [1]})
+            self.assertEqual(result['received']['model'], 'student-v1')
+            with self.assertRaises(TypeError):
+                distill.distill_model(object(), {})
+            with self.assertRaises(TypeError):
+                distill.optimize_distilled_model(object(), {})
+
+if __name__ == '__main__':
+    unittest.main()
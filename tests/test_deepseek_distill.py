@@ -0,0 +1,169 @@
+"""
+Unit tests for local knowledge distillation.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+from tradeAI.core.data.windows import WindowDataset
+from tradeAI.core.deepseek.base import DeepSeekAPI, DeepSeekDistill
+from tradeAI.core.deepseek.distill import (
+    ArrayDataset, DistillConfig, LocalDeepSeekDistill, build_student, count_parameters, kd_loss
+)
+
+def make_teacher(input_dim, n_classes=3, seed=0):
+    torch.manual_seed(seed)
+    return nn.Sequential(
+        nn.Flatten(),
+        nn.Linear(input_dim, 256), nn.ReLU(),
+        nn.Linear(256, 256), nn.ReLU(),
+        nn.Linear(256, n_classes)
+    ).eval()
+
+class TestKDLoss(unittest.TestCase):
+    """Test cases for kd_loss."""
+
+    def test_matching_logits(self):
+        """Test the soft term vanishes when student matches teacher."""
+        logits = torch.randn(16, 3)
+
+        self.assertAlmostEqual(kd_loss(logits, logits, alpha=1.0).item(), 0.0, places=6)
+        self.assertGreater(kd_loss(torch.zeros(16, 3), logits).item(), 0.0)
+
+    def test_hard_labels(self):
+        """Test alpha blends in cross-entropy with the labels."""
+        student, teacher = torch.randn(16, 3), torch.randn(16, 3)
+        labels = torch.randint(0, 3, (16,))
+
+        hard_only = kd_loss(student, teacher, labels, alpha=0.0)
+        self.assertAlmostEqual(hard_only.item(), nn.functional.cross_entropy(student, labels).item(), places=5)
+        self.assertAlmostEqual(kd_loss(student, teacher, None, alpha=0.5).item(),
+                               kd_loss(student, teacher, alpha=1.0).item(), places=6)
+
+    def test_temperature_scaling(self):
+        """Test gradients keep their scale across temperatures."""
+        teacher = torch.randn(64, 3)
+        norms = []
+        for temperature in (5.0, 20.0):
+            student = torch.zeros(64, 3, requires_grad=True)
+            kd_loss(student, teacher, temperature=temperature, alpha=1.0).backward()
+            norms.append(student.grad.norm().item())
+
+        self.assertAlmostEqual(norms[0] / norms[1], 1.0, delta=0.1)
+
+class TestLocalDeepSeekDistill(unittest.TestCase):
+    """Test cases for LocalDeepSeekDistill."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.standard_normal((3000, 8)).astype(np.float32)
+        self.teacher = make_teacher(8)
+        with torch.no_grad():
+            self.y = self.teacher(torch.from_numpy(self.x)).argmax(-1).numpy()
+        self.distiller = LocalDeepSeekDistill()
+        self.distiller.initialize_model('student', epochs=15, batch_size=128, lr=3e-3, seed=0)
+
+    def test_distill_matches_teacher(self):
+        """Test the student learns to agree with the teacher."""
+        student = self.distiller.distill_model(self.teacher, {
+            'train_data': {'x': self.x[:2500], 'y': self.y[:2500]},
+            'val_data': {'x': self.x[2500:], 'y': self.y[2500:]},
+            'hidden_sizes': (32,)
+        })
+
+        self.assertFalse(student.training)
+        self.assertFalse(self.teacher.training)
+        self.assertLess(count_parameters(student), count_parameters(self.teacher) / 50)
+        history = self.distiller.history
+        self.assertEqual(len(history), 15)
+        self.assertLess(history[-1]['loss'], history[0]['loss'])
+        self.assertGreater(history[-1]['teacher_agreement'], 0.85)
+        self.assertEqual(self.distiller.get_model_info()['epochs_trained'], 15)
+
+    def test_soft_targets_only(self):
+        """Test distillation works without hard labels and with a custom student."""
+        custom = build_student((8,), 3, hidden_sizes=(16, 16))
+        student = self.distiller.distill_model(self.teacher, {
+            'train_data': {'x': self.x}, 'student': custom, 'epochs': 3
+        })
+
+        self.assertIs(student, custom)
+        self.assertEqual(len(self.distiller.history), 3)
+
+        class FalsyStudent(nn.Module):
+            """Student that evaluates as false, like an empty container."""
+            def __init__(self):
+                super().__init__()
+                self.linear = nn.Linear(8, 3)
+
+            def forward(self, x):
+                return self.linear(x)
+
+            def __len__(self):
+                return 0
+
+        falsy = FalsyStudent()
+        self.assertIs(self.distiller.distill_model(self.teacher, {
+            'train_data': {'x': self.x}, 'student': falsy, 'epochs': 1
+        }), falsy)
+
+    def test_window_dataset(self):
+        """Test distilling over sliding windows of bars."""
+        bars = pd.DataFrame(np.random.default_rng(1).standard_normal((600, 2)), columns=['ret', 'vol'])
+        dataset = WindowDataset(bars, window=4, features=['ret', 'vol'])
+        teacher = make_teacher(8)
+
+        student = self.distiller.distill_model(teacher, {'train_data': dataset, 'val_data': dataset, 'epochs': 2})
+
+        self.assertEqual(student(torch.zeros(5, 4, 2)).shape, (5, 3))
+        self.assertIn('teacher_agreement', self.distiller.history[-1])
+
+    def test_optimize_and_validate(self):
+        """Test quantization and the accuracy/latency report."""
+        student = self.distiller.distill_model(self.teacher, {
+            'train_data': {'x': self.x[:2500], 'y': self.y[:2500]}, 'epochs': 5
+        })
+        optimized = self.distiller.optimize_distilled_model(student, {'quantize': True})
+        with torch.no_grad():
+            agreement = (optimized(torch.from_numpy(self.x)).argmax(-1) ==
+                         student(torch.from_numpy(self.x)).argmax(-1)).float().mean().item()
+        self.assertGreater(agreement, 0.95)
+
+        traced = self.distiller.optimize_distilled_model(student, {'quantize': False, 'trace': True,
+                                                                   'example_input': self.x[:1]})
+        self.assertTrue(torch.allclose(traced(torch.from_numpy(self.x[:4])), student(torch.from_numpy(self.x[:4]))))
+
+        report = self.distiller.validate_distilled_model(optimized, {
+            'x': self.x[2500:], 'y': self.y[2500:], 'teacher': self.teacher, 'n_runs': 50
+        })
+        for key in ('accuracy', 'teacher_agreement', 'latency_ms_p50', 'latency_ms_p99',
+                    'parameters', 'teacher_accuracy', 'teacher_latency_ms_p50', 'speedup'):
+            self.assertIn(key, report)
+        self.assertEqual(report['teacher_accuracy'], 1.0)
+        self.assertGreater(report['speedup'], 0.0)
+
+    def test_api_interface(self):
+        """Test DeepSeekAPI hands out the local implementation."""
+        api = DeepSeekAPI('key')
+        distiller = api.get_distill_interface(local=True)
+
+        self.assertIsInstance(distiller, DeepSeekDistill)
+        self.assertIsInstance(distiller, LocalDeepSeekDistill)
+
+    def test_config_and_dataset(self):
+        """Test config overrides and dataset gathering."""
+        config = DistillConfig.from_dict({'temperature': 2.0, 'unknown': 1})
+        self.assertEqual(config.temperature, 2.0)
+
+        dataset = ArrayDataset({'x': self.x, 'y': self.y})
+        batch = dataset.gather(np.array([5, 1]))
+        self.assertEqual(batch['x'].dtype, np.float32)
+        self.assertEqual(batch['y'].dtype, np.int64)
+        np.testing.assert_array_equal(batch['index'], [5, 1])
+        with self.assertRaises(ValueError):
+            ArrayDataset({'x': self.x, 'y': self.y[:10]})
+
+if __name__ == '__main__':
+    unittest.main()
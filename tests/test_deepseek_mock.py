@@ -0,0 +1,163 @@
+"""
+Unit tests for the mock DeepSeek server and benchmark harness.
+"""
+
+import json
+import asyncio
+import unittest
+import numpy as np
+from tradeAI.core.deepseek.base import DeepSeekAPI
+from tradeAI.core.deepseek.benchmark import benchmark, evaluation_workload, format_report, run_load
+from tradeAI.core.deepseek.client import AsyncDeepSeekClient, ClientConfig
+from tradeAI.core.deepseek.mock import LatencyModel, MockConfig, MockDeepSeekServer
+from tradeAI.core.exceptions import APIKeyError, APIResponseError, RateLimitError
+
+FAST = LatencyModel('constant', mean=0.0)
+
+class TestLatencyModel(unittest.TestCase):
+    """Test cases for LatencyModel."""
+
+    def test_distributions(self):
+        """Test sampled latencies follow the configured distribution."""
+        rng = np.random.default_rng(0)
+        for distribution in ('uniform', 'normal', 'lognormal', 'exponential'):
+            model = LatencyModel(distribution, mean=0.02, spread=0.2)
+            samples = np.array([model.sample(rng) for _ in range(5000)])
+            self.assertTrue((samples >= 0).all())
+            center = np.median(samples) if distribution == 'lognormal' else samples.mean()
+            self.assertAlmostEqual(center, 0.02, delta=0.002)
+
+        self.assertEqual(LatencyModel('constant', mean=0.01).sample(rng), 0.01)
+        with self.assertRaises(ValueError):
+            LatencyModel('pareto').sample(rng)
+
+    def test_spikes(self):
+        """Test spikes add tail latency at the configured probability."""
+        rng = np.random.default_rng(0)
+        model = LatencyModel('constant', mean=0.01, spike_probability=0.1, spike=1.0)
+        samples = np.array([model.sample(rng) for _ in range(5000)])
+
+        self.assertAlmostEqual((samples > 0.5).mean(), 0.1, delta=0.02)
+
+class TestMockDeepSeekServer(unittest.TestCase):
+    """Test cases for MockDeepSeekServer."""
+
+    def run_server(self, func, **config):
+        async def main():
+            server = MockDeepSeekServer(MockConfig(**{'latency': FAST, 'seed': 0, **config}))
+            url = await server.start()
+            try:
+                async with AsyncDeepSeekClient('key', url) as client:
+                    return await func(client, server)
+            finally:
+                await server.stop()
+        return asyncio.run(main())
+
+    def test_endpoints(self):
+        """Test the RL and distillation endpoints respond."""
+        async def calls(client, server):
+            return (await client.list_models(),
+                    await client.post('/v1/rl/evaluate', {'model': 'deepseek-rl'}),
+                    await client.post('/v1/distill/validate', {'model': 'small'}))
+
+        models, evaluation, validation = self.run_server(calls)
+
+        self.assertIn('deepseek-rl', [m['id'] for m in models])
+        self.assertIn('sharpe_ratio', evaluation)
+        self.assertIn('accuracy', validation)
+
+    def test_auth_errors_and_rate_limit(self):
+        """Test injected key, server and rate-limit failures."""
+        async def bad_key(client, server):
+            with self.assertRaises(APIKeyError):
+                await client.list_models()
+
+        async def failing(client, server):
+            with self.assertRaises(APIResponseError) as error:
+                await client.list_models()
+            return error.exception.status
+
+        async def limited(client, server):
+            for _ in range(3):
+                await client.list_models()
+            with self.assertRaises(RateLimitError) as error:
+                await client.list_models()
+            return error.exception.retry_after, server.get_statistics()
+
+        self.run_server(bad_key, api_key='other')
+        self.assertIn(self.run_server(failing, error_rate=1.0), (500, 503))
+        retry_after, stats = self.run_server(limited, rate_limit=3, retry_after=2.5)
+        self.assertEqual(retry_after, 2.5)
+        self.assertEqual(stats['responses'], {200: 3, 429: 1})
+
+    def test_streaming(self):
+        """Test streamed chat completions arrive as server-sent events."""
+        async def stream(client, server):
+            await client.start()
+            payload = {'model': 'deepseek-chat', 'messages': [], 'stream': True}
+            async with client._session.post(client.url('/v1/chat/completions'), json=payload) as response:
+                content_type = response.headers['Content-Type']
+                events = [line[6:] async for line in response.content if line.startswith(b'data: ')]
+            return content_type, events
+
+        content_type, events = self.run_server(stream, stream_chunks=4)
+
+        self.assertTrue(content_type.startswith('text/event-stream'))
+        self.assertEqual(len(events), 5)
+        self.assertEqual(events[-1].strip(), b'[DONE]')
+        content = ''.join(json.loads(e)['choices'][0]['delta']['content'] for e in events[:-1])
+        self.assertIn(json.loads(content)['action'], ('buy', 'hold', 'sell'))
+
+    def test_interfaces_in_thread(self):
+        """Test the sync interfaces against a server on its own thread."""
+        server = MockDeepSeekServer(MockConfig(latency=FAST, api_key='key'))
+        url = server.start_in_thread()
+        try:
+            with DeepSeekAPI('key', url) as api:
+                self.assertTrue(api.validate_api_key())
+                rl = api.get_rl_interface()
+                rl.initialize_model('deepseek-rl')
+                self.assertEqual(rl.train_agent({}, {'episodes': 5})['episodes'], 5)
+                distill = api.get_distill_interface()
+                distill.initialize_model('deepseek-chat')
+                self.assertEqual(distill.distill_model('deepseek-chat', {})['model'], 'deepseek-chat-distilled')
+        finally:
+            server.stop_in_thread()
+
+class TestBenchmark(unittest.TestCase):
+    """Test cases for the benchmark harness."""
+
+    def test_closed_loop(self):
+        """Test throughput and latency are reported per configuration."""
+        results = benchmark(
+            MockConfig(latency=LatencyModel('constant', mean=0.01), seed=0),
+            {'serial': ClientConfig(max_concurrency=1), 'parallel': ClientConfig(max_concurrency=16)},
+            n_requests=64, concurrency=16
+        )
+
+        for result in results.values():
+            self.assertEqual(result['succeeded'], 64)
+            self.assertEqual(result['server']['total'], 64)
+            self.assertGreaterEqual(result['latency_ms_p50'], 10.0)
+        self.assertGreater(results['parallel']['throughput'], 4 * results['serial']['throughput'])
+        self.assertIn('parallel', format_report(results))
+
+    def test_open_loop_with_errors(self):
+        """Test scheduled load counts failures by type."""
+        async def main():
+            server = MockDeepSeekServer(MockConfig(latency=FAST, error_rate=0.5, seed=1))
+            url = await server.start()
+            try:
+                async with AsyncDeepSeekClient('key', url) as client:
+                    return await run_load(client, evaluation_workload(4), n_requests=40, rate=400)
+            finally:
+                await server.stop()
+
+        report = asyncio.run(main())
+
+        self.assertEqual(report['succeeded'] + sum(report['errors'].values()), 40)
+        self.assertEqual(set(report['errors']), {'APIResponseError'})
+        self.assertGreaterEqual(report['elapsed'], 39 / 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+"""
+Unit tests for DeepSeek rate limiting, adaptive concurrency and retries.
+"""
+
+import time
+import asyncio
+import unittest
+from unittest.mock import patch
+from tradeAI.core.deepseek.client import AsyncDeepSeekClient, ClientConfig
+from tradeAI.core.deepseek.mock import LatencyModel, MockConfig, MockDeepSeekServer
+from tradeAI.core.deepseek.ratelimit import AIMDLimiter, RateLimiter, TokenBucket
+from tradeAI.core.exceptions import RateLimitError
+from tradeAI.utils.tools import backoff_delay, retry
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test a full bucket allows a burst and then refills at the rate."""
+        async def main():
+            bucket = TokenBucket(rate=100, capacity=5)
+            start = time.monotonic()
+            for _ in range(15):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(main())
+
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.3)
+
+    def test_pause(self):
+        """Test a paused bucket hands out nothing until the pause ends."""
+        async def main():
+            bucket = TokenBucket(rate=1000, capacity=10)
+            bucket.pause(0.1)
+            self.assertFalse(bucket.try_acquire())
+            return await bucket.acquire()
+
+        self.assertGreaterEqual(asyncio.run(main()), 0.09)
+
+class TestAIMDLimiter(unittest.TestCase):
+    """Test cases for AIMDLimiter."""
+
+    def test_additive_increase(self):
+        """Test successes raise the limit by about one per limit's worth."""
+        async def main():
+            limiter = AIMDLimiter(initial=4, latency_tolerance=None)
+            for _ in range(4):
+                started = await limiter.acquire()
+                await limiter.release(started, latency=0.01)
+            return limiter.limit
+
+        self.assertAlmostEqual(asyncio.run(main()), 5.0, delta=0.2)
+
+    def test_one_decrease_per_overload(self):
+        """Test concurrent throttled requests cut the limit once."""
+        async def main():
+            limiter = AIMDLimiter(initial=8, decrease=0.5)
+            starts = [await limiter.acquire() for _ in range(4)]
+            for started in starts:
+                await limiter.release(started, throttled=True)
+            after_burst = limiter.limit
+            started = await limiter.acquire()
+            await limiter.release(started, throttled=True)
+            return after_burst, limiter.limit, limiter.in_flight
+
+        after_burst, after_next, in_flight = asyncio.run(main())
+
+        self.assertEqual(after_burst, 4.0)
+        self.assertEqual(after_next, 2.0)
+        self.assertEqual(in_flight, 0)
+
+    def test_latency_congestion(self):
+        """Test latency well above the recent minimum decreases the limit."""
+        async def main():
+            limiter = AIMDLimiter(initial=10, latency_tolerance=2.0)
+            started = await limiter.acquire()
+            await limiter.release(started, latency=0.01)
+            limit = limiter.limit
+            started = await limiter.acquire()
+            await limiter.release(started, latency=0.05)
+            return limit, limiter.limit
+
+        before, after = asyncio.run(main())
+
+        self.assertLess(after, before)
+
+    def test_jitter_is_not_congestion(self):
+        """Test one unusually fast response does not turn jitter into decreases."""
+        async def main():
+            limiter = AIMDLimiter(initial=10, latency_tolerance=2.0)
+            latencies = [0.009, 0.011, 0.010, 0.012] * 5 + [0.004] + [0.009, 0.011, 0.010, 0.012] * 5
+            for latency in latencies:
+                started = await limiter.acquire()
+                await limiter.release(started, latency=latency)
+            return limiter.n_decreases
+
+        self.assertEqual(asyncio.run(main()), 0)
+
+    def test_limit_caps_concurrency(self):
+        """Test no more than the limit run at once."""
+        peak = 0
+
+        async def main():
+            nonlocal peak
+            limiter = AIMDLimiter(initial=3, max_limit=3, latency_tolerance=None)
+
+            async def task():
+                nonlocal peak
+                started = await limiter.acquire()
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+                await limiter.release(started, latency=0.01)
+
+            await asyncio.gather(*(task() for _ in range(12)))
+
+        asyncio.run(main())
+        self.assertEqual(peak, 3)
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+
+    def test_endpoint_buckets(self):
+        """Test endpoints resolve to buckets by longest prefix."""
+        limiter = RateLimiter({'/v1/rl': (10, 10), '/v1/rl/evaluate': (50, 50)})
+
+        self.assertEqual(limiter.bucket('/v1/rl/evaluate').rate, 50)
+        self.assertIs(limiter.bucket('/v1/rl/train'), limiter.bucket('/v1/rl/optimize'))
+        self.assertIsNone(limiter.bucket('/v1/models'))
+        self.assertEqual(RateLimiter(default_rate=(5, 1)).bucket('/v1/models').rate, 5)
+
+class TestClientLimits(unittest.TestCase):
+    """Test cases for the client against a rate-limited mock server."""
+
+    def run_load(self, n_requests, server_config, client_config, rate_limiter=None):
+        async def main():
+            server = MockDeepSeekServer(server_config)
+            url = await server.start()
+            try:
+                async with AsyncDeepSeekClient('key', url, client_config, rate_limiter=rate_limiter) as client:
+                    start = time.monotonic()
+                    results = await client.fan_out(lambda i: client.list_models(), range(n_requests))
+                    return results, time.monotonic() - start, client.get_statistics(), server.get_statistics()
+            finally:
+                await server.stop()
+        return asyncio.run(main())
+
+    def test_bucket_prevents_throttling(self):
+        """Test a bucket under the server's limit avoids 429s entirely."""
+        limiter = RateLimiter(default_rate=(30, 5))
+        results, _, _, server = self.run_load(
+            40, MockConfig(latency=LatencyModel('constant', mean=0.0), rate_limit=40), ClientConfig(), limiter
+        )
+
+        self.assertFalse(any(isinstance(r, Exception) for r in results))
+        self.assertNotIn(429, server['responses'])
+
+    def test_retry_after_is_honoured(self):
+        """Test throttled requests wait out Retry-After and then succeed."""
+        limiter = RateLimiter(default_rate=(1000, 1000))
+        results, elapsed, client, server = self.run_load(
+            8, MockConfig(latency=LatencyModel('constant', mean=0.0), rate_limit=5, retry_after=0.3),
+            ClientConfig(max_retries=6, retry_delay=0.1, max_retry_delay=0.5), limiter
+        )
+
+        self.assertFalse(any(isinstance(r, Exception) for r in results))
+        self.assertEqual(server['responses'][200], 8)
+        self.assertGreaterEqual(client['retries'], 3)
+        self.assertGreaterEqual(elapsed, 0.3)
+        stats = limiter.get_statistics()
+        self.assertGreaterEqual(stats['throttled'], 3)
+        self.assertGreaterEqual(stats['decreases'], 1)
+
+    def test_client_queueing_is_not_congestion(self):
+        """Test waiting on the client's own connection cap is not timed as latency."""
+        limiter = RateLimiter(concurrency=AIMDLimiter(initial=32))
+        results, _, _, _ = self.run_load(
+            24, MockConfig(latency=LatencyModel('constant', mean=0.02)), ClientConfig(max_concurrency=2), limiter
+        )
+
+        self.assertFalse(any(isinstance(r, Exception) for r in results))
+        self.assertEqual(limiter.get_statistics()['decreases'], 0)
+
+    def test_no_retries_by_default(self):
+        """Test 429s surface as RateLimitError without retries configured."""
+        results, _, client, _ = self.run_load(
+            4, MockConfig(latency=LatencyModel('constant', mean=0.0), rate_limit=2), ClientConfig()
+        )
+
+        self.assertEqual(sum(isinstance(r, RateLimitError) for r in results), 2)
+        self.assertEqual(client['retries'], 0)
+
+class TestRetry(unittest.TestCase):
+    """Test cases for the retry helpers."""
+
+    def test_backoff_delay(self):
+        """Test exponential growth, cap, jitter and Retry-After floor."""
+        self.assertEqual(backoff_delay(3, delay=1.0, backoff=2.0), 8.0)
+        self.assertEqual(backoff_delay(10, delay=1.0, backoff=2.0, max_delay=5.0), 5.0)
+        for _ in range(100):
+            self.assertLessEqual(backoff_delay(2, delay=1.0, jitter=True), 4.0)
+            self.assertGreaterEqual(backoff_delay(0, delay=0.1, jitter=True, retry_after=2.0), 2.0)
+        self.assertEqual(backoff_delay(5, delay=1.0, backoff=1.0), 1.0)
+
+    def test_retry_honours_retry_after(self):
+        """Test the decorator waits at least Retry-After between attempts."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0.0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RateLimitError('slow down', 429, retry_after=0.5)
+            return 'ok'
+
+        with patch('time.sleep') as sleep:
+            self.assertEqual(flaky(), 'ok')
+
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 0.5])
+
+    def test_retry_async(self):
+        """Test coroutine functions are retried and exception types filtered."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0.0, exceptions=(ValueError,))
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError('transient')
+            if len(calls) == 2:
+                raise KeyError('fatal')
+            return 'ok'
+
+        with self.assertRaises(KeyError):
+            asyncio.run(flaky())
+        self.assertEqual(len(calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
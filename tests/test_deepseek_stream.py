@@ -0,0 +1,142 @@
+"""
+Unit tests for streamed DeepSeek responses.
+"""
+
+import json
+import time
+import asyncio
+import unittest
+from tradeAI.core.deepseek.client import AsyncDeepSeekClient, iter_sse, parse_action
+from tradeAI.core.deepseek.mock import LatencyModel, MockConfig, MockDeepSeekServer
+from tradeAI.core.deepseek.ratelimit import RateLimiter
+from tradeAI.core.exceptions import APIKeyError
+
+MESSAGES = [{'role': 'user', 'content': 'BTC 1h bars: ...'}]
+
+async def collect(lines):
+    async def source():
+        for line in lines:
+            yield line
+    return [event async for event in iter_sse(source())]
+
+class TestParsing(unittest.TestCase):
+    """Test cases for SSE and decision parsing."""
+
+    def test_iter_sse(self):
+        """Test events, comments, multi-line data and the end marker."""
+        lines = [b': keep-alive\n', b'\n',
+                 b'event: chunk\n', b'data: {"a": 1}\n', b'\n',
+                 b'data: {"b":\n', b'data: 2}\r\n', b'\r\n',
+                 b'data: [DONE]\n', b'\n',
+                 b'data: {"ignored": true}\n', b'\n']
+
+        self.assertEqual(asyncio.run(collect(lines)), [{'a': 1}, {'b': 2}])
+
+    def test_iter_sse_without_trailing_blank_line(self):
+        """Test a final event not followed by a blank line is still delivered."""
+        self.assertEqual(asyncio.run(collect([b'data:{"a": 1}\n'])), [{'a': 1}])
+
+    def test_parse_action(self):
+        """Test actions are found in partial JSON."""
+        self.assertIsNone(parse_action('{"act'))
+        self.assertIsNone(parse_action('{"action": "bu'))
+        self.assertEqual(parse_action('{"action": "buy", "confid'), {'action': 'buy'})
+
+class TestChatStream(unittest.TestCase):
+    """Test cases for streamed chat completions against the mock server."""
+
+    def run_stream(self, func, rate_limiter=None, **config):
+        async def main():
+            server = MockDeepSeekServer(MockConfig(**{
+                'latency': LatencyModel('constant', mean=0.0), 'stream_chunks': 10,
+                'chunk_interval': 0.02, 'seed': 0, **config}))
+            url = await server.start()
+            try:
+                async with AsyncDeepSeekClient('key', url, rate_limiter=rate_limiter) as client:
+                    return await func(client)
+            finally:
+                await server.stop()
+        return asyncio.run(main())
+
+    def test_read_all(self):
+        """Test the full completion is accumulated from its chunks."""
+        async def read(client):
+            stream = client.stream_chat(MESSAGES)
+            return await stream.read_all(), stream
+
+        content, stream = self.run_stream(read)
+
+        self.assertIn(json.loads(content)['action'], ('buy', 'hold', 'sell'))
+        self.assertEqual(stream.n_chunks, 10)
+        self.assertEqual(stream.finish_reason, 'stop')
+        self.assertLess(stream.time_to_first_token, 0.1)
+
+    def test_decision_before_completion(self):
+        """Test a decision is made from partial output and the stream closed early."""
+        async def decide(client):
+            start = time.perf_counter()
+            await client.stream_chat(MESSAGES).read_all()
+            full = time.perf_counter() - start
+
+            stream = client.stream_chat(MESSAGES)
+            decision = await stream.read_until(parse_action)
+            return decision, stream, full, client.get_statistics()
+
+        decision, stream, full, stats = self.run_stream(decide)
+
+        self.assertIn(decision['action'], ('buy', 'hold', 'sell'))
+        self.assertLess(stream.n_chunks, 10)
+        self.assertIsNone(stream.finish_reason)
+        self.assertLess(stream.time_to_decision, full * 0.8)
+        self.assertLessEqual(stream.time_to_first_token, stream.time_to_decision)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertGreater(stats['decision_ms_mean'], 0.0)
+        self.assertGreater(stats['first_token_ms_mean'], 0.0)
+
+    def test_iterate_chunks(self):
+        """Test chunks can be consumed directly and the stream abandoned."""
+        async def iterate(client):
+            async with client.stream_chat(MESSAGES) as stream:
+                chunks = []
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    if len(chunks) == 3:
+                        break
+            return chunks, client.get_statistics()
+
+        chunks, stats = self.run_stream(iterate)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[0]['object'], 'chat.completion.chunk')
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_errors_and_rate_limiter(self):
+        """Test stream errors are mapped and streams hold limiter slots."""
+        async def bad_key(client):
+            with self.assertRaises(APIKeyError):
+                await client.stream_chat(MESSAGES).read_all()
+
+        self.run_stream(bad_key, api_key='other')
+
+        limiter = RateLimiter(default_rate=(100, 10))
+        self.run_stream(lambda client: client.stream_chat(MESSAGES).read_all(), rate_limiter=limiter)
+        stats = limiter.get_statistics()
+        self.assertEqual(stats['increases'], 1)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(len(limiter.concurrency.latencies), 0)
+        self.assertGreater(stats['stream_first_event_ms_mean'], 0.0)
+
+    def test_timing_starts_at_first_read(self):
+        """Test time before the stream is first read is not counted."""
+        async def delayed(client):
+            stream = client.stream_chat(MESSAGES)
+            await asyncio.sleep(0.2)
+            await stream.read_all()
+            return stream
+
+        stream = self.run_stream(delayed)
+
+        self.assertLess(stream.time_to_first_token, 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
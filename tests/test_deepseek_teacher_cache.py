@@ -0,0 +1,143 @@
+"""
+Unit tests for the memory-mapped teacher output cache.
+"""
+
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+from tradeAI.core.data.windows import WindowDataset
+from tradeAI.core.deepseek.distill import ArrayDataset, LocalDeepSeekDistill
+from tradeAI.core.deepseek.teacher_cache import (
+    TeacherOutputCache, TeacherOutputDataset, dataset_hash, teacher_hash
+)
+
+class CountingTeacher(nn.Module):
+    """Teacher that counts its forward passes."""
+
+    def __init__(self, input_dim, n_classes=3):
+        super().__init__()
+        torch.manual_seed(0)
+        self.body = nn.Sequential(nn.Flatten(), nn.Linear(input_dim, 64), nn.ReLU())
+        self.head = nn.Linear(64, n_classes)
+        self.calls = 0
+
+    def forward(self, x):
+        self.calls += 1
+        return self.head(self.body(x))
+
+class TestHashes(unittest.TestCase):
+    """Test cases for teacher and dataset hashes."""
+
+    def test_teacher_hash(self):
+        """Test the hash follows the weights, not the object."""
+        teacher = CountingTeacher(8)
+
+        self.assertEqual(teacher_hash(teacher), teacher_hash(CountingTeacher(8)))
+        with torch.no_grad():
+            teacher.head.bias[0] += 1e-6
+        self.assertNotEqual(teacher_hash(teacher), teacher_hash(CountingTeacher(8)))
+
+    def test_dataset_hash(self):
+        """Test the hash covers inputs and window layout but not labels."""
+        x = np.random.default_rng(0).standard_normal((100, 8)).astype(np.float32)
+        base = dataset_hash(ArrayDataset({'x': x, 'y': np.zeros(100)}))
+
+        self.assertEqual(base, dataset_hash(ArrayDataset({'x': x.copy(), 'y': np.ones(100)})))
+        self.assertNotEqual(base, dataset_hash(ArrayDataset({'x': x[:99]})))
+
+        bars = pd.DataFrame(x[:, :2], columns=['ret', 'vol'])
+        self.assertNotEqual(dataset_hash(WindowDataset(bars, window=4, features=['ret', 'vol'])),
+                            dataset_hash(WindowDataset(bars, window=5, features=['ret', 'vol'])))
+        bars['target'] = x[:, 2]
+        short, long = (WindowDataset(bars, window=4, features=['ret', 'vol'], target='target', horizon=h)
+                       for h in (1, 20))
+        self.assertNotEqual(len(short), len(long))
+        self.assertNotEqual(dataset_hash(short), dataset_hash(long))
+
+class TestTeacherOutputCache(unittest.TestCase):
+    """Test cases for TeacherOutputCache."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = TeacherOutputCache(self.directory, batch_size=256)
+        rng = np.random.default_rng(0)
+        self.x = rng.standard_normal((1000, 8)).astype(np.float32)
+        self.teacher = CountingTeacher(8).eval()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test stored logits and features match the teacher and are memory-mapped."""
+        dataset = ArrayDataset({'x': self.x})
+        outputs = self.cache.get_or_compute(self.teacher, dataset, feature_layer='body')
+        again = self.cache.get_or_compute(self.teacher, dataset, feature_layer='body')
+
+        with torch.no_grad():
+            x = torch.from_numpy(self.x)
+            np.testing.assert_allclose(outputs['logits'], self.teacher(x).numpy(), atol=1e-6)
+            np.testing.assert_allclose(outputs['features'], self.teacher.body(x).numpy(), atol=1e-6)
+        self.assertIsInstance(again['logits'], np.memmap)
+        self.assertEqual(again['features'].shape, (1000, 64))
+        stats = self.cache.get_statistics()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertGreater(stats['disk_bytes'], 1000 * 67 * 4)
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.cache.key(self.teacher, dataset, feature_layer='body')))
+
+    def test_output_dataset(self):
+        """Test batches carry the teacher outputs of their own rows."""
+        outputs = self.cache.get_or_compute(self.teacher, ArrayDataset({'x': self.x}))
+        dataset = TeacherOutputDataset(ArrayDataset({'x': self.x}), outputs)
+        indices = np.array([7, 3, 900, 3])
+
+        batch = dataset.gather(indices)
+
+        np.testing.assert_array_equal(batch['teacher_logits'], outputs['logits'][indices])
+        with self.assertRaises(ValueError):
+            TeacherOutputDataset(ArrayDataset({'x': self.x[:10]}), outputs)
+
+    def test_repeated_distillation_skips_teacher(self):
+        """Test later runs with other students never run the teacher."""
+        distiller = LocalDeepSeekDistill(teacher_cache=self.cache)
+        distiller.initialize_model('student', epochs=2, batch_size=128, seed=0)
+        config = {'train_data': {'x': self.x[:800]}, 'val_data': {'x': self.x[800:]}}
+
+        distiller.distill_model(self.teacher, {**config, 'hidden_sizes': (32,)})
+        first_calls = self.teacher.calls
+        self.teacher.calls = 0
+        for hidden_sizes in ((16,), (64, 32)):
+            distiller.distill_model(self.teacher, {**config, 'hidden_sizes': hidden_sizes})
+            self.assertIn('teacher_agreement', distiller.history[-1])
+
+        self.assertGreater(first_calls, 0)
+        self.assertEqual(self.teacher.calls, 0)
+        stats = self.cache.get_statistics()
+        self.assertEqual((stats['misses'], stats['hits']), (2, 4))
+
+        distiller.distill_model(self.teacher, {**config, 'feature_layer': 'body'})
+        key = self.cache.key(self.teacher, ArrayDataset({'x': self.x[:800]}), feature_layer='body')
+        self.assertEqual(self.cache.get(key)['features'].shape, (800, 64))
+
+    def test_empty_dataset(self):
+        """Test empty datasets are rejected before anything is written."""
+        with self.assertRaises(ValueError):
+            self.cache.get_or_compute(self.teacher, ArrayDataset({'x': self.x[:0]}))
+        self.assertEqual(self.cache.get_statistics()['disk_bytes'], 0)
+
+    def test_teacher_key(self):
+        """Test a known checkpoint hash is used instead of hashing the weights."""
+        dataset = ArrayDataset({'x': self.x})
+        key = self.cache.key(self.teacher, dataset, teacher_key='abc123')
+
+        self.assertTrue(key.startswith('abc123-'))
+        self.cache.get_or_compute(self.teacher, dataset, teacher_key='abc123')
+        self.assertIsNotNone(self.cache.get(key))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the ensemble runner.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.data.indicators import calculate_ema, calculate_macd, calculate_rsi_wilder
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.ensemble import EnsembleRunner, weighted_vote
+
+class ThresholdStrategy(BaseStrategy):
+    """Buys when a feature exceeds a threshold."""
+
+    def __init__(self, feature, threshold, spec=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.spec = spec
+
+    def get_required_features(self):
+        return {self.feature: self.spec} if self.spec else {}
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        action = 'buy' if state[self.feature] > self.threshold else 'sell'
+        return {'action': action, 'confidence': 0.5}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class NoConfidenceStrategy(ThresholdStrategy):
+    """Reports actions without a confidence."""
+
+    def predict(self, state):
+        return {'action': super().predict(state)['action']}
+
+class TruncatedStrategy(ThresholdStrategy):
+    """Returns fewer decisions than bars from predict_batch."""
+
+    def predict_batch(self, states, feature_names=None):
+        return {key: values[:-1] for key, values in super().predict_batch(states, feature_names).items()}
+
+class TestWeightedVote(unittest.TestCase):
+    """Test weighted voting."""
+
+    def test_weights(self):
+        """Test weight times confidence decides the action."""
+        decisions = {
+            'a': {'action': 'buy', 'confidence': 1.0},
+            'b': {'action': 'sell', 'confidence': 1.0},
+            'c': {'action': 'sell', 'confidence': 0.5}
+        }
+        self.assertEqual(weighted_vote(decisions, {'a': 1, 'b': 1, 'c': 1})['action'], 'sell')
+        combined = weighted_vote(decisions, {'a': 3, 'b': 1, 'c': 1})
+        self.assertEqual(combined['action'], 'buy')
+        self.assertAlmostEqual(combined['confidence'], 3 / 5)
+
+class TestEnsembleRunner(unittest.TestCase):
+    """Test shared features and concurrent dispatch."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(3)
+        close = 100 + rng.standard_normal(300).cumsum()
+        self.bars = pd.DataFrame({'close': close, 'volume': np.full(300, 10.0)})
+
+    def test_features_deduplicated(self):
+        """Test identical specs under different names are computed once."""
+        runner = EnsembleRunner()
+        runner.register('rsi_a', ThresholdStrategy('rsi', 50, (calculate_rsi_wilder, {'period': 14})))
+        runner.register('rsi_b', ThresholdStrategy('rsi_14', 60, (calculate_rsi_wilder, {'period': 14})))
+        runner.register('macd', ThresholdStrategy('m_macd', 0), features={'m': (calculate_macd, {})})
+        with self.assertRaises(ValueError):
+            runner.register('bad', ThresholdStrategy('rsi', 50, (calculate_ema, {'period': 5})))
+
+        features = runner.compute_features(self.bars)
+        np.testing.assert_array_equal(features['rsi'], features['rsi_14'])
+        self.assertIn('m_histogram', features)
+        stats = runner.get_statistics()
+        self.assertEqual(stats['n_features_requested'], 3)
+        self.assertEqual(stats['n_features_computed'], 2)
+        runner.close()
+
+    def test_threads_and_processes(self):
+        """Test thread and process members agree with direct predictions."""
+        spec = (calculate_ema, {'period': 10})
+        with EnsembleRunner(max_processes=2) as runner:
+            runner.register('fast', ThresholdStrategy('ema', 100, spec), weight=2.0)
+            runner.register('slow', ThresholdStrategy('ema', 95, spec), dispatch='process')
+            runner.register('other', ThresholdStrategy('close', 1e9), dispatch='process')
+
+            decision = runner.predict(self.bars)
+            ema = runner.compute_features(self.bars)['ema'].iloc[-1]
+            self.assertEqual(decision['members']['fast']['action'], 'buy' if ema > 100 else 'sell')
+            self.assertEqual(decision['members']['other']['action'], 'sell')
+            self.assertEqual(set(decision['members']), {'fast', 'slow', 'other'})
+
+            batch = runner.predict_batch(self.bars)
+            self.assertEqual(len(batch['ensemble']['action']), len(self.bars))
+            self.assertTrue((batch['members']['other']['action'] == 'sell').all())
+            self.assertEqual(batch['ensemble']['action'][-1], decision['action'])
+
+            stats = runner.get_statistics()
+            self.assertEqual(stats['members']['slow']['dispatch'], 'process')
+
+    def test_member_batch_lengths(self):
+        """Test members without confidence vote and short batches are dropped."""
+        with EnsembleRunner() as runner:
+            runner.register('plain', NoConfidenceStrategy('close', 0))
+            runner.register('short', TruncatedStrategy('close', 1e9), weight=10.0)
+            batch = runner.predict_batch(self.bars)
+
+        self.assertEqual(set(batch['members']), {'plain'})
+        np.testing.assert_array_equal(batch['members']['plain']['confidence'], np.ones(len(self.bars)))
+        self.assertTrue((batch['ensemble']['action'] == 'buy').all())
+
+if __name__ == '__main__':
+    unittest.main()
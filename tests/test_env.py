@@ -0,0 +1,123 @@
+"""
+Unit tests for the vectorized trading environment.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.strategy.base import RLStrategy
+from tradeAI.core.strategy.env import VectorizedTradingEnv
+
+class PriceChangeStrategy(RLStrategy):
+    """RL strategy with the per-row reward used by the examples."""
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        return {'action': 'hold', 'confidence': 1.0}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+    def get_action_space(self):
+        return {'type': 'discrete', 'size': 3, 'actions': ['buy', 'hold', 'sell']}
+
+    def get_state_space(self):
+        return {'type': 'continuous', 'shape': (2,), 'features': ['momentum', 'volatility']}
+
+    def get_reward(self, state, action):
+        change = state['next_price'] - state['price']
+        return {'buy': change, 'sell': -change, 'hold': 0.0}[action['action']]
+
+class VectorizedRewardStrategy(PriceChangeStrategy):
+    """Same reward computed with array arithmetic."""
+
+    def get_reward_batch(self, states, actions):
+        direction = np.select([actions == 'buy', actions == 'sell'], [1.0, -1.0], 0.0)
+        return direction * (states['next_price'] - states['price'])
+
+class TestVectorizedTradingEnv(unittest.TestCase):
+    """Test vectorized environment."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(12)
+        self.prices = 100 + rng.standard_normal(1000).cumsum()
+        self.features = pd.DataFrame({
+            'momentum': np.diff(self.prices, prepend=self.prices[0]),
+            'volatility': rng.uniform(0, 1, 1000)
+        })
+
+    def test_reset_and_step_shapes(self):
+        """Test batched observations and PnL accounting."""
+        env = VectorizedTradingEnv(self.prices, self.features, n_envs=8, episode_length=10,
+                                   fee_rate=0.001, seed=0)
+        obs = env.reset()
+        self.assertEqual(obs.shape, (8, 3))
+        np.testing.assert_array_equal(obs[:, 0], self.features['momentum'].to_numpy(dtype=np.float32)[env.t])
+
+        t = env.t.copy()
+        actions = np.full(8, 2)  # buy
+        obs, rewards, dones, info = env.step(actions)
+        expected = self.prices[t + 1] / self.prices[t] - 1 - 0.001
+        np.testing.assert_allclose(rewards, expected)
+        np.testing.assert_allclose(info['equity'], 1 + expected)
+        self.assertTrue((obs[:, -1] == 1.0).all())
+        self.assertFalse(dones.any())
+
+    def test_hold_keeps_position(self):
+        """Test hold keeps the previous target like the vectorized backtester."""
+        env = VectorizedTradingEnv(self.prices, self.features, n_envs=2, episode_length=10,
+                                   fee_rate=0.001, seed=4)
+        env.reset()
+        env.step(np.array([2, 0]))  # buy, sell
+        t = env.t.copy()
+        _, rewards, _, info = env.step(np.array([1, 1]))  # hold
+        np.testing.assert_array_equal(info['position'], [1.0, -1.0])
+        expected = np.array([1.0, -1.0]) * (self.prices[t + 1] / self.prices[t] - 1)
+        np.testing.assert_allclose(rewards, expected)
+
+    def test_unknown_action_rejected(self):
+        """Test action names without a target position raise instead of going flat."""
+        with self.assertRaises(ValueError):
+            VectorizedTradingEnv(self.prices, self.features, actions=['buy', 'hodl', 'sell'])
+        env = VectorizedTradingEnv(self.prices, self.features, actions=['buy', 'half'],
+                                   action_positions={'half': 0.5})
+        np.testing.assert_array_equal(env.positions_by_action, [1.0, 0.5])
+
+    def test_auto_reset(self):
+        """Test finished episodes restart automatically."""
+        env = VectorizedTradingEnv(self.prices, self.features, n_envs=4, episode_length=5, seed=1)
+        env.reset()
+        for _ in range(4):
+            _, _, dones, _ = env.step(np.ones(4, dtype=int))
+            self.assertFalse(dones.any())
+        obs, _, dones, info = env.step(np.zeros(4, dtype=int))
+        self.assertTrue(dones.all())
+        self.assertEqual(info['final_observation'].shape, (4, 3))
+        self.assertTrue((obs[:, -1] == 0).all())
+        np.testing.assert_array_equal(env.t, env.start)
+
+    def test_strategy_reward_hooks(self):
+        """Test default and vectorized get_reward_batch agree."""
+        looped = VectorizedTradingEnv(self.prices, self.features, n_envs=16, episode_length=50,
+                                      strategy=PriceChangeStrategy(), seed=2)
+        batched = VectorizedTradingEnv(self.prices, self.features, n_envs=16, episode_length=50,
+                                       strategy=VectorizedRewardStrategy(), seed=2)
+        self.assertEqual(list(looped.actions), ['buy', 'hold', 'sell'])
+        looped.reset()
+        batched.reset()
+
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            actions = rng.integers(0, 3, 16)
+            _, r1, _, _ = looped.step(actions)
+            _, r2, _, _ = batched.step(actions)
+            np.testing.assert_allclose(r1, r2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for technical indicators.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.data.indicators import (
+    iir_ema,
+    iir_rma,
+    iir_dema,
+    iir_tema,
+    iir_macd,
+    iir_rsi,
+    iir_atr,
+    calculate_ema,
+    calculate_macd,
+    calculate_rsi_wilder,
+    calculate_atr_wilder
+)
+
+def _reference_rma(values, period):
+    """Loop implementation of Wilder smoothing."""
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    start = valid[0]
+    out[start + period - 1] = np.mean(values[start:start + period])
+    for i in range(start + period, len(values)):
+        out[i] = (out[i - 1] * (period - 1) + values[i]) / period
+    return out
+
+class TestIIRIndicators(unittest.TestCase):
+    """Test recursive-filter indicator kernels."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(42)
+        close = 100 + rng.standard_normal(500).cumsum()
+        self.data = pd.DataFrame({
+            'high': close + rng.uniform(0, 1, 500),
+            'low': close - rng.uniform(0, 1, 500),
+            'close': close
+        })
+
+    def test_ema_matches_pandas(self):
+        """Test EMA against pandas ewm."""
+        expected = self.data['close'].ewm(span=20, adjust=False).mean()
+        np.testing.assert_allclose(iir_ema(self.data['close'].to_numpy(), 20), expected)
+        pd.testing.assert_series_equal(calculate_ema(self.data, 20), expected)
+
+    def test_interior_nans_match_pandas(self):
+        """Test gaps carry the filter state like ewm(adjust=False)."""
+        close = pd.Series([1, 2, np.nan, 4, 5, 6, 7.0])
+        np.testing.assert_allclose(iir_ema(close.to_numpy(), 3), close.ewm(span=3, adjust=False).mean())
+
+        panel = self.data[['high', 'low', 'close']].copy()
+        panel.iloc[[40, 41, 42, 200], 0] = np.nan
+        panel.iloc[:3, 1] = np.nan
+        panel.iloc[-2:, 2] = np.nan
+        np.testing.assert_allclose(iir_ema(panel.to_numpy(), 20), panel.ewm(span=20, adjust=False).mean())
+        macd, _, _ = iir_macd(panel['high'].to_numpy())
+        self.assertFalse(np.isnan(macd[1:]).any())
+
+        rma = iir_rma(panel['high'].to_numpy(), 14)
+        self.assertFalse(np.isnan(rma[13:]).any())
+        np.testing.assert_allclose(rma[:40], _reference_rma(panel['high'].to_numpy()[:40], 14))
+
+    def test_rma_matches_loop(self):
+        """Test Wilder smoothing against a loop reference."""
+        values = self.data['close'].to_numpy()
+        np.testing.assert_allclose(iir_rma(values, 14), _reference_rma(values, 14))
+
+    def test_multi_column(self):
+        """Test 2-D inputs are filtered column by column."""
+        panel = self.data[['high', 'low', 'close']].to_numpy(copy=True)
+        panel[:5, 1] = np.nan
+        result = iir_rma(panel, 10)
+        for col in range(panel.shape[1]):
+            np.testing.assert_allclose(result[:, col], _reference_rma(panel[:, col], 10))
+
+        dema = iir_dema(panel, 10)
+        tema = iir_tema(panel, 10)
+        self.assertEqual(dema.shape, panel.shape)
+        self.assertEqual(tema.shape, panel.shape)
+        np.testing.assert_allclose(tema[:, 2], iir_tema(panel[:, 2], 10))
+
+    def test_macd(self):
+        """Test MACD signal line."""
+        close = self.data['close']
+        macd, signal, hist = iir_macd(close.to_numpy())
+        expected = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+        np.testing.assert_allclose(macd, expected)
+        np.testing.assert_allclose(signal, expected.ewm(span=9, adjust=False).mean())
+        np.testing.assert_allclose(hist, macd - signal)
+        self.assertListEqual(list(calculate_macd(self.data).columns), ['macd', 'signal', 'histogram'])
+
+    def test_rsi_wilder(self):
+        """Test Wilder RSI."""
+        close = self.data['close'].to_numpy()
+        delta = np.diff(close, prepend=np.nan)
+        gain = _reference_rma(np.clip(delta, 0, None), 14)
+        loss = _reference_rma(np.clip(-delta, 0, None), 14)
+        expected = 100 - 100 / (1 + gain / loss)
+
+        rsi = calculate_rsi_wilder(self.data, 14)
+        np.testing.assert_allclose(rsi, expected)
+        self.assertTrue(np.isnan(rsi.iloc[13]))
+        self.assertFalse(np.isnan(rsi.iloc[14]))
+
+        rising = np.arange(50, dtype=float)
+        self.assertEqual(iir_rsi(rising, 14)[-1], 100.0)
+        flat = np.full(50, 10.0)
+        self.assertTrue((iir_rsi(flat, 14)[14:] == 50.0).all())
+
+    def test_atr_wilder(self):
+        """Test Wilder ATR."""
+        high, low, close = (self.data[c] for c in ['high', 'low', 'close'])
+        tr = pd.concat([
+            high - low,
+            (high - close.shift()).abs(),
+            (low - close.shift()).abs()
+        ], axis=1).max(axis=1)
+        expected = _reference_rma(tr.to_numpy(), 14)
+
+        np.testing.assert_allclose(calculate_atr_wilder(self.data, 14), expected)
+        np.testing.assert_allclose(iir_atr(high, low, close, 14), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Unit tests for the matching engine and event-driven backtester.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.backtest.matching import MatchingEngine, Order, OrderStatus, Side
+from tradeAI.core.backtest.event import EventBacktestConfig, EventBacktester, bars_to_events
+
+class TestMatchingEngine(unittest.TestCase):
+    """Test price-time priority matching."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = MatchingEngine()
+        self.engine.on_trade(100.0, 10, 0)
+
+    def test_market_order_fills_at_last_price(self):
+        """Test taker fills with slippage and fees."""
+        engine = MatchingEngine(fee_rate=0.001, slippage_bps=10)
+        engine.on_trade(100.0, 10, 0)
+        fill, = engine.submit(Order(Side.BUY, 2))
+        self.assertAlmostEqual(fill.price, 100.1)
+        self.assertAlmostEqual(fill.fee, 100.1 * 2 * 0.001)
+        self.assertEqual(fill.liquidity, 'taker')
+
+    def test_price_time_priority(self):
+        """Test better prices fill first, then earlier orders."""
+        first = Order(Side.BUY, 1, 99.0)
+        second = Order(Side.BUY, 1, 99.0)
+        better = Order(Side.BUY, 1, 99.5)
+        for order in (first, second, better):
+            self.assertEqual(self.engine.submit(order), [])
+
+        fills = self.engine.on_trade(99.0, 2, 1)
+        self.assertEqual([f.order_id for f in fills], [better.order_id, first.order_id])
+        self.assertEqual(fills[0].price, 99.5)
+        self.assertEqual(second.status, OrderStatus.OPEN)
+        self.assertEqual(self.engine.bid_trigger, 99.0)
+
+    def test_partial_fills_and_queue(self):
+        """Test queue position and partial fills at the touch."""
+        order = Order(Side.SELL, 5, 101.0)
+        self.engine.submit(order, queue_ahead=3)
+
+        self.assertEqual(self.engine.on_trade(101.0, 2, 1), [])
+        self.assertEqual(order.queue_ahead, 1)
+        fill, = self.engine.on_trade(101.0, 3, 2)
+        self.assertEqual(fill.quantity, 2)
+        self.assertEqual(order.status, OrderStatus.PARTIAL)
+        fill, = self.engine.on_trade(102.0, 10, 3)
+        self.assertEqual(fill.quantity, 3)
+        self.assertEqual(order.status, OrderStatus.FILLED)
+        self.assertEqual(len(self.engine.book), 0)
+        self.assertEqual(self.engine.ask_trigger, float('inf'))
+
+    def test_cancel(self):
+        """Test cancelled orders never fill."""
+        order = Order(Side.BUY, 1, 99.0)
+        self.engine.submit(order)
+        self.assertTrue(self.engine.cancel(order.order_id))
+        self.assertFalse(self.engine.cancel(order.order_id))
+        self.assertEqual(self.engine.on_trade(98.0, 10, 1), [])
+        self.assertEqual(order.status, OrderStatus.CANCELLED)
+
+class AlternatingStrategy(BaseStrategy):
+    """Alternates between long and short on each bar."""
+
+    def __init__(self, limit_offset=None):
+        self.limit_offset = limit_offset
+        self.fills = []
+        self.bars = 0
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        self.bars += 1
+        decision = {'action': 'buy' if self.bars % 2 else 'sell'}
+        if self.limit_offset is not None:
+            sign = -1 if decision['action'] == 'buy' else 1
+            decision['limit_price'] = state['price'] + sign * self.limit_offset
+        return decision
+
+    def on_fill(self, fill):
+        self.fills.append(fill)
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestEventBacktester(unittest.TestCase):
+    """Test event-driven backtester."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(8)
+        close = 100 + rng.standard_normal(200).cumsum()
+        open_ = np.concatenate([[100], close[:-1]])
+        self.bars = pd.DataFrame({
+            'open': open_,
+            'high': np.maximum(open_, close) + 0.5,
+            'low': np.minimum(open_, close) - 0.5,
+            'close': close,
+            'volume': np.full(200, 100.0)
+        })
+
+    def test_bar_events(self):
+        """Test bar expansion order."""
+        events = bars_to_events(self.bars.iloc[:1])
+        bar = self.bars.iloc[0]
+        low_first = bar['close'] >= bar['open']
+        expected_second = bar['low'] if low_first else bar['high']
+        self.assertEqual(events['price'][1], expected_second)
+        self.assertEqual(events['price'][3], bar['close'])
+
+    def test_market_orders(self):
+        """Test position and cash accounting with market orders."""
+        strategy = AlternatingStrategy()
+        cfg = EventBacktestConfig(fee_rate=0, slippage_bps=0)
+        result = EventBacktester(strategy, cfg).run(self.bars)
+
+        self.assertEqual(len(result.equity), len(self.bars))
+        np.testing.assert_array_equal(result.positions, np.where(np.arange(200) % 2, -1.0, 1.0))
+        self.assertEqual(len(strategy.fills), 200)
+        pnl = sum(-f.side.value * f.quantity * f.price for f in strategy.fills)
+        expected = cfg.initial_capital + pnl + result.positions[-1] * self.bars['close'].iloc[-1]
+        self.assertAlmostEqual(result.equity[-1], expected)
+
+    def test_dict_bars_and_config_checks(self):
+        """Test dict-of-array bars match DataFrame bars and decision_every is validated."""
+        cfg = EventBacktestConfig(fee_rate=0, slippage_bps=0)
+        frame = EventBacktester(AlternatingStrategy(), cfg).run(self.bars)
+        arrays = {name: self.bars[name].to_numpy() for name in self.bars.columns}
+        result = EventBacktester(AlternatingStrategy(), cfg).run(arrays)
+
+        np.testing.assert_allclose(result.equity, frame.equity)
+        np.testing.assert_array_equal(result.positions, frame.positions)
+        for every in (0, -1):
+            with self.assertRaises(ValueError):
+                EventBacktestConfig(decision_every=every)
+
+    def test_limit_orders_and_report(self):
+        """Test resting limit orders and the profiling report."""
+        strategy = AlternatingStrategy(limit_offset=0.25)
+        cfg = EventBacktestConfig(profile=True)
+        result = EventBacktester(strategy, cfg).run(self.bars)
+
+        self.assertTrue(all(f.liquidity == 'maker' for f in result.fills))
+        self.assertGreater(result.report['n_matching_events'], 0)
+        self.assertIn('matching', result.report['timings'])
+        self.assertIn('cumulative', result.report['profile'])
+
+    def test_order_ids_and_cancel(self):
+        """Test strategies learn their order ids and can cancel by id."""
+        class Canceller(AlternatingStrategy):
+            def __init__(self):
+                super().__init__()
+                self.orders, self.states = [], []
+
+            def predict(self, state):
+                self.states.append(state)
+                if len(self.states) == 1:
+                    return {'orders': [{'side': 'buy', 'quantity': 1, 'price': 1.0}]}
+                if len(self.states) == 2:
+                    return {'cancel': state['open_orders']}
+                return {'action': 'hold'}
+
+            def on_order(self, order):
+                self.orders.append(order)
+
+        strategy = Canceller()
+        features = pd.DataFrame({'signal': np.arange(200.0),
+                                 'timestamp': pd.date_range('2024-01-01', periods=200, freq='h')})
+        EventBacktester(strategy).run(self.bars.iloc[:5], features=features.iloc[:5])
+
+        order_id = strategy.orders[0].order_id
+        self.assertIsNotNone(order_id)
+        self.assertEqual(strategy.states[1]['open_orders'], [order_id])
+        self.assertEqual(strategy.states[2]['open_orders'], [])
+        self.assertEqual(strategy.orders[0].status, OrderStatus.CANCELLED)
+        self.assertEqual(strategy.states[3]['signal'], 3.0)
+        self.assertEqual(strategy.states[3]['timestamp'], pd.Timestamp('2024-01-01 03:00'))
+        self.assertEqual(strategy.states[3]['close'], self.bars['close'].iloc[3])
+
+    def test_tick_throughput(self):
+        """Test idle ticks skip matching work."""
+        n = 1_000_000
+        ticks = {
+            'price': 100 + np.random.default_rng(9).standard_normal(n).cumsum() * 0.01,
+            'volume': np.ones(n)
+        }
+
+        class Idle(AlternatingStrategy):
+            def predict(self, state):
+                return {'action': 'hold'}
+
+        cfg = EventBacktestConfig(decision_every=1000)
+        result = EventBacktester(Idle(), cfg).run(ticks, bars=False)
+        self.assertEqual(result.report['n_events'], n)
+        self.assertEqual(result.report['n_decisions'], n // 1000)
+        self.assertEqual(result.report['n_matching_events'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for online incremental training.
+"""
+
+import os
+import time
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.data.stream import MarketDataStream
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.checkpoint import load_checkpoint
+from tradeAI.core.strategy.online import OnlineTrainer
+
+class MeanReversionStrategy(BaseStrategy):
+    """Tracks a running mean price with partial_fit."""
+
+    def __init__(self):
+        self.mean = np.zeros(1)
+        self.count = 0
+
+    def train(self, data, **kwargs):
+        self.count = 0
+        self.partial_fit(data)
+
+    def partial_fit(self, data, **kwargs):
+        close = data['bars']['close'].to_numpy()
+        total = self.mean[0] * self.count + close.sum()
+        self.count += len(close)
+        time.sleep(0.002)
+        self.mean = np.array([total / self.count])
+
+    def predict(self, state):
+        return {'action': 'buy' if state['close'] < self.mean[0] else 'sell', 'confidence': 1.0}
+
+    def get_parameters(self):
+        return {'mean': self.mean}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestOnlineTrainer(unittest.TestCase):
+    """Test background partial_fit and atomic publishing."""
+
+    def test_synchronous_updates(self):
+        """Test mini-batching and publishing without a worker."""
+        trainer = OnlineTrainer(MeanReversionStrategy(), batch_size=4, publish_every=2)
+        original = trainer.strategy
+        for price in [10.0, 12.0, 14.0, 16.0, 18.0]:
+            trainer.feed({'close': price})
+        self.assertEqual(trainer.get_statistics()['pending_batches'], 1)
+        self.assertEqual(trainer.get_statistics()['buffered_rows'], 1)
+
+        trainer.update(trainer._pending.get_nowait())
+        self.assertIs(trainer.strategy, original)
+        trainer.update(pd.DataFrame({'close': [20.0, 20.0, 20.0, 20.0]}))
+        self.assertIsNot(trainer.strategy, original)
+        self.assertAlmostEqual(trainer.strategy.mean[0], 16.5)
+        self.assertEqual(original.mean[0], 0.0)
+        self.assertEqual(trainer.predict({'close': 16.0})['action'], 'buy')
+
+    def test_drops_oldest_when_behind(self):
+        """Test feeding never blocks and drops stale batches."""
+        trainer = OnlineTrainer(MeanReversionStrategy(), batch_size=2, max_pending=2)
+        trainer.feed(pd.DataFrame({'close': np.arange(10.0)}))
+        stats = trainer.get_statistics()
+        self.assertEqual(stats['pending_batches'], 2)
+        self.assertEqual(stats['dropped_batches'], 3)
+        self.assertEqual(trainer._pending.get_nowait()['close'].iloc[0], 6.0)
+
+    def test_stream_worker(self):
+        """Test training from stream output in the background."""
+        stream = MarketDataStream()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'online.ckpt')
+            trainer = OnlineTrainer(MeanReversionStrategy(), batch_size=10, max_cpu_share=0.25,
+                                    max_pending=100, checkpoint_path=path)
+            trainer.attach(stream)
+            trainer.start()
+            for price in np.linspace(100, 110, 50):
+                stream._emit_data({'close': price})
+            deadline = time.time() + 5
+            while trainer.n_updates < 5 and time.time() < deadline:
+                time.sleep(0.01)
+            trainer.stop()
+
+            stats = trainer.get_statistics()
+            self.assertEqual(stats['n_samples'], 50)
+            self.assertEqual(stats['version'], 5)
+            self.assertLessEqual(stats['cpu_share'], 0.3)
+            self.assertAlmostEqual(trainer.strategy.mean[0], 105.0)
+            checkpoint = load_checkpoint(path)
+            self.assertEqual(checkpoint.metadata['version'], 5)
+            self.assertAlmostEqual(float(checkpoint.tensors['mean'][0]), 105.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for precision policy and memory-lean dtypes.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.data.precision import (
+    PrecisionPolicy,
+    get_precision,
+    precision,
+    optimize_dtypes,
+    memory_report
+)
+from tradeAI.core.data.stream import DataPipeline
+from tradeAI.core.data.indicators import (
+    iir_ema,
+    iir_rsi,
+    calculate_ma,
+    calculate_macd,
+    calculate_rsi_wilder
+)
+
+class TestPrecisionPolicy(unittest.TestCase):
+    """Test precision policy."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(7)
+        n_days, symbols = 3 * 252, ['AAA', 'BBB', 'CCC', 'DDD']
+        close = 100 + rng.standard_normal((n_days, len(symbols))).cumsum(axis=0)
+        self.panel = pd.DataFrame({
+            'symbol': np.repeat(symbols, n_days).astype(object),
+            'timestamp': np.tile(pd.date_range('2021-01-01', periods=n_days, freq='D'), len(symbols)),
+            'open': close.T.ravel(),
+            'high': close.T.ravel() + 1,
+            'low': close.T.ravel() - 1,
+            'close': close.T.ravel(),
+            'volume': rng.integers(0, 5_000_000, n_days * len(symbols)).astype(float),
+            'trades': rng.integers(0, 10_000, n_days * len(symbols))
+        })
+
+    def test_context_manager(self):
+        """Test switching and restoring the policy."""
+        self.assertEqual(get_precision().float_dtype, 'float64')
+        with precision('float32') as policy:
+            self.assertEqual(policy.dtype, np.float32)
+            self.assertEqual(calculate_ma(self.panel, 5).dtype, np.float32)
+            self.assertEqual(calculate_macd(self.panel)['signal'].dtype, np.float32)
+        self.assertEqual(get_precision().float_dtype, 'float64')
+        with self.assertRaises(ValueError):
+            PrecisionPolicy(float_dtype='float16')
+
+    def test_float32_error_bounds(self):
+        """Test float32 kernels stay within documented error bounds."""
+        close = self.panel['close'].to_numpy()
+        reference = iir_ema(close, 100)
+        rsi_reference = iir_rsi(close, 14)
+        with precision('float32'):
+            single = iir_ema(close, 100)
+            rsi_single = calculate_rsi_wilder(self.panel, 14)
+        self.assertEqual(single.dtype, np.float32)
+        np.testing.assert_allclose(single, reference, rtol=1e-5)
+        np.testing.assert_allclose(rsi_single, rsi_reference, atol=1e-3)
+
+    def test_optimize_dtypes(self):
+        """Test memory-lean dtype conversion."""
+        with precision('float32'):
+            optimized = optimize_dtypes(self.panel)
+        self.assertIsInstance(optimized['symbol'].dtype, pd.CategoricalDtype)
+        self.assertEqual(optimized['close'].dtype, np.float32)
+        self.assertEqual(optimized['volume'].dtype, np.uint32)
+        self.assertEqual(optimized['trades'].dtype, np.uint16)
+        np.testing.assert_array_equal(optimized['volume'], self.panel['volume'])
+
+        raw = memory_report(self.panel)['total_bytes']
+        lean = memory_report(optimized)['total_bytes']
+        self.assertLess(lean, raw / 2)
+
+    def test_pipeline(self):
+        """Test pipeline respects precision policy."""
+        pipeline = DataPipeline(precision=PrecisionPolicy(float_dtype='float32'), optimize_memory=True)
+        pipeline.add_step(lambda df: df.assign(spread=df['high'] - df['low'],
+                                               notional=df['volume'] * 1000,
+                                               trade_change=df['trades'] - 20_000))
+        result = pipeline.process(self.panel)
+        self.assertEqual(result['spread'].dtype, np.float32)
+        self.assertEqual(result['volume'].dtype, np.int64)
+        np.testing.assert_array_equal(result['notional'], self.panel['volume'].to_numpy() * 1000)
+        self.assertEqual(result['trades'].dtype, np.int32)
+        self.assertTrue((result['trade_change'] < 0).all())
+        self.assertGreater(pipeline.memory_report(self.panel)['reduction'], 0.5)
+
+        untouched = DataPipeline().process(self.panel)
+        pd.testing.assert_frame_equal(untouched, self.panel)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the prediction cache.
+"""
+
+import unittest
+import time
+import numpy as np
+import pandas as pd
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.cache import PredictionCache, CachedStrategy
+
+class CountingStrategy(BaseStrategy):
+    """Strategy counting model invocations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        self.calls += 1
+        return {'action': 'buy' if state['price'] > state['ma'] else 'sell', 'confidence': 0.7}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+    def get_state_space(self):
+        return {'features': ['price', 'ma']}
+
+class TestPredictionCache(unittest.TestCase):
+    """Test prediction cache."""
+
+    def test_quantized_keys(self):
+        """Test states within tolerance share a key."""
+        cache = PredictionCache(tolerances={'price': 0.01})
+        self.assertEqual(
+            cache.make_key({'price': 100.001, 'ma': 99.0}),
+            cache.make_key({'ma': 99.0, 'price': 100.003})
+        )
+        self.assertNotEqual(
+            cache.make_key({'price': 100.00, 'ma': 99.0}),
+            cache.make_key({'price': 100.05, 'ma': 99.0})
+        )
+        self.assertNotEqual(
+            cache.make_key({'price': 100.0, 'ma': 99.0}),
+            cache.make_key({'price': 100.0, 'ma': 99.0000001})
+        )
+
+    def test_lru_and_ttl(self):
+        """Test size cap eviction and expiry."""
+        cache = PredictionCache(max_size=2, ttl=0.05)
+        cache.put('a', {'action': 'buy'})
+        cache.put('b', {'action': 'sell'})
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('c', {'action': 'hold'})
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get('c'))
+
+        stats = cache.get_statistics()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 0.5)
+
+    def test_cached_strategy_skips_model(self):
+        """Test cache hits skip inference."""
+        inner = CountingStrategy()
+        strategy = CachedStrategy(inner, tolerances={'price': 0.1, 'ma': 0.1})
+
+        first = strategy.predict({'price': 101.0, 'ma': 100.0})
+        second = strategy.predict({'price': 101.02, 'ma': 100.01})
+        self.assertEqual(first, second)
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(strategy.get_state_space(), inner.get_state_space())
+
+        strategy.train({})
+        strategy.predict({'price': 101.0, 'ma': 100.0})
+        self.assertEqual(inner.calls, 2)
+
+    def test_cached_predict_batch(self):
+        """Test batch lookups only run misses through the model."""
+        inner = CountingStrategy()
+        strategy = CachedStrategy(inner, default_tolerance=0.5)
+        states = pd.DataFrame({'price': [101.0, 99.0, 101.1, 99.1], 'ma': [100.0] * 4})
+
+        batch = strategy.predict_batch(states)
+        np.testing.assert_array_equal(batch['action'], ['buy', 'sell', 'buy', 'sell'])
+        self.assertEqual(inner.calls, 2)
+
+        strategy.predict_batch(states.to_numpy())
+        self.assertEqual(inner.calls, 2)
+        self.assertEqual(strategy.cache.get_statistics()['hits'], 4)
+
+if __name__ == '__main__':
+    unittest.main()
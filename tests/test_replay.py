@@ -0,0 +1,105 @@
+"""
+Unit tests for the replay buffers.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+import numpy as np
+from tradeAI.core.strategy.replay import PrioritizedReplayBuffer, ReplayBuffer, SumTree
+
+class TestSumTree(unittest.TestCase):
+    """Test sum tree updates and lookups."""
+
+    def test_update_and_find(self):
+        """Test totals and prefix-sum lookups."""
+        tree = SumTree(5)
+        tree.update(np.arange(5), np.array([1.0, 2.0, 3.0, 4.0, 0.0]))
+        self.assertEqual(tree.total, 10.0)
+        np.testing.assert_array_equal(tree.find([0.0, 0.99, 1.0, 2.5, 5.9, 9.99]), [0, 0, 1, 1, 2, 3])
+
+        tree.update([3, 3], [1.0, 1.0])
+        self.assertEqual(tree.total, 7.0)
+
+class TestReplayBuffer(unittest.TestCase):
+    """Test array-backed replay buffers."""
+
+    def _fill(self, buffer, n, offset=0):
+        states = np.arange(offset, offset + n, dtype=np.float32)[:, None].repeat(3, axis=1)
+        return buffer.add_batch(states, np.arange(n) % 3, np.ones(n), states + 1, np.zeros(n, dtype=bool))
+
+    def test_circular_writes(self):
+        """Test wraparound and sampling shapes."""
+        buffer = ReplayBuffer(10, (3,), seed=0)
+        self._fill(buffer, 8)
+        indices = self._fill(buffer, 5, offset=8)
+        np.testing.assert_array_equal(indices, [8, 9, 0, 1, 2])
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(buffer.states[0, 0], 10)
+
+        batch = buffer.sample(32)
+        self.assertEqual(batch['states'].shape, (32, 3))
+        self.assertEqual(batch['states'].dtype, np.float32)
+        np.testing.assert_array_equal(batch['next_states'], batch['states'] + 1)
+
+        buffer.add(np.zeros(3), 1, 0.5, np.ones(3), True)
+        self.assertTrue(buffer.dones[3])
+
+    def test_memmap_reopen(self):
+        """Test memory-mapped storage survives reopening."""
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = ReplayBuffer(16, (3,), storage_dir=tmp)
+            self._fill(buffer, 6)
+            buffer.flush()
+            del buffer
+
+            reopened = ReplayBuffer(16, (3,), storage_dir=tmp)
+            self.assertEqual(len(reopened), 6)
+            self.assertIsInstance(reopened.states, np.memmap)
+            self.assertEqual(reopened.states[5, 0], 5)
+
+            mismatched = ReplayBuffer(16, (4,), storage_dir=tmp)
+            self.assertEqual(len(mismatched), 0)
+            self.assertEqual(mismatched.states.shape, (16, 4))
+
+    def test_prioritized_reopen(self):
+        """Test priorities survive reopening, or are rebuilt when missing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            buffer = PrioritizedReplayBuffer(16, (3,), alpha=1.0, storage_dir=tmp, seed=0)
+            self._fill(buffer, 6)
+            buffer.update_priorities(np.arange(6), [0.0, 0.0, 5.0, 0.0, 0.0, 0.0])
+            buffer.flush()
+            total = buffer.tree.total
+            del buffer
+
+            reopened = PrioritizedReplayBuffer(16, (3,), alpha=1.0, storage_dir=tmp, seed=0)
+            self.assertAlmostEqual(reopened.tree.total, total)
+            self.assertAlmostEqual(reopened.max_priority, 5.0, places=4)
+            batch = reopened.sample(32)
+            self.assertFalse(np.isnan(batch['weights']).any())
+            self.assertGreater(np.mean(batch['indices'] == 2), 0.5)
+
+            (Path(tmp) / 'priorities.npy').unlink()
+            rebuilt = PrioritizedReplayBuffer(16, (3,), alpha=1.0, storage_dir=tmp, seed=0)
+            np.testing.assert_allclose(rebuilt.tree.get(np.arange(16)), [rebuilt.max_priority] * 6 + [0.0] * 10)
+            self.assertEqual(len(np.unique(rebuilt.sample(32)['indices'])), 6)
+
+    def test_prioritized_sampling(self):
+        """Test high-priority transitions dominate and weights are normalized."""
+        buffer = PrioritizedReplayBuffer(100, (3,), alpha=1.0, beta=1.0, seed=1)
+        self._fill(buffer, 100)
+        priorities = np.full(100, 0.01)
+        priorities[7] = 100.0
+        buffer.update_priorities(np.arange(100), priorities)
+
+        batch = buffer.sample(64)
+        self.assertGreater(np.mean(batch['indices'] == 7), 0.9)
+        self.assertAlmostEqual(batch['weights'].max(), 1.0)
+        self.assertLess(batch['weights'][batch['indices'] == 7].max(), 1.0)
+
+        # New transitions enter at the maximum priority
+        index, = self._fill(buffer, 1)
+        self.assertAlmostEqual(buffer.tree.get([index])[0], buffer.max_priority)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for shadow-mode strategy evaluation.
+"""
+
+import time
+import unittest
+from tradeAI.core.data.stream import MarketDataStream
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.shadow import ShadowRunner
+
+class ThresholdStrategy(BaseStrategy):
+    """Buys below a price threshold, optionally slowly."""
+
+    def __init__(self, threshold, delay=0.0):
+        self.threshold = threshold
+        self.delay = delay
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        if self.delay:
+            time.sleep(self.delay)
+        if state['price'] < 0:
+            raise ValueError("negative price")
+        return {'action': 'buy' if state['price'] < self.threshold else 'sell', 'confidence': 1.0}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestShadowRunner(unittest.TestCase):
+    """Test mirroring, decisions and agreement."""
+
+    def test_decisions_and_agreement(self):
+        """Test candidates record would-be decisions compared to the primary."""
+        primary = ThresholdStrategy(100)
+        stream = MarketDataStream()
+        with ShadowRunner({'same': ThresholdStrategy(100), 'other': ThresholdStrategy(95)}) as shadow:
+            shadow.attach(stream)
+            for price in range(90, 110):
+                seq = shadow.mirror({'price': float(price)})
+                shadow.record_primary(seq, primary.predict({'price': float(price)}))
+            stream._emit_data({'price': -1.0})
+            self.assertTrue(shadow.wait())
+
+        report = shadow.get_report()
+        self.assertEqual(report['same']['processed'], 21)
+        self.assertEqual(report['same']['errors'], 1)
+        self.assertEqual(report['same']['agreement'], 1.0)
+        self.assertAlmostEqual(report['other']['agreement'], 15 / 20)
+        decisions = shadow.decisions('other')
+        self.assertEqual(len(decisions), 20)
+        self.assertIn('latency', decisions)
+
+    def test_slow_candidate_drops_without_blocking(self):
+        """Test a slow candidate drops items and mirror stays fast."""
+        with ShadowRunner({'slow': ThresholdStrategy(100, delay=0.05)}, queue_size=4) as shadow:
+            start = time.perf_counter()
+            for price in range(200):
+                shadow.mirror({'price': float(price)})
+            elapsed = time.perf_counter() - start
+            shadow.wait(timeout=2.0)
+
+        report = shadow.get_report()['slow']
+        self.assertLess(elapsed, 0.5)
+        self.assertGreater(report['dropped'], 150)
+        self.assertEqual(report['mirrored'] + report['dropped'], 200)
+        self.assertGreaterEqual(report['latency_ms_mean'], 50)
+
+    def test_stop_drains_results(self):
+        """Test stop collects a large backlog instead of waiting and terminating."""
+        shadow = ShadowRunner({'fast': ThresholdStrategy(100)}, queue_size=20000)
+        shadow.start()
+        for price in range(20000):
+            shadow.mirror({'price': float(price % 200)})
+        start = time.perf_counter()
+        shadow.stop()
+        elapsed = time.perf_counter() - start
+
+        report = shadow.get_report()['fast']
+        self.assertEqual(report['processed'], report['mirrored'])
+        self.assertEqual(report['mirrored'] + report['dropped'], 20000)
+        self.assertLess(elapsed, 4.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for fixed-schema state records.
+"""
+
+import unittest
+import numpy as np
+from tradeAI.core.strategy.base import RLStrategy
+from tradeAI.core.strategy.state import RecordStrategyAdapter, StateSchema
+
+class DictStrategy(RLStrategy):
+    """Strategy written against dict states."""
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        return {'action': 'buy' if state['rsi'] < 30 else 'hold', 'confidence': 1.0}
+
+    def get_action_space(self):
+        return {'actions': ['buy', 'hold']}
+
+    def get_state_space(self):
+        return {'features': ['price', 'rsi']}
+
+    def get_reward(self, state, action):
+        return state.get('price', 0.0) * (action['action'] == 'buy')
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class RecordStrategy(DictStrategy):
+    """Strategy using positional record access."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict_record(self, record):
+        self.calls += 1
+        return {'action': 'buy' if record.values[1] < 30 else 'hold', 'confidence': 1.0}
+
+class TestStateSchema(unittest.TestCase):
+    """Test schema and record access."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.schema = StateSchema.from_state_space({'features': ['price', 'rsi']}, extra_fields=['position'])
+
+    def test_record_access(self):
+        """Test positional, attribute and mapping access agree."""
+        record = self.schema.from_dict({'price': 101.5, 'rsi': 25.0})
+        self.assertEqual(record[0], 101.5)
+        self.assertEqual(record.rsi, 25.0)
+        self.assertEqual(record['price'], 101.5)
+        self.assertTrue(np.isnan(record['position']))
+        self.assertEqual(list(record), ['price', 'rsi', 'position'])
+        self.assertEqual(dict(record)['rsi'], 25.0)
+        self.assertNotIn('volume', record)
+        with self.assertRaises(KeyError):
+            record['volume']
+        self.assertFalse(hasattr(record, '__dict__'))
+
+        price, rsi = self.schema.getter('price', 'rsi')(record.values)
+        self.assertEqual((price, rsi), (101.5, 25.0))
+
+    def test_batch_views(self):
+        """Test records and structured arrays share memory with the batch."""
+        batch = np.arange(12, dtype=np.float64).reshape(4, 3)
+        records = self.schema.records(batch)
+        batch[2, 1] = -1
+        self.assertEqual(records[2].rsi, -1)
+
+        structured = self.schema.to_structured(batch)
+        np.testing.assert_array_equal(structured['price'], batch[:, 0])
+        with self.assertRaises(ValueError):
+            self.schema.records(np.zeros((2, 5)))
+
+class TestRecordStrategyAdapter(unittest.TestCase):
+    """Test adapting dict-based and record-based strategies."""
+
+    def test_dict_strategy(self):
+        """Test dict strategies accept records, rows and dicts."""
+        adapter = RecordStrategyAdapter(DictStrategy())
+        self.assertEqual(adapter.schema.fields, ('price', 'rsi'))
+        self.assertEqual(adapter.predict(np.array([100.0, 20.0]))['action'], 'buy')
+        self.assertEqual(adapter.predict({'price': 100.0, 'rsi': 50.0})['action'], 'hold')
+        self.assertEqual(adapter.get_reward(np.array([100.0, 20.0]), {'action': 'buy'}), 100.0)
+
+    def test_record_strategy_rows(self):
+        """Test record strategies get positional records for every row."""
+        strategy = RecordStrategy()
+        adapter = RecordStrategyAdapter(strategy)
+        rows = np.column_stack([np.full(5, 100.0), [10, 40, 20, 50, 60]])
+        actions = [d['action'] for d in adapter.predict_rows(rows)]
+        self.assertEqual(actions, ['buy', 'hold', 'buy', 'hold', 'hold'])
+        self.assertEqual(strategy.calls, 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for batched strategy prediction.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import torch
+from tradeAI.core.strategy.base import (BaseStrategy, RLStrategy, stack_decisions, states_to_array,
+                                       unstack_decisions)
+
+ACTIONS = np.array(['sell', 'hold', 'buy'])
+FEATURES = ['price', 'ma_5', 'rsi']
+
+class ThresholdStrategy(RLStrategy):
+    """Rule-based strategy relying on the default batch fallback."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        self.calls += 1
+        signal = state['price'] - state['ma_5']
+        action = 'buy' if signal > 0 else 'sell' if signal < 0 else 'hold'
+        return {'action': action, 'confidence': min(1.0, abs(signal) / 10)}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+    def get_action_space(self):
+        return {'type': 'discrete', 'size': 3, 'actions': list(ACTIONS)}
+
+    def get_state_space(self):
+        return {'type': 'continuous', 'shape': (3,), 'features': FEATURES}
+
+    def get_reward(self, state, action):
+        return 0.0
+
+class TorchStrategy(BaseStrategy):
+    """Torch strategy overriding predict_batch with one forward pass."""
+
+    def __init__(self):
+        torch.manual_seed(0)
+        self.model = torch.nn.Linear(len(FEATURES), len(ACTIONS))
+
+    def train(self, data, **kwargs):
+        pass
+
+    def predict(self, state):
+        batch = self.predict_batch([state], FEATURES)
+        return {'action': batch['action'][0], 'confidence': float(batch['confidence'][0])}
+
+    def predict_batch(self, states, feature_names=None):
+        inputs = torch.from_numpy(states_to_array(states, feature_names or FEATURES))
+        with torch.no_grad():
+            probs = torch.softmax(self.model(inputs), dim=-1)
+        confidence, index = probs.max(dim=-1)
+        return {'action': ACTIONS[index.numpy()], 'confidence': confidence.numpy()}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestPredictBatch(unittest.TestCase):
+    """Test predict_batch contract."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(1)
+        self.states = pd.DataFrame(rng.normal(100, 5, (50, 3)), columns=FEATURES)
+
+    def test_default_fallback(self):
+        """Test default implementation loops over predict."""
+        strategy = ThresholdStrategy()
+        from_frame = strategy.predict_batch(self.states)
+        from_array = strategy.predict_batch(self.states.to_numpy())
+        from_dicts = strategy.predict_batch(self.states.to_dict('records'))
+
+        expected = [strategy.predict(s) for s in self.states.to_dict('records')]
+        np.testing.assert_array_equal(from_frame['action'], [e['action'] for e in expected])
+        np.testing.assert_allclose(from_frame['confidence'], [e['confidence'] for e in expected])
+        np.testing.assert_array_equal(from_array['action'], from_frame['action'])
+        np.testing.assert_array_equal(from_dicts['action'], from_frame['action'])
+        self.assertEqual(from_frame['confidence'].dtype, np.float64)
+
+    def test_array_requires_feature_names(self):
+        """Test array states need feature names without a state space."""
+        strategy = TorchStrategy()
+        with self.assertRaises(ValueError):
+            BaseStrategy.predict_batch(strategy, self.states.to_numpy())
+
+    def test_torch_override(self):
+        """Test batched override agrees with per-state predict."""
+        strategy = TorchStrategy()
+        batch = strategy.predict_batch(self.states)
+        self.assertEqual(batch['action'].shape, (50,))
+        for i, state in enumerate(self.states.to_dict('records')):
+            self.assertEqual(strategy.predict(state)['action'], batch['action'][i])
+
+    def test_missing_confidence(self):
+        """Test decisions without confidence still stack to length n."""
+        strategy = ThresholdStrategy()
+        strategy.predict = lambda state: {'action': 'buy'}
+        batch = strategy.predict_batch(self.states)
+        self.assertEqual(batch['action'].shape, (50,))
+        np.testing.assert_array_equal(batch['confidence'], np.ones(50))
+        self.assertEqual(unstack_decisions(batch)[0], {'action': 'buy', 'confidence': 1.0})
+
+        mixed = stack_decisions([{'action': 'buy', 'size': 2}, {'action': 'sell', 'confidence': 0.5}])
+        self.assertEqual(unstack_decisions(mixed)[1], {'action': 'sell', 'confidence': 0.5, 'size': None})
+
+    def test_malformed_decisions(self):
+        """Test missing actions and ragged batches raise ValueError."""
+        with self.assertRaises(ValueError):
+            stack_decisions([{'action': 'buy'}, {'confidence': 0.5}])
+        with self.assertRaises(ValueError):
+            unstack_decisions({'action': np.array(['buy', 'sell']), 'confidence': np.empty(0)})
+
+    def test_states_to_array(self):
+        """Test state batch conversion."""
+        array = states_to_array(self.states.to_dict('records'), FEATURES[::-1])
+        self.assertTrue(array.flags['C_CONTIGUOUS'])
+        self.assertEqual(array.dtype, np.float32)
+        np.testing.assert_allclose(array, self.states[FEATURES[::-1]].to_numpy(), rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for successive halving and Hyperband search.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.strategy.tuning import BudgetedStrategyObjective, HyperbandSearch, SuccessiveHalvingSearch
+
+def quadratic_objective(params, budget, checkpoint_path):
+    """Noise shrinks with budget; the optimum is x = 3."""
+    resumed = os.path.exists(checkpoint_path)
+    with open(checkpoint_path, 'w') as f:
+        f.write(str(budget))
+    if params['x'] < 0:
+        raise ValueError("invalid x")
+    noise = np.random.default_rng(int(params['x'] * 100)).normal(0, 1.0 / budget)
+    return {'score': -(params['x'] - 3) ** 2 + noise, 'resumed': float(resumed)}
+
+def sample_x(rng):
+    """Sample x uniformly."""
+    return {'x': float(rng.uniform(0, 6))}
+
+class MomentumStrategy(BaseStrategy):
+    """Learns the mean momentum incrementally."""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.state = np.zeros(2)
+
+    def train(self, data, **kwargs):
+        self.state = np.zeros(2)
+        self.partial_fit(data)
+
+    def partial_fit(self, data, **kwargs):
+        momentum = np.asarray(data['bars']['momentum'])
+        self.state += [momentum.sum(), len(momentum)]
+
+    def predict(self, state):
+        mean = self.state[0] / max(self.state[1], 1)
+        return {'action': 'buy' if state['momentum'] * self.scale > mean else 'sell', 'confidence': 1.0}
+
+    def get_parameters(self):
+        return {'state': self.state}
+
+    def set_parameters(self, parameters):
+        self.state = np.array(parameters['state'])
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestSuccessiveHalving(unittest.TestCase):
+    """Test successive halving and Hyperband."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.work_dir)
+
+    def test_halving_grid(self):
+        """Test losers stop early and survivors resume from checkpoints."""
+        search = SuccessiveHalvingSearch(
+            quadratic_objective, {'x': [-1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 2.5]},
+            self.work_dir, min_budget=1, max_budget=9, eta=3, metric='score', max_workers=2, seed=0
+        )
+        board = search.run()
+        self.assertEqual(len(board), 9)
+        self.assertEqual(board['params'].iloc[0]['x'], 3.0)
+        self.assertEqual(board['status'].iloc[0], 'completed')
+        self.assertEqual(board['metric_resumed'].iloc[0], 1.0)
+        self.assertEqual((board['status'] == 'failed').sum(), 1)
+        self.assertEqual((board['budget'] == 9).sum(), 1)
+        self.assertTrue((board.loc[board['status'] != 'failed', 'wall_time'] > 0).all())
+        self.assertGreater(board['peak_rss_mb'].iloc[0], 0)
+
+        stopped = board[board['status'] == 'stopped']
+        self.assertTrue(stopped['checkpoint'].isna().all())
+        self.assertIsNotNone(board['checkpoint'].iloc[0])
+
+    def test_hyperband(self):
+        """Test bracket sizes and sampler-driven configurations."""
+        search = HyperbandSearch(
+            quadratic_objective, sample_x, self.work_dir, min_budget=1, max_budget=9,
+            eta=3, metric='score', max_workers=2, seed=1
+        )
+        board = search.run()
+        self.assertEqual(len(board), 9 + 5 + 3)
+        self.assertEqual(sorted(board['bracket'].unique()), [0, 1, 2])
+        self.assertEqual(board['budget'].iloc[0], 9)
+        self.assertLess(abs(board['params'].iloc[0]['x'] - 3), 1.5)
+
+    def test_budgeted_strategy_objective(self):
+        """Test data-span budgets resume through checkpoints."""
+        rng = np.random.default_rng(4)
+        close = 100 * np.exp(rng.normal(0, 0.01, 400).cumsum())
+        data_dir = os.path.join(self.work_dir, 'bars')
+        BudgetedStrategyObjective.save_bars({'close': close, 'momentum': np.diff(close, prepend=close[0])}, data_dir)
+
+        objective = BudgetedStrategyObjective(MomentumStrategy, ['momentum'], data_dir, train_size=300)
+        path = os.path.join(self.work_dir, 'trial.ckpt')
+        first = objective({'scale': 1.0}, 100, path)
+        second = objective({'scale': 1.0}, 300, path)
+        self.assertEqual(first['train_bars'], 100)
+        self.assertEqual(second['train_bars'], 300)
+        self.assertIn('sharpe', second)
+
+        search = SuccessiveHalvingSearch(
+            objective, {'scale': [0.5, 1.0, 2.0]}, os.path.join(self.work_dir, 'trials'),
+            min_budget=100, max_budget=300, eta=3, max_workers=2
+        )
+        board = search.run()
+        self.assertEqual((board['status'] == 'completed').sum(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
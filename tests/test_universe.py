@@ -0,0 +1,54 @@
+"""
+Unit tests for parallel universe indicator computation.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+from tradeAI.core.data.universe import UniverseIndicatorExecutor
+from tradeAI.core.data.indicators import calculate_atr_wilder, calculate_ema, calculate_rsi_wilder
+
+class TestUniverseIndicatorExecutor(unittest.TestCase):
+    """Test universe indicator executor."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = np.random.default_rng(0)
+        self.frames = {}
+        for i, length in enumerate([300, 300, 250, 120, 300]):
+            close = 50 + rng.standard_normal(length).cumsum()
+            self.frames[f'SYM{i}'] = pd.DataFrame({
+                'open': close,
+                'high': close + 1,
+                'low': close - 1,
+                'close': close,
+                'volume': rng.integers(100, 1000, length)
+            }, index=pd.date_range('2024-01-01', periods=length, freq='D'))
+        self.executor = UniverseIndicatorExecutor(max_workers=2, shards_per_worker=2)
+
+    def test_panel_matches_serial(self):
+        """Test parallel results match per-symbol computation."""
+        panel = self.executor.run(self.frames)
+
+        self.assertEqual(len(panel), sum(len(df) for df in self.frames.values()))
+        for symbol, frame in self.frames.items():
+            result = panel.loc[symbol]
+            np.testing.assert_allclose(result['ema_12'], calculate_ema(frame, 12))
+            np.testing.assert_allclose(result['rsi_14'], calculate_rsi_wilder(frame, 14))
+            np.testing.assert_allclose(result['atr_14'], calculate_atr_wilder(frame, 14))
+            np.testing.assert_allclose(result['ma_20'], frame['close'].rolling(20).mean())
+            self.assertTrue(result.index.equals(frame.index))
+
+    def test_shard_report(self):
+        """Test per-shard timing and memory report."""
+        self.executor.run(self.frames)
+        report = self.executor.get_report()
+
+        self.assertEqual(report['totals']['n_symbols'], len(self.frames))
+        self.assertEqual(report['totals']['n_shards'], 4)
+        for shard in report['shards']:
+            self.assertGreaterEqual(shard['wall_time'], 0)
+            self.assertGreater(shard['rss_bytes'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit tests for walk-forward optimization.
+"""
+
+import unittest
+import tempfile
+import shutil
+from unittest.mock import patch
+import numpy as np
+from tradeAI.core.strategy.base import BaseStrategy
+from tradeAI.core.backtest.walkforward import (
+    WalkForwardRunner,
+    StrategyObjective,
+    walk_forward_splits,
+    purged_kfold_splits,
+    expand_param_grid
+)
+
+def moving_average_objective(params, train, test):
+    """Score a moving-average crossover on the test window."""
+    close = np.asarray(test['close'])
+    fast = np.convolve(close, np.ones(params['fast']) / params['fast'], mode='same')
+    signal = np.sign(fast - close.mean())
+    returns = signal[:-1] * np.diff(close) / close[:-1]
+    return {'sharpe': float(returns.mean() / (returns.std() + 1e-12)), 'train_bars': len(train['close'])}
+
+def failing_objective(params, train, test):
+    """Objective that must not be called on a fully resumed run."""
+    raise RuntimeError("should have been resumed")
+
+class ThresholdStrategy(BaseStrategy):
+    """Buys when momentum exceeds a threshold."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.trained = False
+
+    def train(self, data, **kwargs):
+        self.trained = len(data['bars']['close']) > 0
+
+    def predict(self, state):
+        if not self.trained:
+            raise RuntimeError("not trained")
+        return {'action': 'buy' if state['momentum'] > self.threshold else 'sell', 'confidence': 1.0}
+
+    def save(self, path):
+        pass
+
+    def load(self, path):
+        pass
+
+class TestSplits(unittest.TestCase):
+    """Test fold construction."""
+
+    def test_walk_forward(self):
+        """Test rolling and expanding windows."""
+        splits = walk_forward_splits(100, train_size=40, test_size=20)
+        self.assertEqual(len(splits), 3)
+        self.assertEqual(splits[1].train[0], 20)
+        self.assertEqual(splits[1].test[0], 60)
+        expanding = walk_forward_splits(100, 40, 20, expanding=True)
+        self.assertEqual(len(expanding[2].train), 80)
+
+    def test_purged_kfold(self):
+        """Test purge and embargo gaps."""
+        splits = purged_kfold_splits(100, n_splits=5, purge=3, embargo=2)
+        middle = splits[2]
+        self.assertEqual(list(middle.test[[0, -1]]), [40, 59])
+        self.assertNotIn(37, middle.train)
+        self.assertIn(36, middle.train)
+        self.assertNotIn(61, middle.train)
+        self.assertIn(62, middle.train)
+
+    def test_param_grid(self):
+        """Test grid expansion."""
+        grid = expand_param_grid({'a': [1, 2], 'b': ['x', 'y', 'z']})
+        self.assertEqual(len(grid), 6)
+        self.assertIn({'a': 2, 'b': 'z'}, grid)
+
+class TestWalkForwardRunner(unittest.TestCase):
+    """Test parallel runner."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.work_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(11)
+        close = 100 * np.exp(rng.normal(0, 0.01, 600).cumsum())
+        self.bars = {'close': close, 'momentum': np.diff(close, prepend=close[0])}
+        self.splits = walk_forward_splits(600, train_size=200, test_size=100)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.work_dir)
+
+    def test_run_and_resume(self):
+        """Test aggregation and resuming after interruption."""
+        runner = WalkForwardRunner(
+            moving_average_objective, {'fast': [3, 5, 10]}, self.splits,
+            work_dir=self.work_dir, max_workers=2
+        )
+        summary = runner.run(self.bars)
+        self.assertEqual(len(summary), 3)
+        self.assertTrue((summary['n_folds'] == len(self.splits)).all())
+        self.assertTrue(summary['sharpe_mean'].is_monotonic_decreasing)
+        self.assertEqual(summary['train_bars_mean'].iloc[0], 200)
+
+        # Simulate an interrupted run: keep half the log plus a torn line
+        lines = runner.results_path.read_text().splitlines()
+        runner.results_path.write_text('\n'.join(lines[:5]) + '\n{"job": ')
+        resumed = WalkForwardRunner(
+            moving_average_objective, {'fast': [3, 5, 10]}, self.splits,
+            work_dir=self.work_dir, max_workers=2
+        ).run(self.bars)
+        np.testing.assert_allclose(resumed['sharpe_mean'], summary['sharpe_mean'])
+
+        # A fully resumed run starts no workers
+        with patch('tradeAI.core.backtest.walkforward.ProcessPoolExecutor', side_effect=AssertionError):
+            finished = WalkForwardRunner(
+                moving_average_objective, {'fast': [3, 5, 10]}, self.splits,
+                work_dir=self.work_dir, max_workers=2
+            ).run(self.bars)
+        self.assertEqual(len(finished), 3)
+
+    def test_resume_key_covers_splits_objective_and_data(self):
+        """Test changed folds, objective or data are not served from the log."""
+        def run(objective, splits, bars):
+            return WalkForwardRunner(objective, {'fast': [3]}, splits,
+                                     work_dir=self.work_dir, max_workers=1).run(bars)
+
+        run(moving_average_objective, self.splits, self.bars)
+        resplit = run(moving_average_objective, walk_forward_splits(600, train_size=300, test_size=100), self.bars)
+        self.assertEqual(resplit['train_bars_mean'].iloc[0], 300)
+        self.assertEqual(len(run(failing_objective, self.splits, self.bars)), 0)
+
+        reordered = {name: values[::-1].copy() for name, values in self.bars.items()}
+        with patch('tradeAI.core.backtest.walkforward.ProcessPoolExecutor', side_effect=AssertionError):
+            with self.assertRaises(AssertionError):
+                run(moving_average_objective, self.splits, reordered)
+
+    def test_strategy_objective(self):
+        """Test training and backtesting strategies per fold."""
+        objective = StrategyObjective(ThresholdStrategy, ['momentum'])
+        runner = WalkForwardRunner(
+            objective, [{'threshold': 0.0}, {'threshold': 0.5}], self.splits,
+            work_dir=self.work_dir, max_workers=2
+        )
+        summary = runner.run(self.bars)
+        self.assertEqual(len(summary), 2)
+        self.assertIn('max_drawdown_mean', summary)
+        self.assertEqual(len(runner.fold_results), 2 * len(self.splits))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Unit tests for the windowed data loader.
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import torch
+from tradeAI.core.data.windows import WindowDataset, WindowLoader
+
+class TestWindowDataset(unittest.TestCase):
+    """Test zero-copy windows."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.columns = {
+            'close': np.arange(100, dtype=np.float64),
+            'volume': np.arange(100, dtype=np.float64) * 10
+        }
+
+    def test_windows_and_targets(self):
+        """Test window contents, stride and target alignment."""
+        dataset = WindowDataset(self.columns, window=5, stride=3, features=['close', 'volume'],
+                                target='close', horizon=2)
+        self.assertEqual(len(dataset), (100 - 2 - 5) // 3 + 1)
+        self.assertTrue(np.shares_memory(dataset._views[0], self.columns['close']))
+
+        batch = dataset.gather([4, 0])
+        self.assertEqual(batch['x'].shape, (2, 5, 2))
+        self.assertEqual(batch['x'].dtype, np.float32)
+        self.assertTrue(batch['x'].flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(batch['x'][0, :, 0], np.arange(12, 17))
+        np.testing.assert_array_equal(batch['x'][1, :, 1], np.arange(0, 5) * 10)
+        np.testing.assert_array_equal(batch['y'], [18, 6])
+
+        last = dataset.gather([len(dataset) - 1])
+        self.assertLessEqual(last['y'][0], 99)
+
+    def test_from_directory(self):
+        """Test memory-mapped column files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, values in self.columns.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), values)
+            dataset = WindowDataset.from_directory(tmp, window=10)
+            self.assertEqual(dataset.features, ['close', 'volume'])
+            self.assertIsInstance(dataset.columns['close'], np.memmap)
+            np.testing.assert_array_equal(dataset.gather([90])['x'][0, -1], [99, 990])
+
+class TestWindowLoader(unittest.TestCase):
+    """Test prefetching loader."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.dataset = WindowDataset({'close': np.arange(1000.0)}, window=8, features=['close'], target='close')
+
+    def test_epoch_covers_all_windows(self):
+        """Test one shuffled epoch yields every window once."""
+        loader = WindowLoader(self.dataset, batch_size=64, prefetch=3, num_workers=3, seed=1)
+        firsts = np.concatenate([batch['x'][:, 0, 0] for batch in loader])
+        self.assertEqual(len(firsts), len(self.dataset))
+        np.testing.assert_array_equal(np.sort(firsts), np.arange(len(self.dataset)))
+        self.assertFalse(np.array_equal(firsts, np.arange(len(self.dataset))))
+        self.assertEqual(loader.get_statistics()['n_batches'], len(loader))
+
+    def test_deterministic_and_torch(self):
+        """Test seeded order and torch output."""
+        first = [b['y'] for b in WindowLoader(self.dataset, batch_size=100, seed=5)]
+        second = [b['y'] for b in WindowLoader(self.dataset, batch_size=100, seed=5)]
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+
+        loader = WindowLoader(self.dataset, batch_size=100, drop_last=True, pin_memory=True)
+        batches = list(loader)
+        self.assertEqual(len(batches), len(self.dataset) // 100)
+        self.assertIsInstance(batches[0]['x'], torch.Tensor)
+        self.assertEqual(batches[0]['x'].dtype, torch.float32)
+        self.assertTrue(batches[0]['x'].is_contiguous())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,332 @@
+"""
+Event-driven backtester replaying bars or ticks through a matching engine.
+"""
+
+import io
+import time
+import cProfile
+import pstats
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+from ..strategy.base import BaseStrategy
+from .matching import Fill, MatchingEngine, Order, Side
+from .vectorized import compute_risk_stats
+
+logger = logging.getLogger(__name__)
+
+# Events converted to Python lists at a time in the event loop
+_CHUNK_SIZE = 1 << 16
+
+@dataclass
+class EventBacktestConfig:
+    """Event-driven backtest settings."""
+    initial_capital: float = 1_000_000.0
+    order_size: float = 1.0
+    allow_short: bool = True
+    fee_rate: float = 0.0005
+    maker_fee_rate: Optional[float] = None
+    slippage_bps: float = 1.0
+    default_queue_ahead: float = 0.0
+    decision_every: int = 1
+    periods_per_year: int = 252
+    profile: bool = False
+    profile_top: int = 20
+
+    def __post_init__(self):
+        if self.decision_every < 1:
+            raise ValueError(f"decision_every must be at least 1, got {self.decision_every}")
+
+@dataclass
+class EventBacktestResult:
+    """Output of an event-driven backtest."""
+    fills: List[Fill]
+    equity: np.ndarray
+    positions: np.ndarray
+    decision_index: np.ndarray
+    stats: Dict[str, float] = field(default_factory=dict)
+    report: Dict[str, Any] = field(default_factory=dict)
+
+def bars_to_events(bars: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Expand OHLCV bars into four trade events per bar.
+
+    Each bar replays open, then the extreme closer to the open's direction
+    (low first on up bars, high first on down bars), the other extreme and
+    the close, with the bar volume split evenly.
+
+    Args:
+        bars: DataFrame or dict of arrays with open, high, low, close and
+            volume columns
+
+    Returns:
+        Dictionary of event arrays (timestamp, price, volume, bar)
+    """
+    open_ = np.asarray(bars['open'], dtype=np.float64)
+    high = np.asarray(bars['high'], dtype=np.float64)
+    low = np.asarray(bars['low'], dtype=np.float64)
+    close = np.asarray(bars['close'], dtype=np.float64)
+    up = close >= open_
+
+    prices = np.column_stack([
+        open_,
+        np.where(up, low, high),
+        np.where(up, high, low),
+        close
+    ]).ravel()
+    if 'volume' in bars:
+        volume = np.repeat(np.asarray(bars['volume'], dtype=np.float64) / 4, 4)
+    else:
+        volume = np.full(len(prices), np.inf)
+    bar_index = np.repeat(np.arange(len(close)), 4)
+    timestamps = bar_index + np.tile([0.0, 0.25, 0.5, 0.75], len(close))
+    return {'timestamp': timestamps, 'price': prices, 'volume': volume, 'bar': bar_index}
+
+class EventBacktester:
+    """
+    Order-level backtester driving a strategy through callbacks.
+
+    At every decision point the strategy's ``predict`` receives a state with
+    the latest bar/tick fields plus ``position``, ``cash``, ``equity`` and
+    ``open_orders`` (ids of working orders). A decision may carry explicit
+    ``orders`` (dicts with ``side``, ``quantity`` and optional ``price``;
+    ``cancel`` lists order ids) or an ``action`` (buy/sell/hold) that moves
+    the position to ``+/- order_size`` with a market order, or a limit order
+    when ``limit_price`` is given. Strategies may define ``on_order(order)``
+    to learn the id of every order they submit and ``on_fill(fill)`` to be
+    notified of executions.
+
+    State fields are read from column arrays only at decision points, so
+    memory stays proportional to the input arrays for long tick streams.
+    """
+
+    def __init__(self, strategy: BaseStrategy, config: Optional[EventBacktestConfig] = None):
+        """Initialize event backtester.
+
+        Args:
+            strategy: Strategy to drive
+            config: Backtest configuration
+        """
+        self.strategy = strategy
+        self.config = config or EventBacktestConfig()
+
+    def run(self,
+            data: Union[pd.DataFrame, Dict[str, np.ndarray]],
+            features: Optional[pd.DataFrame] = None,
+            bars: bool = True) -> EventBacktestResult:
+        """Replay market data through the matching engine.
+
+        Args:
+            data: OHLCV bars, or tick events with price and volume (and
+                optionally timestamp) columns
+            features: Extra per-bar (or per-tick) state columns
+            bars: Whether ``data`` holds bars (decisions at each bar close)
+                or ticks (decisions every ``decision_every`` ticks)
+
+        Returns:
+            EventBacktestResult
+        """
+        if not self.config.profile:
+            return self._run(data, features, bars)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            result = self._run(data, features, bars)
+        finally:
+            profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(self.config.profile_top)
+        result.report['profile'] = stream.getvalue()
+        return result
+
+    def _run(self,
+             data: Union[pd.DataFrame, Dict[str, np.ndarray]],
+             features: Optional[pd.DataFrame],
+             bars: bool) -> EventBacktestResult:
+        """Event loop."""
+        cfg = self.config
+        setup_start = time.perf_counter()
+
+        if bars:
+            events = bars_to_events(data)
+            decision_mask = np.zeros(len(events['price']), dtype=bool)
+            decision_mask[3::4] = True
+            columns = {name: data[name] for name in (data.columns if isinstance(data, pd.DataFrame) else data)}
+        else:
+            prices = np.asarray(data['price'], dtype=np.float64)
+            events = {
+                'price': prices,
+                'volume': np.asarray(data['volume'], dtype=np.float64) if 'volume' in data else np.full(len(prices), np.inf),
+                'timestamp': np.asarray(data['timestamp'], dtype=np.float64) if 'timestamp' in data else np.arange(len(prices), dtype=np.float64),
+                'bar': np.arange(len(prices))
+            }
+            decision_mask = np.zeros(len(prices), dtype=bool)
+            decision_mask[cfg.decision_every - 1::cfg.decision_every] = True
+            columns = {name: data[name] for name in (data.columns if isinstance(data, pd.DataFrame) else data)}
+        if features is not None:
+            columns.update({name: features[name] for name in features.columns})
+        # Numeric columns as arrays; others (timestamps, strings) keep pandas scalars
+        state_columns = [
+            (name, values.to_numpy() if isinstance(values, pd.Series) and pd.api.types.is_numeric_dtype(values)
+             else values.array if isinstance(values, pd.Series) else np.asarray(values))
+            for name, values in columns.items()
+        ]
+
+        engine = MatchingEngine(
+            fee_rate=cfg.fee_rate,
+            maker_fee_rate=cfg.maker_fee_rate,
+            slippage_bps=cfg.slippage_bps,
+            default_queue_ahead=cfg.default_queue_ahead
+        )
+        self._cash = cfg.initial_capital
+        self._position = 0.0
+        fills: List[Fill] = []
+        on_fill = getattr(self.strategy, 'on_fill', None)
+        self._on_order = getattr(self.strategy, 'on_order', None)
+
+        decision_points = np.flatnonzero(decision_mask)
+        equity = np.empty(len(decision_points))
+        positions = np.empty(len(decision_points))
+
+        timings = {'setup': time.perf_counter() - setup_start, 'matching': 0.0, 'strategy': 0.0, 'orders': 0.0}
+        loop_start = time.perf_counter()
+        perf_counter = time.perf_counter
+        on_trade = engine.on_trade
+        apply_fills = self._apply_fills
+        n_matching_events = 0
+
+        # Convert chunk by chunk: iterating Python floats is much faster than
+        # indexing arrays, and chunks keep the converted lists small
+        n_events = len(events['price'])
+        decision_count = 0
+
+        for chunk in range(0, n_events, _CHUNK_SIZE):
+            chunk_slice = slice(chunk, chunk + _CHUNK_SIZE)
+            price_list = events['price'][chunk_slice].tolist()
+            volume_list = events['volume'][chunk_slice].tolist()
+            time_list = events['timestamp'][chunk_slice].tolist()
+            bar_list = events['bar'][chunk_slice].tolist()
+            decision_list = decision_mask[chunk_slice].tolist()
+
+            for i in range(len(price_list)):
+                price = price_list[i]
+                if price <= engine.bid_trigger or price >= engine.ask_trigger:
+                    t0 = perf_counter()
+                    new_fills = on_trade(price, volume_list[i], time_list[i])
+                    timings['matching'] += perf_counter() - t0
+                    n_matching_events += 1
+                    if new_fills:
+                        apply_fills(new_fills, fills, on_fill)
+                else:
+                    engine.last_price = price
+                    engine.timestamp = time_list[i]
+
+                if decision_list[i]:
+                    row = bar_list[i]
+                    state = {name: values[row] for name, values in state_columns}
+                    state.update({
+                        'price': price,
+                        'position': self._position,
+                        'cash': self._cash,
+                        'equity': self._cash + self._position * price,
+                        'open_orders': list(engine.book.orders)
+                    })
+                    t0 = perf_counter()
+                    decision = self.strategy.predict(state)
+                    t1 = perf_counter()
+                    timings['strategy'] += t1 - t0
+                    new_fills = self._handle_decision(engine, decision)
+                    if new_fills:
+                        apply_fills(new_fills, fills, on_fill)
+                    timings['orders'] += perf_counter() - t1
+
+                    equity[decision_count] = self._cash + self._position * price
+                    positions[decision_count] = self._position
+                    decision_count += 1
+
+        loop_time = perf_counter() - loop_start
+        timings['event_loop'] = loop_time - timings['matching'] - timings['strategy'] - timings['orders']
+
+        returns = np.diff(equity, prepend=cfg.initial_capital) / np.concatenate([[cfg.initial_capital], equity[:-1]])
+        stats = compute_risk_stats(returns, cfg.periods_per_year)
+        stats.update({
+            'n_fills': len(fills),
+            'total_fees': float(sum(f.fee for f in fills)),
+            'final_equity': float(equity[-1]) if len(equity) else cfg.initial_capital,
+            'final_position': self._position
+        })
+
+        total = sum(timings.values())
+        report = {
+            'n_events': n_events,
+            'n_decisions': int(decision_count),
+            'n_matching_events': n_matching_events,
+            'elapsed': total,
+            'events_per_second': n_events / loop_time if loop_time > 0 else float('inf'),
+            'timings': timings,
+            'time_share': {k: v / total for k, v in timings.items()} if total > 0 else {}
+        }
+
+        return EventBacktestResult(
+            fills=fills,
+            equity=equity,
+            positions=positions,
+            decision_index=decision_points,
+            stats=stats,
+            report=report
+        )
+
+    def _apply_fills(self, new_fills: List[Fill], fills: List[Fill], on_fill: Any) -> None:
+        """Update cash and position for fills and notify the strategy."""
+        for fill in new_fills:
+            signed = fill.side.value * fill.quantity
+            self._position += signed
+            self._cash -= signed * fill.price + fill.fee
+            fills.append(fill)
+            if on_fill is not None:
+                on_fill(fill)
+
+    def _handle_decision(self, engine: MatchingEngine, decision: Dict[str, Any]) -> List[Fill]:
+        """Translate a strategy decision into order actions."""
+        fills: List[Fill] = []
+
+        for order_id in decision.get('cancel', ()):
+            engine.cancel(order_id)
+
+        if 'orders' in decision:
+            for spec in decision['orders']:
+                side = spec['side'] if isinstance(spec['side'], Side) else Side[str(spec['side']).upper()]
+                order = Order(side, spec['quantity'], spec.get('price'))
+                fills.extend(engine.submit(order, spec.get('queue_ahead')))
+                self._notify_order(order)
+            return fills
+
+        action = decision.get('action', 'hold')
+        if action == 'hold':
+            return fills
+
+        size = decision.get('quantity', self.config.order_size)
+        if action == 'buy':
+            target = size
+        elif action == 'sell':
+            target = -size if self.config.allow_short else 0.0
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+        # A new target replaces any working orders
+        engine.cancel_all()
+        delta = target - self._position
+        if abs(delta) > 1e-12:
+            side = Side.BUY if delta > 0 else Side.SELL
+            order = Order(side, abs(delta), decision.get('limit_price'))
+            fills.extend(engine.submit(order))
+            self._notify_order(order)
+        return fills
+
+    def _notify_order(self, order: Order) -> None:
+        """Tell the strategy about a submitted order and its assigned id."""
+        if self._on_order is not None:
+            self._on_order(order)
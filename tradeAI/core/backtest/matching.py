@@ -0,0 +1,372 @@
+"""
+Local price-time priority matching engine for order-level simulation.
+"""
+
+import heapq
+import itertools
+import logging
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class Side(Enum):
+    """Order side."""
+    BUY = 1
+    SELL = -1
+
+class OrderType(Enum):
+    """Order type."""
+    MARKET = "market"
+    LIMIT = "limit"
+
+class OrderStatus(Enum):
+    """Order lifecycle status."""
+    OPEN = "open"
+    PARTIAL = "partial"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+
+class Order:
+    """Simulated order.
+
+    Uses ``__slots__`` since millions of orders may be created per run.
+    """
+    __slots__ = (
+        'order_id', 'side', 'order_type', 'price', 'quantity', 'remaining',
+        'timestamp', 'queue_ahead', 'status'
+    )
+
+    def __init__(self,
+                 side: Side,
+                 quantity: float,
+                 price: Optional[float] = None,
+                 timestamp: float = 0.0,
+                 order_id: Optional[int] = None):
+        """Initialize order.
+
+        Args:
+            side: Order side
+            quantity: Order quantity
+            price: Limit price (None for a market order)
+            timestamp: Submission time
+            order_id: Order identifier (assigned by the engine if omitted)
+        """
+        if quantity <= 0:
+            raise ValueError("Order quantity must be positive")
+        self.order_id = order_id
+        self.side = side
+        self.order_type = OrderType.MARKET if price is None else OrderType.LIMIT
+        self.price = price
+        self.quantity = quantity
+        self.remaining = quantity
+        self.timestamp = timestamp
+        self.queue_ahead = 0.0
+        self.status = OrderStatus.OPEN
+
+    @property
+    def active(self) -> bool:
+        """Whether the order can still fill."""
+        return self.status in (OrderStatus.OPEN, OrderStatus.PARTIAL)
+
+    def __repr__(self) -> str:
+        return (f"Order(id={self.order_id}, side={self.side.name}, price={self.price}, "
+                f"remaining={self.remaining}/{self.quantity}, status={self.status.value})")
+
+@dataclass
+class Fill:
+    """Execution of (part of) an order."""
+    order_id: int
+    side: Side
+    price: float
+    quantity: float
+    timestamp: float
+    liquidity: str
+    fee: float = 0.0
+
+class OrderBook:
+    """
+    Resting limit orders in price-time priority.
+
+    Price levels are kept in heaps (bids negated) with a FIFO deque of
+    orders per level. Cancelled orders and emptied levels are removed
+    lazily when they reach the front.
+    """
+
+    def __init__(self):
+        """Initialize order book."""
+        self._heaps = {Side.BUY: [], Side.SELL: []}
+        self._levels: Dict[Side, Dict[float, Deque[Order]]] = {Side.BUY: {}, Side.SELL: {}}
+        self._active: Dict[Side, Dict[float, int]] = {Side.BUY: {}, Side.SELL: {}}
+        self.orders: Dict[int, Order] = {}
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def add(self, order: Order) -> None:
+        """Rest a limit order at the back of its price level.
+
+        Args:
+            order: Limit order with an assigned id
+        """
+        side, price = order.side, order.price
+        levels = self._levels[side]
+        level = levels.get(price)
+        if level is None:
+            level = levels[price] = deque()
+            self._active[side][price] = 0
+            heapq.heappush(self._heaps[side], -price if side is Side.BUY else price)
+        level.append(order)
+        self._active[side][price] += 1
+        self.orders[order.order_id] = order
+
+    def cancel(self, order_id: int) -> bool:
+        """Cancel a resting order.
+
+        Args:
+            order_id: Order identifier
+
+        Returns:
+            True if the order was resting and is now cancelled
+        """
+        order = self.orders.pop(order_id, None)
+        if order is None:
+            return False
+        order.status = OrderStatus.CANCELLED
+        self._release(order)
+        return True
+
+    def remove_filled(self, order: Order) -> None:
+        """Drop a fully filled order from the book."""
+        if self.orders.pop(order.order_id, None) is not None:
+            self._release(order)
+
+    def _release(self, order: Order) -> None:
+        """Decrement the active count of the order's level."""
+        side, price = order.side, order.price
+        active = self._active[side]
+        active[price] -= 1
+        if active[price] == 0:
+            del active[price]
+            del self._levels[side][price]
+
+    def best_price(self, side: Side) -> Optional[float]:
+        """Best resting price on one side.
+
+        Args:
+            side: Book side
+
+        Returns:
+            Best price or None if the side is empty
+        """
+        heap = self._heaps[side]
+        levels = self._levels[side]
+        while heap:
+            price = -heap[0] if side is Side.BUY else heap[0]
+            if price in levels:
+                return price
+            heapq.heappop(heap)
+        return None
+
+    def level(self, side: Side, price: float) -> Deque[Order]:
+        """Orders resting at a price level, front first."""
+        level = self._levels[side].get(price)
+        if level is None:
+            return deque()
+        while level and not level[0].active:
+            level.popleft()
+        return level
+
+    def depth(self, side: Side) -> Dict[float, float]:
+        """Remaining quantity per price level on one side."""
+        return {
+            price: sum(o.remaining for o in level if o.active)
+            for price, level in self._levels[side].items()
+        }
+
+class MatchingEngine:
+    """
+    Matches strategy orders against replayed market trades.
+
+    Market orders and marketable limit orders fill immediately against the
+    last traded price (taker). Resting limit orders fill when the market
+    trades through their price, or at their price once the volume queued
+    ahead of them (``queue_ahead``) has traded. Fills are limited by the
+    printed volume, so orders can fill partially across several events.
+    """
+
+    def __init__(self,
+                 fee_rate: float = 0.0,
+                 maker_fee_rate: Optional[float] = None,
+                 slippage_bps: float = 0.0,
+                 default_queue_ahead: float = 0.0):
+        """Initialize matching engine.
+
+        Args:
+            fee_rate: Proportional taker fee
+            maker_fee_rate: Proportional maker fee (defaults to ``fee_rate``)
+            slippage_bps: Slippage applied to taker fills in basis points
+            default_queue_ahead: Volume assumed ahead of new resting orders
+        """
+        self.fee_rate = fee_rate
+        self.maker_fee_rate = fee_rate if maker_fee_rate is None else maker_fee_rate
+        self.slippage = slippage_bps / 10_000
+        self.default_queue_ahead = default_queue_ahead
+
+        self.book = OrderBook()
+        self.last_price: Optional[float] = None
+        self.timestamp = 0.0
+        self._ids = itertools.count(1)
+
+        # Prices at which an incoming trade can touch a resting order
+        self.bid_trigger = float('-inf')
+        self.ask_trigger = float('inf')
+
+    def _refresh_triggers(self) -> None:
+        """Recompute the cached best bid/ask used to skip idle events."""
+        best_bid = self.book.best_price(Side.BUY)
+        best_ask = self.book.best_price(Side.SELL)
+        self.bid_trigger = float('-inf') if best_bid is None else best_bid
+        self.ask_trigger = float('inf') if best_ask is None else best_ask
+
+    def submit(self, order: Order, queue_ahead: Optional[float] = None) -> List[Fill]:
+        """Submit an order.
+
+        Args:
+            order: Order to submit
+            queue_ahead: Volume ahead of the order at its price level
+
+        Returns:
+            Immediate fills
+        """
+        if order.order_id is None:
+            order.order_id = next(self._ids)
+        order.timestamp = self.timestamp
+
+        marketable = order.order_type is OrderType.MARKET or (
+            self.last_price is not None and (
+                order.price >= self.last_price if order.side is Side.BUY
+                else order.price <= self.last_price
+            )
+        )
+        if marketable:
+            if self.last_price is None:
+                raise ValueError("Cannot fill a marketable order before the first trade")
+            price = self.last_price * (1 + order.side.value * self.slippage)
+            if order.order_type is OrderType.LIMIT:
+                price = min(price, order.price) if order.side is Side.BUY else max(price, order.price)
+            return [self._fill(order, price, order.remaining, 'taker')]
+
+        order.queue_ahead = self.default_queue_ahead if queue_ahead is None else queue_ahead
+        self.book.add(order)
+        self._refresh_triggers()
+        return []
+
+    def cancel(self, order_id: int) -> bool:
+        """Cancel a resting order.
+
+        Args:
+            order_id: Order identifier
+
+        Returns:
+            True if the order was cancelled
+        """
+        cancelled = self.book.cancel(order_id)
+        if cancelled:
+            self._refresh_triggers()
+        return cancelled
+
+    def cancel_all(self) -> int:
+        """Cancel every resting order.
+
+        Returns:
+            Number of cancelled orders
+        """
+        order_ids = list(self.book.orders)
+        for order_id in order_ids:
+            self.book.cancel(order_id)
+        self._refresh_triggers()
+        return len(order_ids)
+
+    def on_trade(self, price: float, volume: float, timestamp: float) -> List[Fill]:
+        """Process a market trade print.
+
+        Args:
+            price: Trade price
+            volume: Trade volume
+            timestamp: Trade time
+
+        Returns:
+            Fills of resting orders
+        """
+        self.last_price = price
+        self.timestamp = timestamp
+        if price > self.bid_trigger and price < self.ask_trigger:
+            return []
+
+        fills: List[Fill] = []
+        if price <= self.bid_trigger:
+            self._match_side(Side.BUY, price, volume, fills)
+        if price >= self.ask_trigger:
+            self._match_side(Side.SELL, price, volume, fills)
+        self._refresh_triggers()
+        return fills
+
+    def _match_side(self, side: Side, price: float, volume: float, fills: List[Fill]) -> None:
+        """Fill resting orders on one side against a trade print."""
+        book = self.book
+        while volume > 0:
+            best = book.best_price(side)
+            if best is None or (best < price if side is Side.BUY else best > price):
+                break
+
+            at_touch = best == price
+            level = book.level(side, best)
+            filled_at_level = 0.0
+            for order in list(level):
+                if volume <= 0:
+                    break
+                if not order.active:
+                    continue
+                if at_touch:
+                    # The print first consumes the external volume queued
+                    # ahead of this order, then our earlier orders' fills
+                    ahead = order.queue_ahead
+                    order.queue_ahead = max(0.0, ahead - volume - filled_at_level)
+                    available = volume - ahead
+                    if available <= 0:
+                        continue
+                else:
+                    available = volume
+                quantity = min(order.remaining, available)
+                fills.append(self._fill(order, best, quantity, 'maker'))
+                filled_at_level += quantity
+                volume -= quantity
+
+            if at_touch or book.best_price(side) == best:
+                # Remaining volume at the touch is queued ahead of us
+                break
+
+    def _fill(self, order: Order, price: float, quantity: float, liquidity: str) -> Fill:
+        """Apply a fill to an order."""
+        order.remaining -= quantity
+        if order.remaining <= 1e-12:
+            order.remaining = 0.0
+            order.status = OrderStatus.FILLED
+            if order.order_type is OrderType.LIMIT:
+                self.book.remove_filled(order)
+        else:
+            order.status = OrderStatus.PARTIAL
+
+        rate = self.fee_rate if liquidity == 'taker' else self.maker_fee_rate
+        return Fill(
+            order_id=order.order_id,
+            side=order.side,
+            price=price,
+            quantity=quantity,
+            timestamp=self.timestamp,
+            liquidity=liquidity,
+            fee=abs(price * quantity) * rate
+        )
@@ -0,0 +1,222 @@
+"""
+Vectorized backtesting engine.
+"""
+
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+from ..strategy.base import BaseStrategy, StateBatch
+
+logger = logging.getLogger(__name__)
+
+ACTION_DIRECTIONS = {'buy': 1.0, 'long': 1.0, 'sell': -1.0, 'short': -1.0, 'flat': 0.0}
+
+@dataclass
+class BacktestConfig:
+    """Backtest execution and cost settings."""
+    initial_capital: float = 1_000_000.0
+    fee_rate: float = 0.0005
+    slippage_bps: float = 1.0
+    execution_lag: int = 1
+    max_position: float = 1.0
+    allow_short: bool = True
+    size_by_confidence: bool = False
+    periods_per_year: int = 252
+
+    def __post_init__(self):
+        if self.execution_lag < 0:
+            raise ValueError(f"execution_lag must be non-negative, got {self.execution_lag}")
+
+@dataclass
+class BacktestResult:
+    """Output of a vectorized backtest."""
+    positions: np.ndarray
+    trades: np.ndarray
+    fill_prices: np.ndarray
+    returns: np.ndarray
+    equity: np.ndarray
+    stats: Dict[str, float] = field(default_factory=dict)
+
+    def to_frame(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """Convert per-bar series to a DataFrame (single-asset runs only)."""
+        return pd.DataFrame({
+            'position': self.positions,
+            'trade': self.trades,
+            'fill_price': self.fill_prices,
+            'return': self.returns,
+            'equity': self.equity
+        }, index=index)
+
+def compute_risk_stats(returns: np.ndarray, periods_per_year: int = 252) -> Dict[str, float]:
+    """Compute risk and performance statistics of a return series.
+
+    Args:
+        returns: Per-period portfolio returns
+        periods_per_year: Number of periods per year for annualization
+
+    Returns:
+        Dictionary of statistics
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if len(returns) == 0:
+        return {}
+
+    equity = np.cumprod(1 + returns)
+    peak = np.maximum.accumulate(np.concatenate([[1.0], equity]))[1:]
+    drawdown = equity / peak - 1
+
+    total_return = equity[-1] - 1
+    years = len(returns) / periods_per_year
+    annual_return = (1 + total_return) ** (1 / years) - 1 if total_return > -1 else -1.0
+    volatility = returns.std() * np.sqrt(periods_per_year)
+    downside = returns[returns < 0]
+    downside_vol = np.sqrt(np.mean(downside ** 2)) * np.sqrt(periods_per_year) if len(downside) else 0.0
+    max_drawdown = drawdown.min()
+    active = returns[returns != 0]
+
+    return {
+        'total_return': float(total_return),
+        'annual_return': float(annual_return),
+        'volatility': float(volatility),
+        'sharpe': float(returns.mean() * periods_per_year / volatility) if volatility > 0 else 0.0,
+        'sortino': float(returns.mean() * periods_per_year / downside_vol) if downside_vol > 0 else 0.0,
+        'max_drawdown': float(max_drawdown),
+        'calmar': float(annual_return / abs(max_drawdown)) if max_drawdown < 0 else 0.0,
+        'win_rate': float((active > 0).mean()) if len(active) else 0.0
+    }
+
+def _forward_fill(values: np.ndarray, fill: float = 0.0) -> np.ndarray:
+    """Forward-fill NaNs along axis 0 without a Python loop."""
+    values = np.asarray(values, dtype=np.float64)
+    mask = np.isnan(values)
+    if not mask.any():
+        return values
+    shape = values.shape
+    flat = values.reshape(len(values), -1)
+    mask = mask.reshape(len(values), -1)
+    index = np.where(~mask, np.arange(len(values))[:, None], 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = flat[index, np.arange(flat.shape[1])]
+    filled[np.isnan(filled)] = fill
+    return filled.reshape(shape)
+
+class VectorizedBacktester:
+    """Evaluates strategy signals over bar history entirely in NumPy."""
+
+    def __init__(self, config: Optional[BacktestConfig] = None):
+        """Initialize backtester.
+
+        Args:
+            config: Backtest configuration
+        """
+        self.config = config or BacktestConfig()
+
+    def signals_from_strategy(
+        self,
+        strategy: BaseStrategy,
+        states: StateBatch,
+        feature_names: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """Convert strategy decisions to target positions.
+
+        Args:
+            strategy: Strategy to evaluate
+            states: One state per bar
+            feature_names: Feature order for array states
+
+        Returns:
+            Target position per bar (NaN where the strategy holds)
+        """
+        decisions = strategy.predict_batch(states, feature_names)
+        actions = decisions['action']
+        if actions.dtype.kind in 'if':
+            direction = actions.astype(np.float64)
+        else:
+            direction = np.array([ACTION_DIRECTIONS.get(str(a), np.nan) for a in actions])
+        if self.config.size_by_confidence:
+            direction = direction * decisions['confidence']
+        return direction
+
+    def run(
+        self,
+        bars: Union[pd.DataFrame, Dict[str, np.ndarray]],
+        signals: Optional[np.ndarray] = None,
+        strategy: Optional[BaseStrategy] = None,
+        states: Optional[StateBatch] = None,
+        feature_names: Optional[Sequence[str]] = None
+    ) -> BacktestResult:
+        """Run a backtest.
+
+        Either ``signals`` (target positions, NaN meaning keep the previous
+        position) or ``strategy`` together with ``states`` must be given.
+        Targets decided on bar t are filled at the close of bar
+        ``t + execution_lag``.
+
+        Args:
+            bars: Bars with a ``close`` column of shape (T,) or (T, N)
+            signals: Target positions of shape (T,) or (T, N)
+            strategy: Strategy evaluated with ``predict_batch``
+            states: One state per bar for the strategy
+            feature_names: Feature order for array states
+
+        Returns:
+            BacktestResult
+        """
+        start = time.perf_counter()
+        cfg = self.config
+
+        close = np.asarray(bars['close'], dtype=np.float64)
+        if signals is None:
+            if strategy is None or states is None:
+                raise ValueError("Either signals or strategy and states are required")
+            signals = self.signals_from_strategy(strategy, states, feature_names)
+        signals = np.asarray(signals, dtype=np.float64)
+        if signals.shape != close.shape:
+            raise ValueError(f"Signal shape {signals.shape} does not match bars {close.shape}")
+
+        lower = -cfg.max_position if cfg.allow_short else 0.0
+        target = np.clip(_forward_fill(signals), lower, cfg.max_position)
+
+        # Shift targets by the execution lag; flat before the first fill
+        positions = np.zeros_like(target)
+        lag = min(cfg.execution_lag, len(target))
+        positions[lag:] = target[:len(target) - lag]
+
+        previous = np.zeros_like(positions)
+        previous[1:] = positions[:-1]
+        trades = positions - previous
+
+        slippage = cfg.slippage_bps / 10_000
+        fill_prices = np.where(trades != 0, close * (1 + np.sign(trades) * slippage), np.nan)
+
+        asset_returns = np.zeros_like(close)
+        asset_returns[1:] = close[1:] / close[:-1] - 1
+        costs = np.abs(trades) * (cfg.fee_rate + slippage)
+        pnl = previous * asset_returns - costs
+        returns = pnl.sum(axis=1) if pnl.ndim == 2 else pnl
+
+        equity = cfg.initial_capital * np.cumprod(1 + returns)
+
+        stats = compute_risk_stats(returns, cfg.periods_per_year)
+        n_trades = np.count_nonzero(trades)
+        stats.update({
+            'n_trades': int(n_trades),
+            'turnover': float(np.abs(trades).sum()),
+            'total_costs': float(costs.sum()),
+            'exposure': float(np.mean(np.abs(positions) > 0)),
+            'final_equity': float(equity[-1]) if len(equity) else cfg.initial_capital,
+            'elapsed': time.perf_counter() - start
+        })
+
+        return BacktestResult(
+            positions=positions,
+            trades=trades,
+            fill_prices=fill_prices,
+            returns=returns,
+            equity=equity,
+            stats=stats
+        )
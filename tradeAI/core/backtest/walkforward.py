@@ -0,0 +1,363 @@
+"""
+Parallel walk-forward optimization and purged cross-validation.
+"""
+
+import os
+import json
+import time
+import pickle
+import itertools
+import logging
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from ..strategy.base import BaseStrategy
+from .vectorized import BacktestConfig, VectorizedBacktester
+from ..strategy.checkpoint import checkpoint_hash
+from ...utils.tools import compute_hash, ensure_directory
+
+logger = logging.getLogger(__name__)
+
+Bars = Dict[str, np.ndarray]
+
+@dataclass
+class Split:
+    """Train/test index split of one fold."""
+    fold: int
+    train: np.ndarray
+    test: np.ndarray
+
+def walk_forward_splits(
+    n: int,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    expanding: bool = False
+) -> List[Split]:
+    """Rolling (or expanding) train windows each followed by a test window.
+
+    Args:
+        n: Number of bars
+        train_size: Bars per training window
+        test_size: Bars per test window
+        step: Offset between folds (defaults to ``test_size``)
+        expanding: Anchor every training window at bar 0
+
+    Returns:
+        List of splits
+    """
+    step = step or test_size
+    splits = []
+    start = 0
+    while start + train_size + test_size <= n:
+        train_start = 0 if expanding else start
+        train_stop = start + train_size
+        splits.append(Split(
+            fold=len(splits),
+            train=np.arange(train_start, train_stop),
+            test=np.arange(train_stop, train_stop + test_size)
+        ))
+        start += step
+    return splits
+
+def purged_kfold_splits(
+    n: int,
+    n_splits: int = 5,
+    purge: int = 0,
+    embargo: int = 0
+) -> List[Split]:
+    """K-fold splits with purging and embargo around each test fold.
+
+    Training bars within ``purge`` bars before a test fold or ``embargo``
+    bars after it are dropped, so labels that overlap the test period do
+    not leak into training.
+
+    Args:
+        n: Number of bars
+        n_splits: Number of folds
+        purge: Bars removed before each test fold
+        embargo: Bars removed after each test fold
+
+    Returns:
+        List of splits
+    """
+    indices = np.arange(n)
+    splits = []
+    for fold, test in enumerate(np.array_split(indices, n_splits)):
+        if not len(test):
+            continue
+        lower = max(0, test[0] - purge)
+        upper = min(n, test[-1] + 1 + embargo)
+        train = np.concatenate([indices[:lower], indices[upper:]])
+        splits.append(Split(fold=fold, train=train, test=test))
+    return splits
+
+def expand_param_grid(param_grid: Union[Dict[str, Sequence[Any]], Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Expand a parameter grid into parameter sets.
+
+    Args:
+        param_grid: Mapping of parameter to candidate values, or an explicit
+            list of parameter dicts
+
+    Returns:
+        List of parameter dicts
+    """
+    if isinstance(param_grid, dict):
+        names = list(param_grid)
+        return [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+    return [dict(params) for params in param_grid]
+
+def _take(bars: Bars, index: np.ndarray) -> Bars:
+    """Select rows, keeping a zero-copy view for contiguous indices."""
+    if len(index) and index[-1] - index[0] + 1 == len(index):
+        return {name: values[index[0]:index[-1] + 1] for name, values in bars.items()}
+    return {name: values[index] for name, values in bars.items()}
+
+class StrategyObjective:
+    """
+    Default objective: train a strategy on the training bars and backtest
+    its ``predict_batch`` decisions on the test bars.
+
+    Must be picklable, so the factory should be a module-level callable.
+    """
+
+    def __init__(self,
+                 strategy_factory: Callable[..., BaseStrategy],
+                 feature_columns: Sequence[str],
+                 backtest_config: Optional[BacktestConfig] = None):
+        """Initialize objective.
+
+        Args:
+            strategy_factory: Callable building a strategy from a parameter set
+            feature_columns: Bar columns passed to the strategy as state
+            backtest_config: Backtest configuration for the test window
+        """
+        self.strategy_factory = strategy_factory
+        self.feature_columns = list(feature_columns)
+        self.backtest_config = backtest_config or BacktestConfig()
+
+    def __call__(self, params: Dict[str, Any], train: Bars, test: Bars) -> Dict[str, float]:
+        strategy = self.strategy_factory(**params)
+        strategy.train({'bars': train})
+        states = np.column_stack([test[name] for name in self.feature_columns])
+        result = VectorizedBacktester(self.backtest_config).run(
+            test, strategy=strategy, states=states, feature_names=self.feature_columns
+        )
+        return result.stats
+
+def split_hash(split: Split) -> str:
+    """Content hash of a split's train and test indices.
+
+    Args:
+        split: Fold split
+
+    Returns:
+        Hash string
+    """
+    return checkpoint_hash({
+        'train': np.ascontiguousarray(split.train, dtype=np.int64),
+        'test': np.ascontiguousarray(split.test, dtype=np.int64)
+    })
+
+def objective_hash(objective: Callable[..., Any]) -> str:
+    """Hash identifying an objective: its pickled form plus function bytecode.
+
+    Args:
+        objective: Picklable objective callable
+
+    Returns:
+        Hash string
+    """
+    code = getattr(objective, '__code__', None) or getattr(type(objective).__call__, '__code__', None)
+    return compute_hash(pickle.dumps(objective) + (code.co_code if code is not None else b''))
+
+def _run_job(
+    objective: Callable[[Dict[str, Any], Bars, Bars], Dict[str, float]],
+    data_dir: str,
+    columns: Sequence[str],
+    params: Dict[str, Any],
+    split: Split
+) -> Tuple[Dict[str, float], float]:
+    """Evaluate one parameter set on one fold in a worker process."""
+    start = time.perf_counter()
+    # Memory-mapped, read-only: workers share the page cache instead of copies
+    bars = {name: np.load(os.path.join(data_dir, f"{name}.npy"), mmap_mode='r') for name in columns}
+    metrics = objective(params, _take(bars, split.train), _take(bars, split.test))
+    return metrics, time.perf_counter() - start
+
+class WalkForwardRunner:
+    """Runs parameter sets over folds in a process pool with resumable results.
+
+    Results are keyed by parameter set, fold boundaries and objective, so a
+    rerun in the same ``work_dir`` with different splits or a different
+    objective recomputes instead of reusing stale fold results.
+    """
+
+    def __init__(self,
+                 objective: Callable[[Dict[str, Any], Bars, Bars], Dict[str, float]],
+                 param_grid: Union[Dict[str, Sequence[Any]], Sequence[Dict[str, Any]]],
+                 splits: Sequence[Split],
+                 work_dir: str,
+                 max_workers: Optional[int] = None,
+                 rank_metric: str = 'sharpe',
+                 resume: bool = True):
+        """Initialize runner.
+
+        Args:
+            objective: Picklable callable ``(params, train_bars, test_bars)``
+                returning out-of-sample metrics
+            param_grid: Parameter grid or list of parameter sets
+            splits: Folds from ``walk_forward_splits`` or ``purged_kfold_splits``
+            work_dir: Directory for the memory-mapped bars and result log
+            max_workers: Number of worker processes
+            rank_metric: Metric used to rank parameter sets (higher is better)
+            resume: Skip jobs already recorded in the result log
+        """
+        self.objective = objective
+        self.param_sets = expand_param_grid(param_grid)
+        self.splits = list(splits)
+        self.work_dir = Path(work_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.rank_metric = rank_metric
+        self.resume = resume
+        self.results_path = self.work_dir / 'results.jsonl'
+        self.data_dir = self.work_dir / 'bars'
+        self.fold_results = pd.DataFrame()
+        self._objective_id = objective_hash(objective)[:16]
+        self._split_ids = [split_hash(split)[:16] for split in self.splits]
+
+    def _job_key(self, params_id: str, index: int) -> str:
+        """Result log key of one parameter set on one split."""
+        return f"{params_id}:{self.splits[index].fold}:{self._split_ids[index]}:{self._objective_id}"
+
+    def _prepare_data(self, bars: Union[pd.DataFrame, Bars]) -> List[str]:
+        """Write bars as .npy files for memory-mapping by workers."""
+        columns = list(bars.keys()) if isinstance(bars, dict) else list(bars.columns)
+        arrays = {name: np.ascontiguousarray(np.asarray(bars[name], dtype=np.float64)) for name in columns}
+        manifest = {
+            'columns': columns,
+            'length': int(len(arrays[columns[0]])),
+            'checksum': checkpoint_hash(arrays)
+        }
+
+        ensure_directory(str(self.data_dir))
+        manifest_path = self.data_dir / 'manifest.json'
+        if manifest_path.exists() and json.loads(manifest_path.read_text()) == manifest:
+            return columns
+
+        # Different data invalidates earlier results
+        if self.results_path.exists():
+            self.results_path.unlink()
+        for name, values in arrays.items():
+            np.save(self.data_dir / f"{name}.npy", values)
+        manifest_path.write_text(json.dumps(manifest))
+        return columns
+
+    def _load_completed(self) -> Dict[str, Dict[str, Any]]:
+        """Read finished jobs from the result log."""
+        completed = {}
+        if self.resume and self.results_path.exists():
+            with open(self.results_path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partially written line from an interrupted run
+                        continue
+                    completed[record['job']] = record
+        return completed
+
+    def _terminate_log(self) -> None:
+        """End a torn last line so appended records start on a line of their own."""
+        if self.results_path.exists() and self.results_path.stat().st_size:
+            with open(self.results_path, 'rb+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+
+    def run(self, bars: Union[pd.DataFrame, Bars]) -> pd.DataFrame:
+        """Evaluate every parameter set on every fold.
+
+        Args:
+            bars: Bar data (DataFrame or dict of equal-length arrays)
+
+        Returns:
+            Out-of-sample metrics aggregated per parameter set, best first
+        """
+        columns = self._prepare_data(bars)
+        completed = self._load_completed()
+
+        jobs = []
+        for params in self.param_sets:
+            params_id = compute_hash(params)
+            for index, split in enumerate(self.splits):
+                job = self._job_key(params_id, index)
+                if job not in completed:
+                    jobs.append((job, params_id, params, split))
+
+        if jobs:
+            logger.info(f"Running {len(jobs)} jobs ({len(completed)} resumed)")
+            self._terminate_log()
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool, \
+                    open(self.results_path, 'a') as log:
+                futures = {
+                    pool.submit(_run_job, self.objective, str(self.data_dir), columns, params, split):
+                        (job, params_id, params, split)
+                    for job, params_id, params, split in jobs
+                }
+                for future in as_completed(futures):
+                    job, params_id, params, split = futures[future]
+                    try:
+                        metrics, elapsed = future.result()
+                    except Exception as e:
+                        logger.error(f"Job {job} failed: {e}")
+                        continue
+                    record = {
+                        'job': job,
+                        'params_id': params_id,
+                        'params': params,
+                        'fold': split.fold,
+                        'metrics': {k: float(v) for k, v in metrics.items()},
+                        'elapsed': elapsed
+                    }
+                    log.write(json.dumps(record) + '\n')
+                    log.flush()
+                    completed[job] = record
+
+        wanted = {self._job_key(compute_hash(params), index)
+                  for params in self.param_sets for index in range(len(self.splits))}
+        return self.aggregate([record for job, record in completed.items() if job in wanted])
+
+    def aggregate(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Aggregate fold metrics per parameter set.
+
+        Args:
+            records: Job records from the result log
+
+        Returns:
+            DataFrame with mean/std/min of each metric, sorted by rank metric
+        """
+        if not records:
+            return pd.DataFrame()
+
+        self.fold_results = pd.DataFrame([
+            {'params_id': r['params_id'], 'fold': r['fold'], 'elapsed': r['elapsed'], **r['metrics']}
+            for r in records
+        ])
+        params = {r['params_id']: r['params'] for r in records}
+
+        metrics = self.fold_results.drop(columns=['fold'])
+        grouped = metrics.groupby('params_id')
+        summary = grouped.agg(['mean', 'std', 'min'])
+        summary.columns = [f"{metric}_{stat}" for metric, stat in summary.columns]
+        summary['n_folds'] = grouped.size()
+        summary['params'] = [params[pid] for pid in summary.index]
+
+        sort_key = f"{self.rank_metric}_mean"
+        if sort_key in summary:
+            summary = summary.sort_values(sort_key, ascending=False)
+        return summary
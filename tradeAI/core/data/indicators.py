@@ -4,8 +4,247 @@ Technical indicators for market data analysis.
 
 import pandas as pd
 import numpy as np
-from typing import Optional
+from functools import wraps
+from scipy.signal import lfilter
+from typing import Callable, Optional, Tuple
 
+from .precision import get_precision
+
+def _apply_precision(func: Callable) -> Callable:
+    """Cast indicator output to the active precision policy dtype."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs).astype(get_precision().dtype)
+    return wrapper
+
+def _recursive_smooth(
+    values: np.ndarray,
+    alpha: float,
+    seed_window: int = 1
+) -> np.ndarray:
+    """Apply first-order recursive smoothing y[t] = alpha * x[t] + (1 - alpha) * y[t-1].
+
+    The filter is seeded per column with the mean of the first ``seed_window``
+    valid observations, so leading NaNs (e.g. from ``diff``) are skipped.
+    Columns sharing the same first valid row are filtered in a single
+    ``lfilter`` call. Columns with NaNs after their first valid row are
+    filtered run by run like ``ewm(adjust=False)``: the state decays by
+    ``(1 - alpha) ** k`` across a gap of ``k`` steps before the next
+    observation is blended in, and gap rows repeat the last value.
+
+    Args:
+        values: 1-D array or 2-D array with time along axis 0
+        alpha: Smoothing factor in (0, 1]
+        seed_window: Number of observations averaged to seed the filter
+
+    Returns:
+        Smoothed array with the same shape as ``values``
+    """
+    x = np.asarray(values, dtype=get_precision().dtype)
+    squeeze = x.ndim == 1
+    if squeeze:
+        x = x[:, None]
+    n = x.shape[0]
+    out = np.full_like(x, np.nan)
+
+    valid = ~np.isnan(x)
+    first_valid = np.where(valid.any(axis=0), valid.argmax(axis=0), n)
+    has_gaps = (~valid & (np.arange(n)[:, None] > first_valid)).any(axis=0)
+
+    b = np.array([alpha], dtype=x.dtype)
+    a = np.array([1.0, alpha - 1.0], dtype=x.dtype)
+    for col in np.flatnonzero(has_gaps):
+        out[:, col] = _smooth_with_gaps(x[:, col], alpha, seed_window, b, a)
+    for start in np.unique(first_valid[~has_gaps]):
+        seed_idx = start + seed_window - 1
+        if seed_idx >= n:
+            continue
+        cols = np.flatnonzero((first_valid == start) & ~has_gaps)
+        seed = x[start:seed_idx + 1, cols].mean(axis=0)
+        out[seed_idx, cols] = seed
+        if seed_idx + 1 < n:
+            zi = ((1 - b[0]) * seed)[None, :]
+            out[seed_idx + 1:, cols], _ = lfilter(
+                b, a, x[seed_idx + 1:, cols], axis=0, zi=zi
+            )
+
+    return out[:, 0] if squeeze else out
+
+def _smooth_with_gaps(
+    x: np.ndarray,
+    alpha: float,
+    seed_window: int,
+    b: np.ndarray,
+    a: np.ndarray
+) -> np.ndarray:
+    """Recursive smoothing of one column with interior NaNs."""
+    out = np.full_like(x, np.nan)
+    idx = np.flatnonzero(~np.isnan(x))
+    if len(idx) < seed_window:
+        return out
+
+    last = idx[seed_window - 1]
+    y = x[idx[:seed_window]].mean()
+    out[last] = y
+    rest = idx[seed_window:]
+    for run in np.split(rest, np.flatnonzero(np.diff(rest) != 1) + 1):
+        if not len(run):
+            continue
+        # Same weights as pandas ewm(adjust=False), including its com == 1 case
+        decay = (1 - alpha) ** (run[0] - last)
+        weight = 1 - decay if alpha == 0.5 else alpha
+        y = (decay * y + weight * x[run[0]]) / (decay + weight)
+        out[run[0]] = y
+        if len(run) > 1:
+            out[run[1:]], _ = lfilter(b, a, x[run[1:]], zi=[(1 - alpha) * y])
+            y = out[run[-1]]
+        last = run[-1]
+
+    # Rows inside gaps repeat the last smoothed value
+    seeded = np.arange(len(x)) >= idx[seed_window - 1]
+    filled = np.where(~np.isnan(out))[0]
+    positions = np.searchsorted(filled, np.arange(len(x)), side='right') - 1
+    out[seeded] = out[filled[positions[seeded]]]
+    return out
+
+def iir_ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential Moving Average as an IIR filter.
+
+    Matches ``ewm(span=period, adjust=False).mean()`` and works on 2-D
+    arrays (time x columns) in one pass.
+
+    Args:
+        values: 1-D or 2-D array of values
+        period: EMA period
+
+    Returns:
+        EMA values
+    """
+    return _recursive_smooth(values, 2.0 / (period + 1))
+
+def iir_rma(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's running moving average (RMA / SMMA) as an IIR filter.
+
+    Seeded with the simple mean of the first ``period`` valid values and
+    smoothed with ``alpha = 1 / period`` afterwards.
+
+    Args:
+        values: 1-D or 2-D array of values
+        period: Smoothing period
+
+    Returns:
+        RMA values
+    """
+    return _recursive_smooth(values, 1.0 / period, seed_window=period)
+
+def iir_dema(values: np.ndarray, period: int) -> np.ndarray:
+    """Double Exponential Moving Average.
+
+    Args:
+        values: 1-D or 2-D array of values
+        period: EMA period
+
+    Returns:
+        DEMA values
+    """
+    ema1 = iir_ema(values, period)
+    ema2 = iir_ema(ema1, period)
+    return 2 * ema1 - ema2
+
+def iir_tema(values: np.ndarray, period: int) -> np.ndarray:
+    """Triple Exponential Moving Average.
+
+    Args:
+        values: 1-D or 2-D array of values
+        period: EMA period
+
+    Returns:
+        TEMA values
+    """
+    ema1 = iir_ema(values, period)
+    ema2 = iir_ema(ema1, period)
+    ema3 = iir_ema(ema2, period)
+    return 3 * ema1 - 3 * ema2 + ema3
+
+def iir_macd(
+    values: np.ndarray,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram from IIR EMAs.
+
+    Args:
+        values: 1-D or 2-D array of prices
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line period
+
+    Returns:
+        Tuple of (macd, signal, histogram) arrays
+    """
+    macd_line = iir_ema(values, fast_period) - iir_ema(values, slow_period)
+    signal_line = iir_ema(macd_line, signal_period)
+    return macd_line, signal_line, macd_line - signal_line
+
+def iir_rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's Relative Strength Index.
+
+    Average gains and losses are smoothed with :func:`iir_rma`.
+
+    Args:
+        values: 1-D or 2-D array of prices
+        period: RSI period
+
+    Returns:
+        RSI values
+    """
+    x = np.asarray(values, dtype=get_precision().dtype)
+    delta = np.empty_like(x)
+    delta[0] = np.nan
+    delta[1:] = x[1:] - x[:-1]
+
+    # clip keeps the leading NaN so the RMA seed starts at the first delta
+    avg_gain = iir_rma(np.clip(delta, 0, None), period)
+    avg_loss = iir_rma(np.clip(-delta, 0, None), period)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    # No losses over the window means maximum strength; no movement at all is neutral
+    rsi = np.where((avg_loss == 0) & (avg_gain > 0), x.dtype.type(100), rsi)
+    return np.where((avg_loss == 0) & (avg_gain == 0), x.dtype.type(50), rsi)
+
+def iir_atr(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14
+) -> np.ndarray:
+    """Wilder's Average True Range.
+
+    Args:
+        high: 1-D or 2-D array of highs
+        low: 1-D or 2-D array of lows
+        close: 1-D or 2-D array of closes
+        period: ATR period
+
+    Returns:
+        ATR values
+    """
+    dtype = get_precision().dtype
+    high = np.asarray(high, dtype=dtype)
+    low = np.asarray(low, dtype=dtype)
+    close = np.asarray(close, dtype=dtype)
+
+    tr = high - low
+    prev_close = close[:-1]
+    tr[1:] = np.fmax(
+        tr[1:],
+        np.fmax(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+    )
+    return iir_rma(tr, period)
+
+@_apply_precision
 def calculate_ma(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
     """Calculate Moving Average.
     
@@ -19,6 +258,7 @@ def calculate_ma(data: pd.DataFrame, period: int, column: str = 'close') -> pd.S
     """
     return data[column].rolling(window=period).mean()
 
+@_apply_precision
 def calculate_ema(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
     """Calculate Exponential Moving Average.
     
@@ -30,8 +270,37 @@ def calculate_ema(data: pd.DataFrame, period: int, column: str = 'close') -> pd.
     Returns:
         EMA values
     """
-    return data[column].ewm(span=period, adjust=False).mean()
+    return pd.Series(iir_ema(data[column].to_numpy(), period), index=data.index, name=column)
 
+@_apply_precision
+def calculate_dema(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
+    """Calculate Double Exponential Moving Average.
+    
+    Args:
+        data: Price data
+        period: EMA period
+        column: Price column name
+        
+    Returns:
+        DEMA values
+    """
+    return pd.Series(iir_dema(data[column].to_numpy(), period), index=data.index, name=column)
+
+@_apply_precision
+def calculate_tema(data: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
+    """Calculate Triple Exponential Moving Average.
+    
+    Args:
+        data: Price data
+        period: EMA period
+        column: Price column name
+        
+    Returns:
+        TEMA values
+    """
+    return pd.Series(iir_tema(data[column].to_numpy(), period), index=data.index, name=column)
+
+@_apply_precision
 def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'close') -> pd.Series:
     """Calculate Relative Strength Index.
     
@@ -50,6 +319,21 @@ def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'close') -
     rs = gain / loss
     return 100 - (100 / (1 + rs))
 
+@_apply_precision
+def calculate_rsi_wilder(data: pd.DataFrame, period: int = 14, column: str = 'close') -> pd.Series:
+    """Calculate Relative Strength Index with Wilder smoothing.
+    
+    Args:
+        data: Price data
+        period: RSI period
+        column: Price column name
+        
+    Returns:
+        RSI values
+    """
+    return pd.Series(iir_rsi(data[column].to_numpy(), period), index=data.index, name=column)
+
+@_apply_precision
 def calculate_macd(
     data: pd.DataFrame,
     fast_period: int = 12,
@@ -69,19 +353,20 @@ def calculate_macd(
     Returns:
         DataFrame with MACD line, signal line and histogram
     """
-    fast_ema = calculate_ema(data, fast_period, column)
-    slow_ema = calculate_ema(data, slow_period, column)
-    
-    macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-    histogram = macd_line - signal_line
+    macd_line, signal_line, histogram = iir_macd(
+        data[column].to_numpy(),
+        fast_period,
+        slow_period,
+        signal_period
+    )
     
     return pd.DataFrame({
         'macd': macd_line,
         'signal': signal_line,
         'histogram': histogram
-    })
+    }, index=data.index)
 
+@_apply_precision
 def calculate_bollinger_bands(
     data: pd.DataFrame,
     period: int = 20,
@@ -111,6 +396,7 @@ def calculate_bollinger_bands(
         'lower': lower_band
     })
 
+@_apply_precision
 def calculate_atr(
     data: pd.DataFrame,
     period: int = 14
@@ -135,6 +421,29 @@ def calculate_atr(
     tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
     return tr.rolling(window=period).mean()
 
+@_apply_precision
+def calculate_atr_wilder(
+    data: pd.DataFrame,
+    period: int = 14
+) -> pd.Series:
+    """Calculate Average True Range with Wilder smoothing.
+    
+    Args:
+        data: Price data with high, low, close columns
+        period: ATR period
+        
+    Returns:
+        ATR values
+    """
+    atr = iir_atr(
+        data['high'].to_numpy(),
+        data['low'].to_numpy(),
+        data['close'].to_numpy(),
+        period
+    )
+    return pd.Series(atr, index=data.index)
+
+@_apply_precision
 def calculate_stochastic(
     data: pd.DataFrame,
     k_period: int = 14,
@@ -164,6 +473,7 @@ def calculate_stochastic(
         'd': d
     })
 
+@_apply_precision
 def calculate_obv(data: pd.DataFrame) -> pd.Series:
     """Calculate On-Balance Volume.
     
@@ -189,6 +499,7 @@ def calculate_obv(data: pd.DataFrame) -> pd.Series:
     
     return obv
 
+@_apply_precision
 def calculate_vwap(data: pd.DataFrame) -> pd.Series:
     """Calculate Volume Weighted Average Price.
     
@@ -201,6 +512,7 @@ def calculate_vwap(data: pd.DataFrame) -> pd.Series:
     typical_price = (data['high'] + data['low'] + data['close']) / 3
     return (typical_price * data['volume']).cumsum() / data['volume'].cumsum()
 
+@_apply_precision
 def calculate_momentum(
     data: pd.DataFrame,
     period: int = 14,
@@ -218,6 +530,7 @@ def calculate_momentum(
     """
     return data[column].diff(period)
 
+@_apply_precision
 def calculate_williams_r(
     data: pd.DataFrame,
     period: int = 14
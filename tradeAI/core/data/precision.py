@@ -0,0 +1,168 @@
+"""
+Numeric precision policy and memory-lean dtypes for market data.
+
+Indicator functions in :mod:`indicators` and :class:`DataPipeline` read the
+active policy. With ``float_dtype='float32'`` recursive kernels (EMA, RMA,
+DEMA/TEMA, MACD, Wilder RSI/ATR) run entirely in single precision. Their
+rounding error stays bounded because the filter pole is below one: relative
+error is at most about ``period * 6e-8`` of the price level (below 1e-5 for
+periods up to 100), and Wilder RSI stays within 1e-3 RSI points of the
+float64 result. Rolling-window indicators computed through pandas keep a
+float64 accumulator and are only stored as float32, so they lose nothing
+beyond the final rounding (relative error below 6e-8).
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Iterator, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+from ...utils.tools import format_size
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """Dtype policy for indicator computation and ingested frames."""
+    float_dtype: str = 'float64'
+    downcast_integers: bool = True
+    downcast_volume: bool = True
+    categorical_columns: Sequence[str] = ('symbol',)
+    volume_columns: Sequence[str] = ('volume',)
+
+    def __post_init__(self):
+        if self.float_dtype not in ('float32', 'float64'):
+            raise ValueError(f"Unsupported float dtype: {self.float_dtype}")
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Numpy float dtype of the policy."""
+        return np.dtype(self.float_dtype)
+
+_policy = PrecisionPolicy()
+
+def get_precision() -> PrecisionPolicy:
+    """Get the active precision policy.
+
+    Returns:
+        Active PrecisionPolicy
+    """
+    return _policy
+
+def set_precision(policy: Union[PrecisionPolicy, str]) -> PrecisionPolicy:
+    """Set the active precision policy.
+
+    Args:
+        policy: PrecisionPolicy or float dtype name ('float32' / 'float64')
+
+    Returns:
+        Previously active policy
+    """
+    global _policy
+    previous = _policy
+    if isinstance(policy, str):
+        policy = replace(_policy, float_dtype=policy)
+    _policy = policy
+    return previous
+
+@contextmanager
+def precision(policy: Union[PrecisionPolicy, str]) -> Iterator[PrecisionPolicy]:
+    """Temporarily switch the precision policy.
+
+    Args:
+        policy: PrecisionPolicy or float dtype name
+
+    Yields:
+        The policy in effect inside the block
+    """
+    previous = set_precision(policy)
+    try:
+        yield _policy
+    finally:
+        set_precision(previous)
+
+def _downcast_integer(series: pd.Series, arithmetic_safe: bool = False) -> pd.Series:
+    """Downcast an integer-valued series to the smallest integer dtype.
+
+    With ``arithmetic_safe`` the result is signed and at least 32 bits, so
+    later arithmetic neither wraps below zero nor overflows a tiny type.
+    """
+    if arithmetic_safe:
+        result = pd.to_numeric(series, downcast='integer')
+        return result.astype(np.int32) if result.dtype.itemsize < 4 else result
+    downcast = 'unsigned' if series.min() >= 0 else 'integer'
+    return pd.to_numeric(series, downcast=downcast)
+
+def optimize_dtypes(
+    data: pd.DataFrame,
+    policy: Optional[PrecisionPolicy] = None,
+    arithmetic_safe: bool = False
+) -> pd.DataFrame:
+    """Convert a frame to memory-lean dtypes.
+
+    Float columns follow the policy float dtype, integer columns and
+    integral volumes are downcast to the smallest integer type that holds
+    them, and symbol-like string columns become categoricals.
+
+    Args:
+        data: Input DataFrame
+        policy: Precision policy (defaults to the active one)
+        arithmetic_safe: Only downcast integers to signed types of at least
+            32 bits and keep integral volumes as int64, for frames that
+            further computation is applied to
+
+    Returns:
+        DataFrame with optimized dtypes
+    """
+    policy = policy or _policy
+    result = data.copy()
+
+    for column in result.columns:
+        series = result[column]
+        if column in policy.categorical_columns and not isinstance(series.dtype, pd.CategoricalDtype):
+            result[column] = series.astype('category')
+        elif column in policy.volume_columns and pd.api.types.is_numeric_dtype(series):
+            if not policy.downcast_volume or series.isna().any():
+                result[column] = series.astype(policy.dtype)
+            elif pd.api.types.is_integer_dtype(series) or np.all(np.mod(series, 1) == 0):
+                # Volumes are scaled by prices and sizes, so keep them 64-bit on such frames
+                volume = series.astype(np.int64)
+                result[column] = volume if arithmetic_safe else _downcast_integer(volume)
+            else:
+                result[column] = series.astype(policy.dtype)
+        elif pd.api.types.is_bool_dtype(series):
+            continue
+        elif pd.api.types.is_integer_dtype(series):
+            if policy.downcast_integers and len(series):
+                result[column] = _downcast_integer(series, arithmetic_safe)
+        elif pd.api.types.is_float_dtype(series):
+            result[column] = series.astype(policy.dtype)
+
+    return result
+
+def memory_report(data: pd.DataFrame) -> Dict[str, Any]:
+    """Report memory usage of a frame.
+
+    Args:
+        data: DataFrame to inspect
+
+    Returns:
+        Dictionary with per-column bytes and dtypes plus totals
+    """
+    usage = data.memory_usage(deep=True)
+    total = int(usage.sum())
+    return {
+        'columns': {
+            str(column): {
+                'dtype': str(data[column].dtype),
+                'bytes': int(usage[column])
+            }
+            for column in data.columns
+        },
+        'index_bytes': int(usage['Index']),
+        'total_bytes': total,
+        'total': format_size(total),
+        'bytes_per_row': total / len(data) if len(data) else 0.0
+    }
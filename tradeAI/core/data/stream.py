@@ -14,6 +14,8 @@ from queue import Queue
 from threading import Thread
 from datetime import datetime
 
+from .precision import PrecisionPolicy, optimize_dtypes, memory_report
+
 logger = logging.getLogger(__name__)
 
 class DataSource(ABC):
@@ -129,6 +131,7 @@ class DataStream:
         self.data_buffer = Queue(maxsize=buffer_size)
         self.running = False
         self.processing_thread = None
+        self.consumers: List[Callable] = []
     
     def add_source(self, name: str, source: DataSource) -> None:
         """Add data source.
@@ -147,6 +150,16 @@ class DataStream:
         """
         self.processors.append(processor)
     
+    def add_consumer(self, consumer: Callable) -> None:
+        """Add consumer of processed data.
+        
+        Consumers run on the processing thread and should return quickly.
+        
+        Args:
+            consumer: Callable receiving each processed item
+        """
+        self.consumers.append(consumer)
+    
     async def start(self) -> None:
         """Start data streaming."""
         if self.running:
@@ -191,15 +204,33 @@ class DataStream:
     
     def _emit_data(self, data: Any) -> None:
         """Emit processed data."""
-        # Implement your data emission logic here
-        pass
+        for consumer in self.consumers:
+            try:
+                consumer(data)
+            except Exception as e:
+                logger.error(f"Data consumer error: {e}")
 
 class DataPipeline:
     """Data processing pipeline."""
     
-    def __init__(self):
-        """Initialize data pipeline."""
+    def __init__(
+        self,
+        precision: Optional[PrecisionPolicy] = None,
+        optimize_memory: bool = False
+    ):
+        """Initialize data pipeline.
+        
+        Args:
+            precision: Precision policy for ingested frames (defaults to the
+                active policy)
+            optimize_memory: Convert ingested frames to memory-lean dtypes.
+                When processing steps are registered, integers are only
+                downcast to signed types of at least 32 bits and volumes
+                stay 64-bit.
+        """
         self.steps: List[Callable] = []
+        self.precision = precision
+        self.optimize_memory = optimize_memory
     
     def add_step(self, step: Callable) -> None:
         """Add processing step.
@@ -218,7 +249,10 @@ class DataPipeline:
         Returns:
             Processed DataFrame
         """
-        result = data.copy()
+        if self.optimize_memory:
+            result = optimize_dtypes(data, self.precision, arithmetic_safe=bool(self.steps))
+        else:
+            result = data.copy()
         for step in self.steps:
             try:
                 result = step(result)
@@ -226,6 +260,23 @@ class DataPipeline:
                 logger.error(f"Pipeline step failed: {e}")
                 raise
         return result
+    
+    def memory_report(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Report memory usage of a frame before and after ingestion.
+        
+        Args:
+            data: Raw input DataFrame
+            
+        Returns:
+            Dictionary with raw and optimized memory reports
+        """
+        raw = memory_report(data)
+        optimized = memory_report(optimize_dtypes(data, self.precision, arithmetic_safe=bool(self.steps)))
+        return {
+            'raw': raw,
+            'optimized': optimized,
+            'reduction': 1 - optimized['total_bytes'] / raw['total_bytes']
+        }
 
 class MarketDataStream(DataStream):
     """Market data streaming with technical indicators."""
@@ -0,0 +1,268 @@
+"""
+Parallel indicator computation for large symbol universes.
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import psutil
+
+from .indicators import iir_ema, iir_macd, iir_rsi, iir_atr
+from .precision import PrecisionPolicy, get_precision, precision
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average along axis 0 using cumulative sums."""
+    out = np.full(values.shape, np.nan, dtype=values.dtype)
+    if len(values) >= period:
+        # Accumulate in float64 so long float32 histories do not drift
+        csum = np.cumsum(values, axis=0, dtype=np.float64)
+        out[period - 1] = csum[period - 1]
+        out[period:] = csum[period:] - csum[:-period]
+        out[period - 1:] /= period
+    return out
+
+def compute_default_indicators(bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Compute the standard end-of-day indicator set.
+
+    Args:
+        bars: Field name to array of shape (time, symbols)
+
+    Returns:
+        Indicator name to array of shape (time, symbols)
+    """
+    close = bars['close']
+    macd, signal, histogram = iir_macd(close)
+    return {
+        'ma_20': _rolling_mean(close, 20),
+        'ema_12': iir_ema(close, 12),
+        'ema_26': iir_ema(close, 26),
+        'macd': macd,
+        'macd_signal': signal,
+        'macd_histogram': histogram,
+        'rsi_14': iir_rsi(close, 14),
+        'atr_14': iir_atr(bars['high'], bars['low'], close, 14)
+    }
+
+@dataclass
+class ShardReport:
+    """Timing and memory usage of one shard."""
+    shard_id: int
+    n_symbols: int
+    n_rows: int
+    wall_time: float
+    cpu_time: float
+    rss_bytes: int
+    rss_delta_bytes: int
+    pid: int
+
+def _compute_shard(
+    shard_id: int,
+    input_name: str,
+    input_shape: Tuple[int, int],
+    output_name: str,
+    output_shape: Tuple[int, int],
+    fields: Sequence[str],
+    outputs: Sequence[str],
+    segments: Sequence[Tuple[int, int]],
+    indicator_fn: Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]],
+    policy: PrecisionPolicy
+) -> ShardReport:
+    """Compute indicators for a shard of symbols in a worker process.
+
+    Bars are read from and results written to shared memory, so only the
+    segment offsets and the report cross the process boundary.
+    """
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    process = psutil.Process()
+    start_rss = process.memory_info().rss
+
+    input_shm = shared_memory.SharedMemory(name=input_name)
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        bars = np.ndarray(input_shape, dtype=policy.dtype, buffer=input_shm.buf)
+        result = np.ndarray(output_shape, dtype=policy.dtype, buffer=output_shm.buf)
+
+        # Symbols with equal history length are stacked and computed together
+        by_length: Dict[int, List[int]] = {}
+        for offset, length in segments:
+            by_length.setdefault(length, []).append(offset)
+
+        n_rows = 0
+        for length, offsets in by_length.items():
+            rows = np.asarray(offsets)[None, :] + np.arange(length)[:, None]
+            block = {
+                field: bars[rows, i]
+                for i, field in enumerate(fields)
+            }
+            with precision(policy):
+                values = indicator_fn(block)
+            for j, name in enumerate(outputs):
+                result[rows, j] = values[name]
+            n_rows += length * len(offsets)
+    finally:
+        input_shm.close()
+        output_shm.close()
+
+    rss = process.memory_info().rss
+    return ShardReport(
+        shard_id=shard_id,
+        n_symbols=len(segments),
+        n_rows=n_rows,
+        wall_time=time.perf_counter() - start_wall,
+        cpu_time=time.process_time() - start_cpu,
+        rss_bytes=rss,
+        rss_delta_bytes=rss - start_rss,
+        pid=os.getpid()
+    )
+
+class UniverseIndicatorExecutor:
+    """Computes indicators for many symbols across a process pool."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shards_per_worker: int = 4,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        indicator_fn: Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]] = compute_default_indicators
+    ):
+        """Initialize universe executor.
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            shards_per_worker: Shards per worker, for load balancing
+            fields: Bar columns shipped to workers
+            indicator_fn: Module-level function mapping field arrays of shape
+                (time, symbols) to indicator arrays of the same shape
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.fields = list(fields)
+        self.indicator_fn = indicator_fn
+        self.shard_reports: List[ShardReport] = []
+
+    def run(self, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Compute indicators for every symbol and merge into one panel.
+
+        Args:
+            frames: Symbol to bar DataFrame, as returned by
+                ``DataSource.get_historical_data``
+
+        Returns:
+            DataFrame indexed by (symbol, original index) holding the bar
+            fields followed by the indicator columns
+        """
+        symbols = [s for s, df in frames.items() if len(df)]
+        if not symbols:
+            return pd.DataFrame()
+
+        lengths = np.array([len(frames[s]) for s in symbols])
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        total_rows = int(lengths.sum())
+
+        policy = get_precision()
+        itemsize = policy.dtype.itemsize
+        outputs = self._output_names(frames[symbols[0]])
+        input_shape = (total_rows, len(self.fields))
+        output_shape = (total_rows, len(outputs))
+
+        input_shm = shared_memory.SharedMemory(create=True, size=max(1, itemsize * total_rows * len(self.fields)))
+        output_shm = shared_memory.SharedMemory(create=True, size=max(1, itemsize * total_rows * len(outputs)))
+        try:
+            bars = np.ndarray(input_shape, dtype=policy.dtype, buffer=input_shm.buf)
+            for symbol, offset, length in zip(symbols, offsets, lengths):
+                bars[offset:offset + length] = self._field_matrix(frames[symbol])
+
+            n_shards = min(len(symbols), self.max_workers * self.shards_per_worker)
+            shards = np.array_split(np.arange(len(symbols)), n_shards)
+
+            self.shard_reports = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [
+                    pool.submit(
+                        _compute_shard,
+                        shard_id,
+                        input_shm.name,
+                        input_shape,
+                        output_shm.name,
+                        output_shape,
+                        self.fields,
+                        outputs,
+                        [(int(offsets[i]), int(lengths[i])) for i in shard],
+                        self.indicator_fn,
+                        policy
+                    )
+                    for shard_id, shard in enumerate(shards)
+                ]
+                for future in futures:
+                    self.shard_reports.append(future.result())
+
+            result = np.ndarray(output_shape, dtype=policy.dtype, buffer=output_shm.buf)
+            panel = pd.DataFrame(
+                np.hstack([bars, result]),
+                columns=self.fields + outputs
+            )
+        finally:
+            input_shm.close()
+            input_shm.unlink()
+            output_shm.close()
+            output_shm.unlink()
+
+        panel.index = pd.MultiIndex.from_arrays(
+            [
+                np.repeat(symbols, lengths),
+                np.concatenate([frames[s].index.to_numpy() for s in symbols])
+            ],
+            names=['symbol', None]
+        )
+        return panel
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get timing and memory report of the last run.
+
+        Returns:
+            Dictionary with per-shard reports and totals
+        """
+        shards = [asdict(report) for report in self.shard_reports]
+        if not shards:
+            return {'shards': [], 'totals': {}}
+
+        wall = np.array([s['wall_time'] for s in shards])
+        return {
+            'shards': shards,
+            'totals': {
+                'n_shards': len(shards),
+                'n_symbols': sum(s['n_symbols'] for s in shards),
+                'cpu_time': sum(s['cpu_time'] for s in shards),
+                'max_wall_time': float(wall.max()),
+                'mean_wall_time': float(wall.mean()),
+                'max_rss_bytes': max(s['rss_bytes'] for s in shards)
+            }
+        }
+
+    def _field_matrix(self, frame: pd.DataFrame) -> np.ndarray:
+        """Extract bar fields as a float matrix, NaN for missing columns."""
+        dtype = get_precision().dtype
+        return np.column_stack([
+            frame[field].to_numpy(dtype=dtype) if field in frame
+            else np.full(len(frame), np.nan, dtype=dtype)
+            for field in self.fields
+        ])
+
+    def _output_names(self, frame: pd.DataFrame) -> List[str]:
+        """Determine indicator column names from a sample symbol."""
+        sample = self._field_matrix(frame)
+        values = self.indicator_fn({
+            field: sample[:, [i]] for i, field in enumerate(self.fields)
+        })
+        return list(values.keys())
@@ -0,0 +1,229 @@
+"""
+Sliding-window datasets and a prefetching batch loader over columnar bars.
+"""
+
+import os
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+class WindowDataset:
+    """
+    Fixed-length windows over columnar bar arrays without copying.
+
+    Each column is viewed through ``sliding_window_view``, so the dataset
+    itself holds no window data; windows are materialized only when a
+    batch is gathered. Columns may be memory-mapped ``.npy`` files, in
+    which case only the pages a batch touches are read.
+
+    Window ``i`` covers rows ``[i * stride, i * stride + window)``; its
+    target (if any) is the target column ``horizon`` rows after the last
+    row of the window.
+    """
+
+    def __init__(self,
+                 columns: Union[Dict[str, np.ndarray], pd.DataFrame],
+                 window: int,
+                 stride: int = 1,
+                 features: Optional[Sequence[str]] = None,
+                 target: Optional[str] = None,
+                 horizon: int = 1):
+        """Initialize dataset.
+
+        Args:
+            columns: Column name to array of shape (T,), or a DataFrame
+            window: Rows per window
+            stride: Rows between consecutive windows
+            features: Columns included in each window (defaults to all but
+                the target)
+            target: Column providing the label of each window
+            horizon: Rows between the end of a window and its label
+        """
+        if isinstance(columns, pd.DataFrame):
+            columns = {name: columns[name].to_numpy() for name in columns.columns}
+        if features is None:
+            features = [name for name in columns if name != target]
+        self.features = list(features)
+        if not self.features:
+            raise ValueError("No feature columns")
+        self.columns = {name: columns[name] for name in dict.fromkeys(self.features + ([target] if target else []))}
+        self.window = window
+        self.stride = stride
+        self.target = target
+        self.horizon = horizon if target is not None else 0
+
+        length = len(columns[self.features[0]])
+        if any(len(columns[name]) != length for name in self.features):
+            raise ValueError("All columns must have the same length")
+        usable = length - self.horizon
+        if usable < window:
+            raise ValueError("Not enough rows for a single window")
+        self.n_windows = (usable - window) // stride + 1
+
+        # (n_windows, window) views, one per feature column
+        self._views = [sliding_window_view(columns[name], window)[::stride] for name in self.features]
+        self._targets = None
+        if target is not None:
+            start = window - 1 + self.horizon
+            self._targets = columns[target][start:start + (self.n_windows - 1) * stride + 1:stride]
+
+    @classmethod
+    def from_directory(cls, path: str, window: int, columns: Optional[Sequence[str]] = None, **kwargs) -> 'WindowDataset':
+        """Memory-map one ``<column>.npy`` file per column.
+
+        Args:
+            path: Directory of ``.npy`` column files
+            window: Rows per window
+            columns: Columns to load (defaults to every file)
+            **kwargs: Arguments for WindowDataset
+
+        Returns:
+            WindowDataset
+        """
+        if columns is None:
+            columns = sorted(name[:-4] for name in os.listdir(path) if name.endswith('.npy'))
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in columns}
+        return cls(arrays, window, **kwargs)
+
+    def __len__(self) -> int:
+        return self.n_windows
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of one window: (window, n_features)."""
+        return (self.window, len(self.features))
+
+    def gather(self, indices: np.ndarray, dtype: Any = np.float32) -> Dict[str, np.ndarray]:
+        """Copy the selected windows into one contiguous batch.
+
+        Args:
+            indices: Window indices
+            dtype: Output dtype
+
+        Returns:
+            Dictionary with ``x`` of shape (n, window, n_features) and, with
+            a target, ``y`` of shape (n,)
+        """
+        indices = np.asarray(indices)
+        x = np.empty((len(indices), self.window, len(self.features)), dtype=dtype)
+        # Sorted reads keep memory-mapped access sequential
+        order = np.argsort(indices, kind='stable')
+        sorted_indices = indices[order]
+        for j, view in enumerate(self._views):
+            x[order, :, j] = view[sorted_indices]
+        batch = {'x': x}
+        if self._targets is not None:
+            batch['y'] = np.asarray(self._targets[indices], dtype=dtype)
+        return batch
+
+class WindowLoader:
+    """
+    Shuffles and batches a WindowDataset on background threads.
+
+    Up to ``prefetch`` batches are gathered ahead of the consumer by
+    ``num_workers`` threads (NumPy releases the GIL while copying), so the
+    training loop does not wait for data. Batches come out in a
+    deterministic order for a given seed and epoch.
+    """
+
+    def __init__(self,
+                 dataset: WindowDataset,
+                 batch_size: int = 256,
+                 shuffle: bool = True,
+                 drop_last: bool = False,
+                 prefetch: int = 4,
+                 num_workers: int = 2,
+                 as_torch: bool = False,
+                 pin_memory: bool = False,
+                 seed: Optional[int] = None):
+        """Initialize loader.
+
+        Args:
+            dataset: Window dataset
+            batch_size: Windows per batch
+            shuffle: Shuffle windows every epoch
+            drop_last: Drop the final incomplete batch
+            prefetch: Batches gathered ahead of the consumer
+            num_workers: Gathering threads
+            as_torch: Yield torch tensors instead of arrays
+            pin_memory: Page-lock torch batches for fast host-to-GPU copies
+                (ignored without CUDA)
+            seed: Random seed for shuffling
+        """
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = max(1, prefetch)
+        self.num_workers = max(1, num_workers)
+        self.as_torch = as_torch or pin_memory
+        self.pin_memory = pin_memory
+        self.rng = np.random.default_rng(seed)
+
+        self.epoch = 0
+        self.wait_time = 0.0
+        self.gather_time = 0.0
+        self.n_batches = 0
+
+    def __len__(self) -> int:
+        n = len(self.dataset)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def _batch_indices(self) -> List[np.ndarray]:
+        n = len(self.dataset)
+        order = self.rng.permutation(n) if self.shuffle else np.arange(n)
+        batches = [order[i:i + self.batch_size] for i in range(0, n, self.batch_size)]
+        if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+            batches.pop()
+        return batches
+
+    def _load(self, indices: np.ndarray) -> Dict[str, Any]:
+        start = time.perf_counter()
+        batch = self.dataset.gather(indices)
+        if self.as_torch:
+            import torch
+            batch = {name: torch.from_numpy(values) for name, values in batch.items()}
+            if self.pin_memory and torch.cuda.is_available():
+                batch = {name: values.pin_memory() for name, values in batch.items()}
+        self.gather_time += time.perf_counter() - start
+        return batch
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        batches = self._batch_indices()
+        self.epoch += 1
+        with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix='window-loader') as pool:
+            pending = deque()
+            next_batch = 0
+            while next_batch < len(batches) and len(pending) < self.prefetch:
+                pending.append(pool.submit(self._load, batches[next_batch]))
+                next_batch += 1
+            while pending:
+                start = time.perf_counter()
+                batch = pending.popleft().result()
+                self.wait_time += time.perf_counter() - start
+                if next_batch < len(batches):
+                    pending.append(pool.submit(self._load, batches[next_batch]))
+                    next_batch += 1
+                self.n_batches += 1
+                yield batch
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get loader statistics.
+
+        Returns:
+            Dictionary with batch counts and consumer wait vs gather time
+        """
+        return {
+            'epochs': self.epoch,
+            'n_batches': self.n_batches,
+            'wait_time': self.wait_time,
+            'gather_time': self.gather_time,
+            'mean_wait': self.wait_time / self.n_batches if self.n_batches else 0.0
+        }
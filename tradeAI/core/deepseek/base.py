@@ -138,19 +138,70 @@ class DeepSeekDistill(DeepSeekBase):
 class DeepSeekAPI:
     """
     Main interface for interacting with DeepSeek's API services.
+    
+    Synchronous facade over AsyncDeepSeekClient: requests run on a private
+    event loop thread that owns one pooled session, so keep-alive
+    connections are reused across calls. Async callers should use
+    ``client`` directly from their own loop instead.
     """
     
-    def __init__(self, api_key: str, api_url: Optional[str] = None):
+    def __init__(self,
+                 api_key: str,
+                 api_url: Optional[str] = None,
+                 config: Optional[Any] = None,
+                 cache: Optional[Any] = None,
+                 rate_limiter: Optional[Any] = None):
         """
         Initialize DeepSeek API connection.
         
         Args:
             api_key: DeepSeek API key
             api_url: Optional custom API endpoint
+            config: Optional ClientConfig with pool, timeout and concurrency
+                settings
+            cache: Optional ResponseCache for repeated requests
+            rate_limiter: Optional RateLimiter shared by all calls
         """
+        from .client import AsyncDeepSeekClient
         self.api_key = api_key
         self.api_url = api_url or "https://api.deepseek.ai"
+        self.client = AsyncDeepSeekClient(api_key, self.api_url, config, cache, rate_limiter)
+        self._loop = None
+    
+    def __enter__(self) -> 'DeepSeekAPI':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def run(self, coro: Any) -> Any:
+        """
+        Run a client coroutine on the API's event loop thread.
+        
+        Args:
+            coro: Coroutine using ``client``
+            
+        Returns:
+            Result of the coroutine
+        """
+        if self._loop is None:
+            from .client import LoopThread
+            self._loop = LoopThread()
+        return self._loop.run(coro)
+    
+    def fan_out(self, func: Any, items: List[Any]) -> List[Any]:
+        """
+        Run one client call per item concurrently.
         
+        Args:
+            func: Coroutine function called with each item
+            items: Items, e.g. symbols
+            
+        Returns:
+            Results (or exceptions) in item order
+        """
+        return self.run(self.client.fan_out(func, items))
+    
     def get_rl_interface(self) -> DeepSeekRL:
         """
         Get interface for DeepSeek's RL capabilities.
@@ -158,18 +209,25 @@ class DeepSeekAPI:
         Returns:
             DeepSeekRL interface
         """
-        # Implementation would initialize and return a concrete DeepSeekRL instance
-        pass
+        from .client import RemoteDeepSeekRL
+        return RemoteDeepSeekRL(self)
     
-    def get_distill_interface(self) -> DeepSeekDistill:
+    def get_distill_interface(self, local: bool = False) -> DeepSeekDistill:
         """
         Get interface for DeepSeek's model distillation capabilities.
         
+        Args:
+            local: Distill torch models on the local CPU instead of
+                through the API
+        
         Returns:
             DeepSeekDistill interface
         """
-        # Implementation would initialize and return a concrete DeepSeekDistill instance
-        pass
+        if local:
+            from .distill import LocalDeepSeekDistill
+            return LocalDeepSeekDistill()
+        from .client import RemoteDeepSeekDistill
+        return RemoteDeepSeekDistill(self)
     
     def validate_api_key(self) -> bool:
         """
@@ -178,5 +236,13 @@ class DeepSeekAPI:
         Returns:
             Boolean indicating whether the API key is valid
         """
-        # Implementation would validate the API key with DeepSeek's servers
-        pass 
\ No newline at end of file
+        return self.run(self.client.validate_api_key())
+    
+    def close(self) -> None:
+        """
+        Close pooled connections and stop the event loop thread.
+        """
+        if self._loop is not None:
+            self._loop.run(self.client.close())
+            self._loop.stop()
+            self._loop = None
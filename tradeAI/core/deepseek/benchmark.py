@@ -0,0 +1,164 @@
+"""
+Load-testing harness for the DeepSeek client.
+"""
+
+import time
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .client import ENDPOINTS, AsyncDeepSeekClient, ClientConfig
+from .mock import MockConfig, MockDeepSeekServer
+
+logger = logging.getLogger(__name__)
+
+# (method, path, payload) of one request
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+def evaluation_workload(n_symbols: int = 50) -> Callable[[int], Request]:
+    """
+    Strategy evaluations over a rotating set of symbols.
+
+    Args:
+        n_symbols: Distinct symbols (repeats make the workload cacheable)
+
+    Returns:
+        Function mapping a request index to a request
+    """
+    def make(i: int) -> Request:
+        return 'POST', ENDPOINTS['rl_evaluate'], {'model': 'deepseek-rl', 'data': {'symbol': f"SYM{i % n_symbols}"}}
+    return make
+
+async def run_load(client: AsyncDeepSeekClient,
+                   workload: Callable[[int], Request],
+                   n_requests: int = 1000,
+                   concurrency: int = 32,
+                   rate: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Drive a client with a workload and measure it.
+
+    Closed loop by default: ``concurrency`` workers each send their next
+    request as soon as the previous one returns. With ``rate``, requests
+    are instead issued on a fixed schedule of ``rate`` per second and
+    latency is measured from the scheduled time, so queueing delay when
+    the client falls behind shows up in the tail.
+
+    Args:
+        client: Client under test
+        workload: Function mapping a request index to a request
+        n_requests: Total requests
+        concurrency: Concurrent workers (closed loop)
+        rate: Requests per second (open loop)
+
+    Returns:
+        Dictionary with throughput, latency percentiles and error counts
+    """
+    latencies = np.full(n_requests, np.nan)
+    errors = Counter()
+
+    async def send(i: int, scheduled: float) -> None:
+        method, path, payload = workload(i)
+        try:
+            await client.request(method, path, payload)
+            latencies[i] = time.perf_counter() - scheduled
+        except Exception as e:
+            errors[type(e).__name__] += 1
+
+    start = time.perf_counter()
+    if rate is None:
+        next_index = iter(range(n_requests))
+
+        async def worker() -> None:
+            for i in next_index:
+                await send(i, time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    else:
+        tasks = []
+        for i in range(n_requests):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(i, scheduled)))
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    ok = latencies[~np.isnan(latencies)] * 1000
+    return {
+        'requests': n_requests,
+        'succeeded': len(ok),
+        'errors': dict(errors),
+        'elapsed': elapsed,
+        'throughput': len(ok) / elapsed if elapsed > 0 else 0.0,
+        'latency_ms_mean': float(ok.mean()) if len(ok) else 0.0,
+        'latency_ms_p50': float(np.percentile(ok, 50)) if len(ok) else 0.0,
+        'latency_ms_p90': float(np.percentile(ok, 90)) if len(ok) else 0.0,
+        'latency_ms_p99': float(np.percentile(ok, 99)) if len(ok) else 0.0,
+        'latency_ms_max': float(ok.max()) if len(ok) else 0.0
+    }
+
+def benchmark(mock_config: Optional[MockConfig] = None,
+              client_configs: Optional[Dict[str, ClientConfig]] = None,
+              workload: Optional[Callable[[int], Request]] = None,
+              client_factory: Optional[Callable[[str, ClientConfig], AsyncDeepSeekClient]] = None,
+              **load_kwargs) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark client configurations against a local mock server.
+
+    The server runs on its own event loop thread; each configuration gets
+    a fresh client and the same workload.
+
+    Args:
+        mock_config: Mock server behaviour
+        client_configs: Configuration name to client settings
+        workload: Function mapping a request index to a request
+            (defaults to ``evaluation_workload()``)
+        client_factory: Builds a client from the server URL and settings
+            (e.g. to attach a cache)
+        **load_kwargs: Arguments for run_load
+
+    Returns:
+        Dictionary keyed by configuration name with the load report, the
+        client statistics and the server statistics
+    """
+    client_configs = client_configs or {'default': ClientConfig()}
+    workload = workload or evaluation_workload()
+    client_factory = client_factory or (lambda url, config: AsyncDeepSeekClient('mock-key', url, config))
+
+    results = {}
+    for name, config in client_configs.items():
+        server = MockDeepSeekServer(mock_config)
+        url = server.start_in_thread()
+        try:
+            async def main() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+                async with client_factory(url, config) as client:
+                    report = await run_load(client, workload, **load_kwargs)
+                    return report, client.get_statistics()
+            report, client_stats = asyncio.run(main())
+        finally:
+            server.stop_in_thread()
+        results[name] = {**report, 'client': client_stats, 'server': server.get_statistics()}
+        logger.info(f"{name}: {report['throughput']:.1f} req/s, p99 {report['latency_ms_p99']:.1f} ms")
+    return results
+
+def format_report(results: Dict[str, Dict[str, Any]], columns: Sequence[str] = (
+        'throughput', 'latency_ms_p50', 'latency_ms_p99', 'latency_ms_max')) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: Output of ``benchmark``
+        columns: Report fields to show
+
+    Returns:
+        Table with one row per configuration
+    """
+    width = max([len(name) for name in results] + [6])
+    lines: List[str] = [' '.join([f"{'config':<{width}}"] + [f"{c:>16}" for c in columns] + [f"{'errors':>8}"])]
+    for name, result in results.items():
+        n_errors = sum(result['errors'].values())
+        lines.append(' '.join([f"{name:<{width}}"] + [f"{result[c]:>16.2f}" for c in columns] + [f"{n_errors:>8}"]))
+    return '\n'.join(lines)
@@ -0,0 +1,341 @@
+"""
+Two-tier response cache and request coalescing for the DeepSeek API.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ...utils.tools import ensure_directory
+
+logger = logging.getLogger(__name__)
+
+# Seconds each endpoint's responses stay valid; other endpoints are not cached
+DEFAULT_TTLS = {
+    '/v1/models': 300.0,
+    '/v1/rl/evaluate': 60.0,
+    '/v1/distill/validate': 60.0
+}
+
+class ResponseCache:
+    """
+    In-memory LRU in front of an optional on-disk store of response bodies.
+
+    Entries are keyed on a hash of the canonical request (method, path,
+    sorted JSON body and query) and a scope identifying the credential
+    and base URL, so logically identical requests from different workers
+    of the same account share an entry, and other accounts or servers
+    never see it. Bodies are stored as the raw bytes received and decoded
+    on every hit, so callers never share mutable results. Each endpoint has
+    its own TTL; endpoints without one are not cached. The disk tier
+    survives restarts and is shared by processes pointing at the same
+    directory.
+    """
+
+    def __init__(self,
+                 max_size: int = 1024,
+                 directory: Optional[str] = None,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 0.0):
+        """
+        Initialize response cache.
+
+        Args:
+            max_size: Maximum number of entries kept in memory
+            directory: Directory of the disk tier (memory only if None)
+            ttls: Entry lifetime in seconds per endpoint path (or path
+                prefix); defaults to DEFAULT_TTLS
+            default_ttl: Lifetime for other endpoints (0 disables caching)
+        """
+        self.max_size = max_size
+        self.directory = directory
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        if directory:
+            ensure_directory(directory)
+
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(method: str,
+                 path: str,
+                 payload: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None,
+                 scope: Optional[str] = None) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            payload: JSON body
+            params: Query parameters
+            scope: Fingerprint of the credential and base URL (see
+                ``make_scope``)
+
+        Returns:
+            SHA256 hex digest of the canonical request
+        """
+        from .client import _json_default
+        canonical = json.dumps([scope, method.upper(), path, payload, params],
+                               sort_keys=True, separators=(',', ':'), default=_json_default)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def make_scope(api_key: str, api_url: str) -> str:
+        """
+        Fingerprint of a credential and base URL, without storing the key.
+
+        Args:
+            api_key: API key
+            api_url: Base URL
+
+        Returns:
+            SHA256 hex digest
+        """
+        return hashlib.sha256(f"{api_url}\n{api_key}".encode()).hexdigest()
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Lifetime of responses from an endpoint (longest matching prefix).
+
+        Args:
+            path: Endpoint path
+
+        Returns:
+            Seconds (0 means not cached)
+        """
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else self.default_ttl
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a response body, promoting disk hits to memory.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached body or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, body = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    self.bytes_saved += len(body)
+                    return body
+                del self._entries[key]
+                self.expirations += 1
+
+        body = self._read_disk(key, now) if self.directory else None
+        with self._lock:
+            if body is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self.bytes_saved += len(body[1])
+            self._store(key, *body)
+        return body[1]
+
+    def put(self, key: str, path: str, body: bytes) -> None:
+        """
+        Store a response body.
+
+        Args:
+            key: Cache key from ``make_key``
+            path: Endpoint path (selects the TTL)
+            body: Raw response body
+        """
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._store(key, expires_at, body)
+        if self.directory:
+            self._write_disk(key, expires_at, body)
+
+    def record_coalesced(self, body: bytes) -> None:
+        """
+        Count a request answered by another caller's in-flight request.
+
+        Args:
+            body: Shared response body
+        """
+        with self._lock:
+            self.coalesced += 1
+            self.bytes_saved += len(body)
+
+    def _store(self, key: str, expires_at: float, body: bytes) -> None:
+        # Caller holds self._lock
+        self._entries[key] = (expires_at, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key: str, now: float) -> Optional[Tuple[float, bytes]]:
+        path = self._file(key)
+        try:
+            with open(path, 'rb') as f:
+                expires_at = float(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if expires_at <= now:
+            with self._lock:
+                self.expirations += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return expires_at, body
+
+    def _write_disk(self, key: str, expires_at: float, body: bytes) -> None:
+        path = self._file(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            ensure_directory(os.path.dirname(path))
+            with open(tmp_path, 'wb') as f:
+                f.write(f"{expires_at!r}\n".encode())
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached response {key}: {e}")
+
+    def prune(self) -> int:
+        """
+        Delete expired entries from memory and disk.
+
+        Returns:
+            Number of entries deleted
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[key]
+                removed += 1
+            self.expirations += removed
+        if self.directory:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith('.tmp'):
+                        self._read_disk(name, now)
+                        removed += not os.path.exists(os.path.join(root, name))
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries, including the disk tier."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    os.remove(os.path.join(root, name))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits per tier, hit rate (share of lookups that
+            needed no outbound request) and bytes saved
+        """
+        with self._lock:
+            return self._statistics()
+
+    def _statistics(self) -> Dict[str, Any]:
+        # Coalesced requests missed the cache but did not go out either
+        hits = self.memory_hits + self.disk_hits + self.coalesced
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'coalesced': self.coalesced,
+            'misses': self.misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._entries),
+            'max_size': self.max_size
+        }
+
+class _LeaderCancelled(Exception):
+    """Raised to callers sharing a call whose leading caller was cancelled."""
+
+class SingleFlight:
+    """
+    Shares one in-flight call among concurrent callers with the same key.
+
+    The first caller runs the call; callers arriving before it finishes
+    await the same result (or exception) instead of starting their own.
+    If the leading caller is cancelled, a waiting caller takes over and
+    runs the call itself. Must be used from a single event loop.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Request key
+            func: Coroutine function performing the call
+
+        Returns:
+            Tuple of (result, whether it was shared from another caller)
+        """
+        while key in self._calls:
+            try:
+                return await asyncio.shield(self._calls[key]), True
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # Only this caller was cancelled: wake the others to retry
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[key]
@@ -0,0 +1,706 @@
+"""
+Asynchronous DeepSeek API client with pooled keep-alive connections.
+"""
+
+import json
+import time
+import asyncio
+import logging
+import threading
+import re
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+import numpy as np
+import pandas as pd
+import aiohttp
+
+from .base import DeepSeekDistill, DeepSeekRL
+from .cache import ResponseCache, SingleFlight
+from .ratelimit import RateLimiter
+from ..exceptions import APIError, APIKeyError, APIResponseError, RateLimitError
+from ...utils.tools import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_API_URL = "https://api.deepseek.ai"
+
+# Endpoint paths relative to the API URL
+ENDPOINTS = {
+    'models': '/v1/models',
+    'chat': '/v1/chat/completions',
+    'rl_train': '/v1/rl/train',
+    'rl_optimize': '/v1/rl/optimize',
+    'rl_evaluate': '/v1/rl/evaluate',
+    'distill': '/v1/distill',
+    'distill_optimize': '/v1/distill/optimize',
+    'distill_validate': '/v1/distill/validate'
+}
+
+def _json_default(value: Any) -> Any:
+    """Encode NumPy, pandas and datetime values in request bodies."""
+    if value is pd.NaT:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else pd.Timestamp(value).isoformat()
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'M':
+            return [_json_default(item) for item in value]
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict('records')
+    if isinstance(value, pd.Series):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+dumps = partial(json.dumps, default=_json_default)
+
+async def iter_sse(lines: AsyncIterable[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """Parse a server-sent event stream of JSON ``data`` payloads.
+
+    Multi-line data fields are joined, comments and other fields are
+    skipped, and a ``[DONE]`` payload ends the stream.
+
+    Args:
+        lines: Raw lines of the response body
+
+    Yields:
+        Decoded event payloads
+    """
+    data: List[str] = []
+    async for raw in lines:
+        line = raw.decode('utf-8').rstrip('\r\n')
+        if line:
+            name, _, value = line.partition(':')
+            if name == 'data':
+                data.append(value[1:] if value.startswith(' ') else value)
+            continue
+        if not data:
+            continue
+        text = '\n'.join(data)
+        data = []
+        if text == '[DONE]':
+            return
+        yield json.loads(text)
+    if data and '\n'.join(data) != '[DONE]':
+        yield json.loads('\n'.join(data))
+
+_ACTION = re.compile(r'"action"\s*:\s*"(\w+)"')
+
+def parse_action(content: str) -> Optional[Dict[str, str]]:
+    """Extract a trading action from partial model output.
+
+    Matches ``"action": "<word>"`` so a decision is available as soon as
+    that field has streamed in, before the rest of the JSON is complete.
+
+    Args:
+        content: Text received so far
+
+    Returns:
+        Dictionary with the action, or None if not yet present
+    """
+    match = _ACTION.search(content)
+    return {'action': match.group(1)} if match else None
+
+@dataclass
+class ClientConfig:
+    """Connection pool, timeout and concurrency settings."""
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_connections_per_host: int = 32
+    keepalive_timeout: float = 60.0
+    max_concurrency: int = 16
+    dns_cache_ttl: int = 300
+    max_retries: int = 0
+    retry_delay: float = 0.5
+    max_retry_delay: float = 30.0
+
+class AsyncDeepSeekClient:
+    """
+    DeepSeek API client on one pooled ``aiohttp`` session.
+
+    Connections are kept alive and reused across requests, capped in
+    total and per host; a semaphore caps the number of requests in flight
+    so fan-out over many symbols cannot exhaust the pool or the API quota.
+    The session is bound to the event loop it is first used in.
+
+    With a ResponseCache, responses from endpoints that have a TTL are
+    served from the cache, and identical requests already in flight are
+    shared instead of sent again. With a RateLimiter, requests wait for
+    their endpoint's token bucket and the adaptive concurrency limit.
+    429 and 5xx responses are retried up to ``max_retries`` times with
+    jittered exponential backoff, never sooner than Retry-After.
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 api_url: Optional[str] = None,
+                 config: Optional[ClientConfig] = None,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 window_size: int = 1000):
+        """Initialize client.
+
+        Args:
+            api_key: DeepSeek API key
+            api_url: Optional custom API endpoint
+            config: Connection settings
+            cache: Response cache (requests are not cached if None)
+            rate_limiter: Client-side rate and concurrency limiter
+            window_size: Size of sliding window for latency statistics
+        """
+        self.api_key = api_key
+        self.api_url = (api_url or DEFAULT_API_URL).rstrip('/')
+        self.config = config or ClientConfig()
+        self.cache = cache
+        self._cache_scope = ResponseCache.make_scope(self.api_key, self.api_url)
+        self.rate_limiter = rate_limiter
+        self._flights = SingleFlight()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.n_requests = 0
+        self.n_errors = 0
+        self.n_retries = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latencies = deque(maxlen=window_size)
+        self.first_token_times = deque(maxlen=window_size)
+        self.decision_times = deque(maxlen=window_size)
+
+    async def __aenter__(self) -> 'AsyncDeepSeekClient':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Open the pooled session."""
+        if self._session is not None and not self._session.closed:
+            return
+        cfg = self.config
+        connector = aiohttp.TCPConnector(
+            limit=cfg.max_connections,
+            limit_per_host=cfg.max_connections_per_host,
+            keepalive_timeout=cfg.keepalive_timeout,
+            ttl_dns_cache=cfg.dns_cache_ttl
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=cfg.timeout, connect=cfg.connect_timeout),
+            headers={'Authorization': f"Bearer {self.api_key}", 'Accept': 'application/json'},
+            json_serialize=dumps
+        )
+        self._semaphore = asyncio.Semaphore(cfg.max_concurrency)
+
+    async def close(self) -> None:
+        """Close the session and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def url(self, path: str) -> str:
+        """Absolute URL of an endpoint path."""
+        return f"{self.api_url}{path}"
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      payload: Optional[Dict[str, Any]] = None,
+                      params: Optional[Dict[str, Any]] = None,
+                      use_cache: bool = True) -> Any:
+        """Send a request (or serve it from the cache) and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            payload: JSON body
+            params: Query parameters
+            use_cache: Whether the response may come from (and go to) the cache
+
+        Returns:
+            Decoded response body
+        """
+        if not use_cache or self.cache is None or self.cache.ttl_for(path) <= 0:
+            body = await self._send(method, path, payload, params)
+        else:
+            key = self.cache.make_key(method, path, payload, params, self._cache_scope)
+            body = self.cache.get(key)
+            if body is None:
+                body, shared = await self._flights.do(key, partial(self._send, method, path, payload, params))
+                if shared:
+                    self.cache.record_coalesced(body)
+                else:
+                    self.cache.put(key, path, body)
+        return json.loads(body) if body.strip() else None
+
+    async def _send(self,
+                    method: str,
+                    path: str,
+                    payload: Optional[Dict[str, Any]],
+                    params: Optional[Dict[str, Any]]) -> bytes:
+        """Send a request, retrying throttled and failed attempts."""
+        cfg = self.config
+        attempt = 0
+        while True:
+            try:
+                return await self._send_once(method, path, payload, params)
+            except APIResponseError as e:
+                if attempt >= cfg.max_retries or not (e.status == 429 or e.status >= 500):
+                    raise
+                delay = backoff_delay(attempt, cfg.retry_delay, 2.0, cfg.max_retry_delay,
+                                      jitter=True, retry_after=e.retry_after)
+                logger.debug(f"{method} {path} returned {e.status}, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                self.n_retries += 1
+
+    async def _send_once(self,
+                         method: str,
+                         path: str,
+                         payload: Optional[Dict[str, Any]],
+                         params: Optional[Dict[str, Any]]) -> bytes:
+        """Send one attempt under the rate limiter."""
+        if self.rate_limiter is None:
+            return await self._http(method, path, payload, params)
+        async with self.rate_limiter.slot(path) as slot:
+            try:
+                body = await self._http(method, path, payload, params, slot)
+            except RateLimitError as e:
+                slot.throttled(e.retry_after)
+                raise
+            slot.ok()
+            return body
+
+    async def _http(self,
+                    method: str,
+                    path: str,
+                    payload: Optional[Dict[str, Any]],
+                    params: Optional[Dict[str, Any]],
+                    slot: Optional[Any] = None) -> bytes:
+        """Send a request and read the raw response body."""
+        async with self._open(method, path, payload, params, slot=slot) as response:
+            return await response.read()
+
+    @asynccontextmanager
+    async def _open(self,
+                    method: str,
+                    path: str,
+                    payload: Optional[Dict[str, Any]],
+                    params: Optional[Dict[str, Any]],
+                    stream: bool = False,
+                    slot: Optional[Any] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Hold a connection slot and an open, successful response.
+
+        A rate limiter ``slot`` is marked sent once the connection slot is
+        held, so waiting on ``max_concurrency`` is not measured as server
+        latency.
+        """
+        await self.start()
+        async with self._semaphore:
+            if slot is not None:
+                slot.sent()
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            start = time.perf_counter()
+            kwargs = {}
+            if stream:
+                # Bound the gap between events, not the whole response
+                kwargs = {'headers': {'Accept': 'text/event-stream'},
+                          'timeout': aiohttp.ClientTimeout(connect=self.config.connect_timeout,
+                                                           sock_read=self.config.timeout)}
+            try:
+                async with self._session.request(method, self.url(path), json=payload, params=params,
+                                                 **kwargs) as response:
+                    if response.status >= 400:
+                        raise await self._error(response)
+                    yield response
+            except aiohttp.ClientError as e:
+                self.n_errors += 1
+                raise APIError(f"{method} {path} failed: {e}") from e
+            except asyncio.TimeoutError as e:
+                self.n_errors += 1
+                raise APIError(f"{method} {path} timed out") from e
+            except APIError:
+                self.n_errors += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.n_requests += 1
+                self.latencies.append(time.perf_counter() - start)
+
+    async def stream(self,
+                     method: str,
+                     path: str,
+                     payload: Optional[Dict[str, Any]] = None,
+                     params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Send a request and iterate over its server-sent events.
+
+        The connection slot is held until the stream ends or the iterator
+        is closed. Streams are not cached or retried.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            payload: JSON body
+            params: Query parameters
+
+        Yields:
+            Decoded event payloads
+        """
+        if self.rate_limiter is None:
+            async with self._open(method, path, payload, params, stream=True) as response:
+                async for event in iter_sse(response.content):
+                    yield event
+            return
+        async with self.rate_limiter.slot(path) as slot:
+            try:
+                async with self._open(method, path, payload, params, stream=True, slot=slot) as response:
+                    async for event in iter_sse(response.content):
+                        if not slot.succeeded:
+                            slot.first_event()
+                        yield event
+            except RateLimitError as e:
+                slot.throttled(e.retry_after)
+                raise
+
+    async def _error(self, response: aiohttp.ClientResponse) -> APIError:
+        """Map an error response to an exception."""
+        body = await response.text()
+        message = f"{response.method} {response.url.path} returned {response.status}: {body[:200]}"
+        if response.status in (401, 403):
+            return APIKeyError(message)
+        retry_after = response.headers.get('Retry-After')
+        try:
+            retry_after = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            retry_after = None
+        if response.status == 429:
+            return RateLimitError(message, response.status, retry_after)
+        return APIResponseError(message, response.status, retry_after)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an endpoint."""
+        return await self.request('GET', path, params=params)
+
+    async def post(self, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        """POST a JSON body to an endpoint."""
+        return await self.request('POST', path, payload=payload)
+
+    async def validate_api_key(self) -> bool:
+        """Check the API key against the models endpoint, bypassing the cache.
+
+        Returns:
+            Whether the key is accepted
+        """
+        try:
+            await self.request('GET', ENDPOINTS['models'], use_cache=False)
+            return True
+        except APIKeyError:
+            return False
+
+    async def list_models(self) -> List[Dict[str, Any]]:
+        """List available models."""
+        response = await self.get(ENDPOINTS['models'])
+        return response.get('data', response) if isinstance(response, dict) else response
+
+    async def chat(self,
+                   messages: Sequence[Dict[str, str]],
+                   model: str = 'deepseek-chat',
+                   **params) -> Dict[str, Any]:
+        """Create a chat completion.
+
+        Args:
+            messages: Chat messages (``role`` and ``content``)
+            model: Model name
+            **params: Additional completion parameters
+
+        Returns:
+            Completion response
+        """
+        return await self.post(ENDPOINTS['chat'], {'model': model, 'messages': list(messages), **params})
+
+    def stream_chat(self,
+                    messages: Sequence[Dict[str, str]],
+                    model: str = 'deepseek-chat',
+                    **params) -> 'ChatStream':
+        """Create a streamed chat completion.
+
+        Args:
+            messages: Chat messages (``role`` and ``content``)
+            model: Model name
+            **params: Additional completion parameters
+
+        Returns:
+            ChatStream over the completion chunks
+        """
+        payload = {'model': model, 'messages': list(messages), **params, 'stream': True}
+        return ChatStream(self, self.stream('POST', ENDPOINTS['chat'], payload))
+
+    async def fan_out(self,
+                      func: Callable[[T], Awaitable[Any]],
+                      items: Iterable[T],
+                      return_exceptions: bool = True) -> List[Any]:
+        """Run one call per item concurrently (bounded by ``max_concurrency``).
+
+        Args:
+            func: Coroutine function called with each item
+            items: Items, e.g. symbols
+            return_exceptions: Return failures in place instead of raising
+
+        Returns:
+            Results in item order
+        """
+        return await asyncio.gather(*(func(item) for item in items), return_exceptions=return_exceptions)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get request statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        latencies = np.array(self.latencies) * 1000
+        first_tokens = np.array(self.first_token_times) * 1000
+        decisions = np.array(self.decision_times) * 1000
+        return {
+            'requests': self.n_requests,
+            'errors': self.n_errors,
+            'retries': self.n_retries,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'coalescing': len(self._flights),
+            'latency_ms_mean': float(latencies.mean()) if len(latencies) else 0.0,
+            'latency_ms_p95': float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+            'first_token_ms_mean': float(first_tokens.mean()) if len(first_tokens) else 0.0,
+            'decision_ms_mean': float(decisions.mean()) if len(decisions) else 0.0
+        }
+
+class ChatStream:
+    """
+    Async iterator over the chunks of a streamed chat completion.
+
+    Accumulates the streamed text in ``content`` and times the first
+    token and, with ``read_until``, the point where a parser could act
+    on the partial output. Timings are measured from the first read,
+    when the request is sent, and are also recorded in the client's
+    statistics.
+    """
+
+    def __init__(self, client: AsyncDeepSeekClient, events: AsyncIterator[Dict[str, Any]]):
+        """Initialize chat stream.
+
+        Args:
+            client: Client that opened the stream
+            events: Decoded server-sent events
+        """
+        self.client = client
+        self._events = events
+        self._parts: List[str] = []
+        self.started: Optional[float] = None
+        self.time_to_first_token: Optional[float] = None
+        self.time_to_decision: Optional[float] = None
+        self.finish_reason: Optional[str] = None
+        self.n_chunks = 0
+
+    def __aiter__(self) -> 'ChatStream':
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if self.started is None:
+            # The request is only sent once the events are first read
+            self.started = time.perf_counter()
+        chunk = await self._events.__anext__()
+        self.n_chunks += 1
+        for choice in chunk.get('choices') or []:
+            text = (choice.get('delta') or {}).get('content')
+            if text:
+                if self.time_to_first_token is None:
+                    self.time_to_first_token = time.perf_counter() - self.started
+                    self.client.first_token_times.append(self.time_to_first_token)
+                self._parts.append(text)
+            if choice.get('finish_reason'):
+                self.finish_reason = choice['finish_reason']
+        return chunk
+
+    async def __aenter__(self) -> 'ChatStream':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def content(self) -> str:
+        """Text received so far."""
+        if len(self._parts) > 1:
+            self._parts = [''.join(self._parts)]
+        return self._parts[0] if self._parts else ''
+
+    async def aclose(self) -> None:
+        """Stop reading and release the connection."""
+        await self._events.aclose()
+
+    async def read_all(self) -> str:
+        """Read the remaining chunks.
+
+        Returns:
+            Complete text
+        """
+        async for _ in self:
+            pass
+        return self.content
+
+    async def read_until(self,
+                         parser: Callable[[str], Optional[T]] = parse_action,
+                         close: bool = True) -> Optional[T]:
+        """Read chunks until the parser accepts the partial text.
+
+        Args:
+            parser: Returns a decision from partial text, or None if more
+                text is needed
+            close: Stop the stream once a decision is made
+
+        Returns:
+            The decision, or None if the stream ended without one
+        """
+        try:
+            async for _ in self:
+                decision = parser(self.content)
+                if decision is not None:
+                    self.time_to_decision = time.perf_counter() - self.started
+                    self.client.decision_times.append(self.time_to_decision)
+                    return decision
+            return None
+        finally:
+            if close:
+                await self.aclose()
+
+class LoopThread:
+    """
+    Event loop running on a daemon thread.
+
+    Lets synchronous code drive one long-lived async client, so its pooled
+    connections survive between calls (``asyncio.run`` per call would
+    open and tear down a new session every time).
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='deepseek-loop', daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and its thread."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+class RemoteDeepSeekRL(DeepSeekRL):
+    """DeepSeekRL backed by the DeepSeek API."""
+
+    def __init__(self, api: Any):
+        """Initialize interface.
+
+        Args:
+            api: DeepSeekAPI used to send requests
+        """
+        self.api = api
+        self.model_name: Optional[str] = None
+        self.model_config: Dict[str, Any] = {}
+
+    def initialize_model(self, model_name: str, **kwargs) -> None:
+        self.model_name = model_name
+        self.model_config = kwargs
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return self.api.run(self.api.client.get(f"{ENDPOINTS['models']}/{self.model_name}"))
+
+    def train_agent(self, env_config: Dict[str, Any], training_config: Dict[str, Any]) -> Dict[str, Any]:
+        return self.api.run(self.api.client.post(ENDPOINTS['rl_train'], {
+            'model': self.model_name, 'env_config': env_config, 'training_config': training_config
+        }))
+
+    def optimize_strategy(self, strategy: Any, optimization_config: Dict[str, Any]) -> Any:
+        payload = {'model': self.model_name, 'strategy': type(strategy).__name__, 'config': optimization_config}
+        result = self.api.run(self.api.client.post(ENDPOINTS['rl_optimize'], payload))
+        parameters = result.get('parameters') if isinstance(result, dict) else None
+        if parameters is not None and hasattr(strategy, 'set_parameters'):
+            try:
+                strategy.set_parameters({name: np.asarray(values) for name, values in parameters.items()})
+            except NotImplementedError:
+                logger.warning(f"{type(strategy).__name__} does not accept parameters; "
+                               f"optimized parameters were not applied")
+        return strategy
+
+    def evaluate_strategy(self, strategy: Any, evaluation_data: Dict[str, Any]) -> Dict[str, float]:
+        return self.api.run(self.api.client.post(ENDPOINTS['rl_evaluate'], {
+            'model': self.model_name, 'strategy': type(strategy).__name__, 'data': evaluation_data
+        }))
+
+class RemoteDeepSeekDistill(DeepSeekDistill):
+    """DeepSeekDistill backed by the DeepSeek API.
+
+    Models are referred to by their remote identifiers; local model objects
+    are rejected with TypeError since their weights are not uploaded.
+    """
+
+    def __init__(self, api: Any):
+        """Initialize interface.
+
+        Args:
+            api: DeepSeekAPI used to send requests
+        """
+        self.api = api
+        self.model_name: Optional[str] = None
+        self.model_config: Dict[str, Any] = {}
+
+    def initialize_model(self, model_name: str, **kwargs) -> None:
+        self.model_name = model_name
+        self.model_config = kwargs
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return self.api.run(self.api.client.get(f"{ENDPOINTS['models']}/{self.model_name}"))
+
+    def _model_id(self, model: Any, role: str) -> str:
+        """Name of a remote model; None means the initialized model.
+
+        Raises:
+            TypeError: If ``model`` is not a model identifier
+        """
+        if model is None and self.model_name is not None:
+            return self.model_name
+        if not isinstance(model, str):
+            raise TypeError(f"Remote distillation takes a model identifier as {role}, "
+                            f"got {type(model).__name__}")
+        return model
+
+    def distill_model(self, teacher_model: Any, distillation_config: Dict[str, Any]) -> Any:
+        return self.api.run(self.api.client.post(ENDPOINTS['distill'], {
+            'teacher': self._model_id(teacher_model, 'teacher'),
+            'config': distillation_config
+        }))
+
+    def optimize_distilled_model(self, model: Any, optimization_config: Dict[str, Any]) -> Any:
+        return self.api.run(self.api.client.post(ENDPOINTS['distill_optimize'], {
+            'model': self._model_id(model, 'model'), 'config': optimization_config
+        }))
+
+    def validate_distilled_model(self, model: Any, validation_data: Dict[str, Any]) -> Dict[str, float]:
+        return self.api.run(self.api.client.post(ENDPOINTS['distill_validate'], {
+            'model': self._model_id(model, 'model'), 'data': validation_data
+        }))
@@ -0,0 +1,451 @@
+"""
+Local CPU knowledge distillation of teacher models into small students.
+"""
+
+import copy
+import time
+import logging
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from .base import DeepSeekDistill
+from .teacher_cache import TeacherOutputCache, TeacherOutputDataset
+from ..data.windows import WindowDataset, WindowLoader
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[np.ndarray, torch.Tensor]
+
+@dataclass
+class DistillConfig:
+    """Distillation hyperparameters."""
+    temperature: float = 4.0
+    alpha: float = 0.9
+    epochs: int = 10
+    batch_size: int = 256
+    lr: float = 1e-3
+    weight_decay: float = 0.0
+    hidden_sizes: Sequence[int] = (64,)
+    num_workers: int = 2
+    prefetch: int = 4
+    num_threads: Optional[int] = None
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> 'DistillConfig':
+        """Build from a dictionary, ignoring keys that are not fields."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in config.items() if k in names})
+
+class ArrayDataset:
+    """
+    Rows of in-memory (or memory-mapped) arrays, gathered by index.
+
+    Provides the ``gather``/``__len__`` interface of WindowDataset so the
+    same prefetching WindowLoader can batch it on background threads.
+    """
+
+    def __init__(self, columns: Mapping[str, ArrayLike]):
+        """
+        Initialize dataset.
+
+        Args:
+            columns: Name to array with one row per sample
+        """
+        self.columns = {name: values.numpy() if isinstance(values, torch.Tensor) else values
+                        for name, values in columns.items()}
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        self.n_rows = lengths.pop()
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def gather(self, indices: np.ndarray, dtype: Any = np.float32) -> Dict[str, np.ndarray]:
+        """
+        Copy the selected rows of every column.
+
+        Args:
+            indices: Row indices
+            dtype: Dtype of floating-point columns
+
+        Returns:
+            Dictionary of batches, plus the row indices as ``index``
+        """
+        indices = np.asarray(indices)
+        batch = {}
+        for name, values in self.columns.items():
+            rows = np.asarray(values[indices])
+            batch[name] = rows.astype(dtype) if rows.dtype.kind == 'f' else rows.astype(np.int64)
+        batch['index'] = indices.astype(np.int64)
+        return batch
+
+def as_dataset(data: Union[Mapping[str, ArrayLike], WindowDataset, ArrayDataset]) -> Union[ArrayDataset, WindowDataset]:
+    """
+    Wrap distillation data for batching.
+
+    Args:
+        data: ``{'x': inputs, 'y': optional labels}``, or a dataset
+
+    Returns:
+        Dataset with ``gather``
+    """
+    if isinstance(data, (ArrayDataset, WindowDataset)):
+        return data
+    return ArrayDataset({name: values for name, values in data.items() if values is not None})
+
+def kd_loss(student_logits: torch.Tensor,
+            teacher_logits: torch.Tensor,
+            labels: Optional[torch.Tensor] = None,
+            temperature: float = 4.0,
+            alpha: float = 0.9) -> torch.Tensor:
+    """
+    Temperature-scaled knowledge distillation loss.
+
+    ``alpha * T^2 * KL(softmax(teacher / T) || softmax(student / T))``
+    plus ``(1 - alpha)`` times the cross-entropy with the hard labels. The
+    ``T^2`` factor keeps soft-target gradients on the same scale as the
+    hard-label term when the temperature changes.
+
+    Args:
+        student_logits: Student outputs of shape (n, classes)
+        teacher_logits: Teacher outputs of shape (n, classes)
+        labels: Class labels of shape (n,) (soft targets only if None)
+        temperature: Softmax temperature
+        alpha: Weight of the soft-target term
+
+    Returns:
+        Scalar loss
+    """
+    soft = F.kl_div(
+        F.log_softmax(student_logits / temperature, dim=-1),
+        F.log_softmax(teacher_logits / temperature, dim=-1),
+        reduction='batchmean',
+        log_target=True
+    ) * temperature ** 2
+    if labels is None or alpha >= 1:
+        return soft
+    return alpha * soft + (1 - alpha) * F.cross_entropy(student_logits, labels)
+
+def build_student(input_shape: Sequence[int], n_outputs: int, hidden_sizes: Sequence[int] = (64,)) -> nn.Module:
+    """
+    Build a small MLP student.
+
+    Args:
+        input_shape: Shape of one input (flattened by the model)
+        n_outputs: Number of output logits
+        hidden_sizes: Width of each hidden layer
+
+    Returns:
+        Student model
+    """
+    layers: List[nn.Module] = [nn.Flatten()]
+    width = int(np.prod(input_shape))
+    for size in hidden_sizes:
+        layers += [nn.Linear(width, size), nn.ReLU()]
+        width = size
+    layers.append(nn.Linear(width, n_outputs))
+    return nn.Sequential(*layers)
+
+def count_parameters(model: nn.Module) -> int:
+    """Number of parameters of a model (packed quantized weights included)."""
+    n = sum(p.numel() for p in model.parameters())
+    for module in model.modules():
+        weight = getattr(module, 'weight', None)
+        if callable(weight) and not isinstance(weight, nn.Parameter):
+            n += weight().numel()
+    return n
+
+@contextmanager
+def torch_threads(num_threads: Optional[int]) -> Iterator[None]:
+    """Temporarily set torch's intra-op thread count."""
+    if num_threads is None:
+        yield
+        return
+    previous = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+@torch.inference_mode()
+def predict_logits(model: nn.Module, x: ArrayLike, batch_size: int = 1024) -> torch.Tensor:
+    """
+    Run a model over inputs in batches.
+
+    Args:
+        model: Model in eval mode
+        x: Inputs
+        batch_size: Rows per forward pass
+
+    Returns:
+        Stacked outputs
+    """
+    x = torch.as_tensor(np.asarray(x, dtype=np.float32)) if not isinstance(x, torch.Tensor) else x.float()
+    return torch.cat([model(x[i:i + batch_size]) for i in range(0, len(x), batch_size)])
+
+@torch.inference_mode()
+def predict_dataset(model: nn.Module,
+                    dataset: Union[ArrayDataset, WindowDataset],
+                    batch_size: int = 1024) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Run a model over a dataset in batches.
+
+    Args:
+        model: Model in eval mode
+        dataset: Dataset with ``gather``
+        batch_size: Rows per forward pass
+
+    Returns:
+        Tuple of (logits, labels or None)
+    """
+    logits, labels = [], []
+    for start in range(0, len(dataset), batch_size):
+        batch = dataset.gather(np.arange(start, min(start + batch_size, len(dataset))))
+        logits.append(model(torch.from_numpy(batch['x'])).numpy())
+        if 'y' in batch:
+            labels.append(batch['y'])
+    return np.concatenate(logits), (np.concatenate(labels) if labels else None)
+
+@torch.inference_mode()
+def measure_latency(model: nn.Module, x: ArrayLike, n_runs: int = 200, warmup: int = 20) -> Dict[str, float]:
+    """
+    Measure single-sample inference latency.
+
+    Args:
+        model: Model in eval mode
+        x: Inputs; one row is used per run
+        n_runs: Timed runs
+        warmup: Untimed runs first
+
+    Returns:
+        Dictionary with mean, p50 and p99 latency in milliseconds
+    """
+    x = torch.as_tensor(np.asarray(x, dtype=np.float32)) if not isinstance(x, torch.Tensor) else x.float()
+    rows = [x[i % len(x)].unsqueeze(0) for i in range(n_runs + warmup)]
+    for row in rows[:warmup]:
+        model(row)
+    times = np.empty(n_runs)
+    for i, row in enumerate(rows[warmup:]):
+        start = time.perf_counter()
+        model(row)
+        times[i] = time.perf_counter() - start
+    times *= 1000
+    return {
+        'latency_ms_mean': float(times.mean()),
+        'latency_ms_p50': float(np.percentile(times, 50)),
+        'latency_ms_p99': float(np.percentile(times, 99))
+    }
+
+class LocalDeepSeekDistill(DeepSeekDistill):
+    """
+    Distills a torch teacher into a small student on the local CPU.
+
+    Batches are gathered by a prefetching WindowLoader on background
+    threads while the teacher and student run, so data loading overlaps
+    with compute. The student minimises ``kd_loss`` against the teacher's
+    temperature-softened outputs (plus hard labels when given).
+
+    With a TeacherOutputCache, teacher outputs are computed once per
+    teacher and dataset and later runs read them from disk without
+    running the teacher.
+    """
+
+    def __init__(self, teacher_cache: Optional[TeacherOutputCache] = None):
+        """
+        Initialize local distillation.
+
+        Args:
+            teacher_cache: Cache of teacher outputs shared across runs
+        """
+        self.model_name: Optional[str] = None
+        self.config = DistillConfig()
+        self.teacher_cache = teacher_cache
+        self.history: List[Dict[str, float]] = []
+
+    def initialize_model(self, model_name: str, **kwargs) -> None:
+        """
+        Name the student and set default hyperparameters.
+
+        Args:
+            model_name: Student model name
+            **kwargs: DistillConfig fields
+        """
+        self.model_name = model_name
+        self.config = DistillConfig.from_dict({**asdict(self.config), **kwargs})
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return {
+            'model_name': self.model_name,
+            'backend': 'local',
+            'config': asdict(self.config),
+            'epochs_trained': len(self.history),
+            'last_epoch': self.history[-1] if self.history else None
+        }
+
+    def distill_model(self, teacher_model: nn.Module, distillation_config: Dict[str, Any]) -> nn.Module:
+        """
+        Train a student to reproduce a teacher's outputs.
+
+        Args:
+            teacher_model: Teacher ``nn.Module`` producing logits
+            distillation_config: ``train_data`` (``{'x', 'y'}`` arrays or a
+                dataset), optional ``val_data`` (same forms), optional ``student``
+                module, optional ``teacher_cache`` (overrides the
+                instance's), ``teacher_key`` (known teacher checkpoint
+                hash) and ``feature_layer`` (teacher submodule whose
+                outputs are cached alongside the logits for later reuse;
+                none by default), and DistillConfig overrides
+
+        Returns:
+            Trained student in eval mode
+        """
+        config = DistillConfig.from_dict({**asdict(self.config), **distillation_config})
+        dataset = as_dataset(distillation_config['train_data'])
+        val_data = distillation_config.get('val_data')
+        val_data = as_dataset(val_data) if val_data is not None else None
+        if config.seed is not None:
+            torch.manual_seed(config.seed)
+
+        teacher_was_training = teacher_model.training
+        teacher_model.eval()
+        cache = distillation_config.get('teacher_cache', self.teacher_cache)
+        teacher_key = distillation_config.get('teacher_key')
+        feature_layer = distillation_config.get('feature_layer')
+        val_teacher = None
+        if cache is not None:
+            outputs = cache.get_or_compute(teacher_model, dataset, teacher_key, feature_layer)
+            dataset = TeacherOutputDataset(dataset, outputs)
+            n_outputs = outputs['logits'].shape[-1]
+            if val_data is not None:
+                val_outputs = cache.get_or_compute(teacher_model, val_data, teacher_key, feature_layer)
+                val_teacher = np.asarray(val_outputs['logits'])
+        else:
+            with torch.inference_mode():
+                n_outputs = teacher_model(torch.from_numpy(dataset.gather(np.arange(1))['x'])).shape[-1]
+            if val_data is not None:
+                val_teacher, _ = predict_dataset(teacher_model, val_data)
+        student = distillation_config.get('student')
+        if student is None:
+            sample = dataset.gather(np.arange(1))
+            student = build_student(sample['x'].shape[1:], n_outputs, config.hidden_sizes)
+        val_teacher_predictions = val_teacher.argmax(-1) if val_teacher is not None else None
+
+        loader = WindowLoader(dataset, batch_size=config.batch_size, shuffle=True, prefetch=config.prefetch,
+                              num_workers=config.num_workers, as_torch=True, seed=config.seed)
+        optimizer = torch.optim.AdamW(student.parameters(), lr=config.lr, weight_decay=config.weight_decay)
+        self.history = []
+
+        try:
+            with torch_threads(config.num_threads):
+                for epoch in range(config.epochs):
+                    start = time.perf_counter()
+                    student.train()
+                    total, n = 0.0, 0
+                    for batch in loader:
+                        x = batch['x']
+                        labels = batch['y'].long() if 'y' in batch else None
+                        teacher_logits = batch.get('teacher_logits')
+                        if teacher_logits is None:
+                            with torch.no_grad():
+                                teacher_logits = teacher_model(x)
+                        loss = kd_loss(student(x), teacher_logits, labels, config.temperature, config.alpha)
+                        optimizer.zero_grad(set_to_none=True)
+                        loss.backward()
+                        optimizer.step()
+                        total += loss.item() * len(x)
+                        n += len(x)
+                    record = {'epoch': epoch + 1, 'loss': total / max(n, 1), 'time': time.perf_counter() - start}
+                    if val_data is not None:
+                        student.eval()
+                        record.update(self._accuracy(student, val_data, val_teacher_predictions))
+                    self.history.append(record)
+                    logger.info(f"Distillation epoch {epoch + 1}: loss {record['loss']:.4f}")
+        finally:
+            teacher_model.train(teacher_was_training)
+
+        stats = loader.get_statistics()
+        logger.info(f"Data loading wait {stats['wait_time']:.2f}s of {stats['gather_time']:.2f}s gathering")
+        return student.eval()
+
+    def _accuracy(self,
+                  model: nn.Module,
+                  data: Union[ArrayDataset, WindowDataset],
+                  teacher_predictions: Optional[np.ndarray] = None) -> Dict[str, float]:
+        logits, labels = predict_dataset(model, data)
+        predictions = logits.argmax(-1)
+        metrics = {}
+        if labels is not None:
+            metrics['accuracy'] = float((predictions == labels).mean())
+        if teacher_predictions is not None:
+            metrics['teacher_agreement'] = float((predictions == teacher_predictions).mean())
+        return metrics
+
+    def optimize_distilled_model(self, model: nn.Module, optimization_config: Dict[str, Any]) -> nn.Module:
+        """
+        Optimize a student for CPU inference.
+
+        Args:
+            model: Student model
+            optimization_config: ``quantize`` (dynamic int8 Linear weights,
+                default True) and ``trace`` (TorchScript trace and freeze,
+                needs ``example_input``)
+
+        Returns:
+            Optimized model in eval mode
+        """
+        model = copy.deepcopy(model).eval()
+        if optimization_config.get('quantize', True):
+            engines = torch.backends.quantized.supported_engines
+            if any(engine in engines for engine in ('fbgemm', 'x86', 'qnnpack', 'onednn')):
+                from torch.ao.quantization import quantize_dynamic
+                model = quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+            else:
+                logger.warning("No quantized engine available, skipping quantization")
+        if optimization_config.get('trace'):
+            example = torch.as_tensor(np.asarray(optimization_config['example_input'], dtype=np.float32))
+            with torch.inference_mode():
+                model = torch.jit.freeze(torch.jit.trace(model, example))
+        return model
+
+    def validate_distilled_model(self, model: nn.Module, validation_data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Report a student's accuracy against its inference latency.
+
+        Args:
+            model: Student model
+            validation_data: ``x`` inputs, optional ``y`` labels, optional
+                ``teacher`` module to compare against, optional ``n_runs``
+
+        Returns:
+            Accuracy, teacher agreement, latency and size metrics; with a
+            teacher, its accuracy, latency and the student's speedup
+        """
+        model.eval()
+        teacher = validation_data.get('teacher')
+        n_runs = validation_data.get('n_runs', 200)
+        dataset = as_dataset({'x': validation_data['x'], 'y': validation_data.get('y')})
+        teacher_predictions = None
+        if teacher is not None:
+            teacher.eval()
+            teacher_predictions = predict_dataset(teacher, dataset)[0].argmax(-1)
+        report = self._accuracy(model, dataset, teacher_predictions)
+        report.update(measure_latency(model, validation_data['x'], n_runs))
+        report['parameters'] = count_parameters(model)
+
+        if teacher is not None:
+            teacher_report = self._accuracy(teacher, dataset)
+            teacher_latency = measure_latency(teacher, validation_data['x'], n_runs)
+            if 'accuracy' in teacher_report:
+                report['teacher_accuracy'] = teacher_report['accuracy']
+            report['teacher_latency_ms_p50'] = teacher_latency['latency_ms_p50']
+            report['teacher_parameters'] = count_parameters(teacher)
+            report['speedup'] = teacher_latency['latency_ms_p50'] / max(report['latency_ms_p50'], 1e-9)
+        return report
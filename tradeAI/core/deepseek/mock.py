@@ -0,0 +1,261 @@
+"""
+Local stand-in for the DeepSeek API, for offline and load testing.
+"""
+
+import json
+import time
+import asyncio
+import logging
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+import numpy as np
+from aiohttp import web
+
+from .client import ENDPOINTS, LoopThread
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class LatencyModel:
+    """
+    Distribution of simulated server latency in seconds.
+
+    ``distribution`` is one of ``constant``, ``uniform`` (mean +/- spread
+    * mean), ``normal`` (standard deviation spread * mean), ``lognormal``
+    (median mean, sigma spread) or ``exponential``. With probability
+    ``spike_probability`` a further ``spike`` seconds is added, to model
+    tail events such as GC pauses or cold caches.
+    """
+    distribution: str = 'lognormal'
+    mean: float = 0.02
+    spread: float = 0.5
+    spike_probability: float = 0.0
+    spike: float = 0.0
+
+    def sample(self, rng: np.random.Generator) -> float:
+        """Draw one latency."""
+        if self.distribution == 'constant':
+            latency = self.mean
+        elif self.distribution == 'uniform':
+            latency = rng.uniform(self.mean * (1 - self.spread), self.mean * (1 + self.spread))
+        elif self.distribution == 'normal':
+            latency = rng.normal(self.mean, self.spread * self.mean)
+        elif self.distribution == 'lognormal':
+            latency = self.mean * np.exp(rng.normal(0.0, self.spread))
+        elif self.distribution == 'exponential':
+            latency = rng.exponential(self.mean)
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        if self.spike_probability > 0 and rng.random() < self.spike_probability:
+            latency += self.spike
+        return max(0.0, float(latency))
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock server."""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    endpoint_latency: Dict[str, LatencyModel] = field(default_factory=dict)
+    error_rate: float = 0.0
+    rate_limit: Optional[float] = None
+    retry_after: float = 1.0
+    api_key: Optional[str] = None
+    stream_chunks: int = 8
+    chunk_interval: float = 0.005
+    seed: Optional[int] = None
+
+class MockDeepSeekServer:
+    """
+    ``aiohttp.web`` server implementing the endpoints used by the client.
+
+    Every request is delayed by a draw from the configured latency model
+    (per endpoint if given). Requests with a wrong key get 401, requests
+    above ``rate_limit`` per second get 429 with ``Retry-After``, and a
+    fraction ``error_rate`` of the rest fail with 500 or 503. Chat
+    completions with ``"stream": true`` are sent as server-sent events.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        """
+        Initialize mock server.
+
+        Args:
+            config: Server behaviour
+        """
+        self.config = config or MockConfig()
+        self.rng = np.random.default_rng(self.config.seed)
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[LoopThread] = None
+        self._arrivals = deque()
+
+        self.requests = Counter()
+        self.responses = Counter()
+
+    def _app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(ENDPOINTS['models'], self.models)
+        app.router.add_get(ENDPOINTS['models'] + '/{name}', self.model_info)
+        app.router.add_post(ENDPOINTS['chat'], self.chat)
+        for name in ('rl_train', 'rl_optimize', 'rl_evaluate', 'distill', 'distill_optimize', 'distill_validate'):
+            app.router.add_post(ENDPOINTS[name], getattr(self, name))
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving on the running event loop.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            Base URL of the server
+        """
+        self._runner = web.AppRunner(self._app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving on a private event loop thread, so the server does
+        not compete with the client under test for its loop.
+
+        Returns:
+            Base URL of the server
+        """
+        self._loop = LoopThread()
+        return self._loop.run(self.start(host, port))
+
+    def stop_in_thread(self) -> None:
+        """Stop a server started with ``start_in_thread``."""
+        if self._loop is not None:
+            self._loop.run(self.stop())
+            self._loop.stop()
+            self._loop = None
+
+    def _rate_limited(self) -> bool:
+        if self.config.rate_limit is None:
+            return False
+        now = time.monotonic()
+        while self._arrivals and now - self._arrivals[0] >= 1.0:
+            self._arrivals.popleft()
+        if len(self._arrivals) >= self.config.rate_limit:
+            return True
+        self._arrivals.append(now)
+        return False
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        cfg = self.config
+        self.requests[request.path] += 1
+        if cfg.api_key is not None and request.headers.get('Authorization') != f"Bearer {cfg.api_key}":
+            response = web.json_response({'error': 'invalid api key'}, status=401)
+        elif self._rate_limited():
+            response = web.json_response({'error': 'rate limit exceeded'}, status=429,
+                                         headers={'Retry-After': str(cfg.retry_after)})
+        else:
+            latency = cfg.endpoint_latency.get(request.path, cfg.latency).sample(self.rng)
+            await asyncio.sleep(latency)
+            if cfg.error_rate > 0 and self.rng.random() < cfg.error_rate:
+                status = int(self.rng.choice([500, 503]))
+                response = web.json_response({'error': 'injected failure'}, status=status)
+            else:
+                response = await handler(request)
+        self.responses[response.status] += 1
+        return response
+
+    async def models(self, request: web.Request) -> web.Response:
+        return web.json_response({'data': [{'id': 'deepseek-chat'}, {'id': 'deepseek-rl'}, {'id': 'deepseek-distill'}]})
+
+    async def model_info(self, request: web.Request) -> web.Response:
+        return web.json_response({'id': request.match_info['name'], 'object': 'model'})
+
+    def _decision(self) -> str:
+        action = ['sell', 'hold', 'buy'][int(self.rng.integers(3))]
+        return json.dumps({'action': action, 'confidence': round(float(self.rng.uniform(0.5, 1.0)), 3)})
+
+    async def chat(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        content = self._decision()
+        model = body.get('model', 'deepseek-chat')
+        if not body.get('stream'):
+            return web.json_response({
+                'id': f"chatcmpl-{self.requests[request.path]}",
+                'object': 'chat.completion',
+                'model': model,
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': len(json.dumps(body.get('messages', []))) // 4,
+                          'completion_tokens': self.config.stream_chunks}
+            })
+
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache'})
+        await response.prepare(request)
+        n = max(1, self.config.stream_chunks)
+        bounds = np.linspace(0, len(content), n + 1).astype(int)
+        for i in range(n):
+            chunk = {'object': 'chat.completion.chunk', 'model': model,
+                     'choices': [{'index': 0, 'delta': {'content': content[bounds[i]:bounds[i + 1]]},
+                                  'finish_reason': 'stop' if i == n - 1 else None}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            if i < n - 1:
+                await asyncio.sleep(self.config.chunk_interval)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def rl_train(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        episodes = int(body.get('training_config', {}).get('episodes', 100))
+        return web.json_response({'status': 'completed', 'episodes': episodes,
+                                  'mean_reward': float(self.rng.normal())})
+
+    async def rl_optimize(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({'status': 'optimized', 'strategy': body.get('strategy')})
+
+    async def rl_evaluate(self, request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({
+            'sharpe_ratio': float(self.rng.normal(1.0, 0.5)),
+            'total_return': float(self.rng.normal(0.05, 0.1)),
+            'max_drawdown': float(-abs(self.rng.normal(0.1, 0.05)))
+        })
+
+    async def distill(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({'status': 'completed', 'model': f"{body.get('teacher')}-distilled"})
+
+    async def distill_optimize(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({'status': 'optimized', 'model': body.get('model'),
+                                  'target': body.get('config', {}).get('target', 'cpu')})
+
+    async def distill_validate(self, request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({'accuracy': float(self.rng.uniform(0.8, 0.95)),
+                                  'latency_ms': float(self.rng.uniform(0.5, 2.0))})
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get server statistics.
+
+        Returns:
+            Dictionary with request counts per path and response counts per
+            status
+        """
+        return {
+            'requests': dict(self.requests),
+            'responses': dict(self.responses),
+            'total': sum(self.requests.values())
+        }
@@ -0,0 +1,333 @@
+"""
+Client-side rate limiting and adaptive concurrency for DeepSeek calls.
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Token bucket allowing bursts of ``capacity`` at ``rate`` per second.
+
+    Waiters are served in arrival order. ``pause`` empties the bucket
+    until a deadline, which is how a server's Retry-After is honoured:
+    every caller of the endpoint waits, and afterwards they are released
+    one token at a time instead of all at once.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (defaults to one second of rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self.wait_time = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if available, without waiting.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Whether the tokens were taken
+        """
+        self._refill(time.monotonic())
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until tokens are available and take them.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds waited
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = time.monotonic()
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                now = time.monotonic()
+                # Tokens may be negative after a pause; wait out the deficit
+                deficit = tokens - self.tokens
+                await asyncio.sleep(max(deficit / self.rate, self._updated - now, 1e-4))
+        waited = time.monotonic() - start
+        self.wait_time += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no tokens for the next ``seconds``.
+
+        Args:
+            seconds: Pause length
+        """
+        now = time.monotonic()
+        self._refill(now)
+        until = now + seconds
+        if until > self._updated:
+            self.tokens = min(self.tokens, 0.0)
+            self._updated = until
+
+class AIMDLimiter:
+    """
+    Concurrency limit adapted by additive increase, multiplicative decrease.
+
+    Each successful request adds ``increase / limit`` to the limit (about
+    ``increase`` per round trip's worth of completions). A rate-limited
+    request, or one whose latency exceeds ``latency_tolerance`` times a low
+    percentile of recent latencies, multiplies the limit by ``decrease``.
+    A percentile rather than the minimum keeps one unusually fast response
+    from making ordinary jitter look like congestion. Only
+    requests started after the previous decrease can trigger another, so a
+    burst of 429s from one overload cuts the limit once, not once per
+    request.
+    """
+
+    def __init__(self,
+                 initial: float = 8,
+                 min_limit: float = 1,
+                 max_limit: float = 256,
+                 increase: float = 1.0,
+                 decrease: float = 0.5,
+                 latency_tolerance: Optional[float] = 2.0,
+                 baseline_percentile: float = 10.0,
+                 window_size: int = 100):
+        """
+        Initialize limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            increase: Additive increase per limit's worth of successes
+            decrease: Multiplicative decrease factor
+            latency_tolerance: Latency relative to the baseline that counts
+                as congestion (None ignores latency)
+            baseline_percentile: Percentile of recent latencies used as the
+                uncongested baseline
+            window_size: Recent latencies used for the baseline
+        """
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.baseline_percentile = baseline_percentile
+        self.latencies = deque(maxlen=window_size)
+        self.in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._last_decrease = float('-inf')
+
+        self.n_increases = 0
+        self.n_decreases = 0
+
+    async def acquire(self) -> float:
+        """
+        Wait for a slot under the current limit.
+
+        Returns:
+            Start time (``time.monotonic()``) to pass to ``release``
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return time.monotonic()
+
+    async def release(self,
+                      started: float,
+                      latency: Optional[float] = None,
+                      throttled: bool = False,
+                      succeeded: bool = False) -> None:
+        """
+        Free a slot and adapt the limit to the outcome.
+
+        Args:
+            started: Value returned by ``acquire``
+            latency: Request latency (None for failures unrelated to load)
+            throttled: Whether the server rate-limited the request
+            succeeded: Whether a request without a comparable latency (e.g.
+                a stream) succeeded; it counts towards increases but not
+                towards the latency baseline
+        """
+        congested = throttled
+        if latency is not None and not throttled:
+            self.latencies.append(latency)
+            ordered = sorted(self.latencies)
+            baseline = ordered[int(len(ordered) * self.baseline_percentile / 100)]
+            congested = (self.latency_tolerance is not None and len(self.latencies) > 1
+                         and latency > self.latency_tolerance * baseline)
+        if congested:
+            if started > self._last_decrease:
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._last_decrease = time.monotonic()
+                self.n_decreases += 1
+        elif latency is not None or succeeded:
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            self.n_increases += 1
+
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets in front of a shared AIMD concurrency limit.
+
+    ``rates`` maps endpoint paths (or prefixes, longest match wins) to
+    ``(rate, burst)``; other endpoints use ``default_rate``, or only the
+    concurrency limit if it is None.
+    """
+
+    def __init__(self,
+                 rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default_rate: Optional[Tuple[float, float]] = None,
+                 concurrency: Optional[AIMDLimiter] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rates: Endpoint path to (requests per second, burst)
+            default_rate: (requests per second, burst) for other endpoints
+            concurrency: Adaptive concurrency limit (a default AIMDLimiter
+                if None)
+        """
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.concurrency = concurrency or AIMDLimiter()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.n_throttled = 0
+        # Kept apart from the AIMD window: time to first event is not a full response latency
+        self.stream_first_event_times = deque(maxlen=self.concurrency.latencies.maxlen)
+
+    def bucket(self, path: str) -> Optional[TokenBucket]:
+        """
+        Token bucket governing an endpoint.
+
+        Args:
+            path: Endpoint path
+
+        Returns:
+            TokenBucket, or None if the endpoint is not rate limited
+        """
+        matches = [prefix for prefix in self.rates if path.startswith(prefix)]
+        prefix = max(matches, key=len) if matches else None
+        rate = self.rates[prefix] if prefix is not None else self.default_rate
+        if rate is None:
+            return None
+        key = prefix if prefix is not None else '*'
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(*rate)
+        return self._buckets[key]
+
+    @asynccontextmanager
+    async def slot(self, path: str) -> AsyncIterator['_Slot']:
+        """
+        Hold a rate-limit token and a concurrency slot for one request.
+
+        Report the outcome on the yielded slot with ``ok()`` (or
+        ``first_event()`` for streams) or ``throttled(retry_after)``; a
+        slot left unreported releases without adapting the limit.
+
+        Args:
+            path: Endpoint path
+        """
+        bucket = self.bucket(path)
+        if bucket is not None:
+            await bucket.acquire()
+        started = await self.concurrency.acquire()
+        slot = _Slot(self, bucket, started)
+        try:
+            yield slot
+        finally:
+            await self.concurrency.release(started, slot.latency, slot.was_throttled, slot.succeeded)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with the concurrency limit and throttling counts
+        """
+        return {
+            'concurrency_limit': self.concurrency.limit,
+            'in_flight': self.concurrency.in_flight,
+            'increases': self.concurrency.n_increases,
+            'decreases': self.concurrency.n_decreases,
+            'throttled': self.n_throttled,
+            'stream_first_event_ms_mean': (1000 * sum(self.stream_first_event_times) / len(self.stream_first_event_times)
+                                           if self.stream_first_event_times else 0.0),
+            'bucket_wait_time': {key: bucket.wait_time for key, bucket in self._buckets.items()}
+        }
+
+class _Slot:
+    """Outcome of one request holding a RateLimiter slot."""
+
+    def __init__(self, limiter: RateLimiter, bucket: Optional[TokenBucket], started: float):
+        self._limiter = limiter
+        self._bucket = bucket
+        self.started = started
+        self.sent_at: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.first_event_latency: Optional[float] = None
+        self.succeeded = False
+        self.was_throttled = False
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - (self.sent_at if self.sent_at is not None else self.started)
+
+    def sent(self) -> None:
+        """Mark the request as leaving the client, after any local queueing."""
+        self.sent_at = time.monotonic()
+
+    def ok(self) -> None:
+        """Record a successful response, timed from ``sent`` if it was called."""
+        self.latency = self._elapsed()
+        self.succeeded = True
+
+    def first_event(self) -> None:
+        """Record the first event of a streamed response.
+
+        Counts as a success for the concurrency limit, but the time is kept
+        in a separate statistic instead of the AIMD latency window.
+        """
+        self.first_event_latency = self._elapsed()
+        self.succeeded = True
+        self._limiter.stream_first_event_times.append(self.first_event_latency)
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a rate-limited response, pausing the endpoint's bucket."""
+        self.was_throttled = True
+        self._limiter.n_throttled += 1
+        if self._bucket is not None and retry_after:
+            self._bucket.pause(retry_after)
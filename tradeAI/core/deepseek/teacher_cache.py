@@ -0,0 +1,286 @@
+"""
+Memory-mapped cache of teacher outputs for repeated distillation runs.
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+from typing import Any, Dict, Optional
+import numpy as np
+import torch
+import torch.nn as nn
+
+from ..data.windows import WindowDataset, WindowLoader
+from ..strategy.checkpoint import checkpoint_hash
+from ...utils.tools import ensure_directory
+
+logger = logging.getLogger(__name__)
+
+def teacher_hash(model: nn.Module) -> str:
+    """
+    Content hash of a model's weights and buffers.
+
+    Args:
+        model: Teacher model
+
+    Returns:
+        Hash string
+    """
+    state = model.state_dict()
+    arrays = {name: value.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+              for name, value in state.items()}
+    shapes = {name: [list(value.shape), str(value.dtype)] for name, value in state.items()}
+    return checkpoint_hash(arrays, {'class': type(model).__name__, 'shapes': shapes})
+
+def dataset_hash(dataset: Any) -> str:
+    """
+    Content hash of the inputs a teacher sees from a dataset.
+
+    Args:
+        dataset: ArrayDataset (its ``x`` column) or WindowDataset (its
+            feature columns and window layout, including the target
+            horizon that decides how many windows there are)
+
+    Returns:
+        Hash string
+    """
+    if isinstance(dataset, WindowDataset):
+        arrays = {name: np.ascontiguousarray(dataset.columns[name]) for name in dataset.features}
+        layout = {'window': dataset.window, 'stride': dataset.stride, 'features': dataset.features,
+                  'horizon': dataset.horizon}
+    else:
+        arrays = {'x': np.ascontiguousarray(dataset.columns['x'])}
+        layout = {}
+    layout['rows'] = len(dataset)
+    return checkpoint_hash(arrays, layout)
+
+class TeacherOutputCache:
+    """
+    Teacher logits (and optionally features) per dataset row, on disk.
+
+    Entries live in ``<directory>/<teacher hash>-<dataset hash>/`` as
+    ``.npy`` files that are opened memory-mapped, so a later run with the
+    same teacher weights and inputs streams outputs from disk instead of
+    running the teacher. Features are only stored when a ``feature_layer``
+    is named; they are the outputs of that submodule, captured with a
+    forward hook. Entries are written to a temporary
+    directory and renamed into place, so readers never see partial data.
+    """
+
+    def __init__(self, directory: str, batch_size: int = 1024, num_workers: int = 2):
+        """
+        Initialize teacher output cache.
+
+        Args:
+            directory: Cache directory
+            batch_size: Rows per teacher forward pass when computing
+            num_workers: Threads gathering input batches when computing
+        """
+        self.directory = directory
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        ensure_directory(directory)
+
+        self.hits = 0
+        self.misses = 0
+        self.teacher_time = 0.0
+
+    def key(self, teacher: nn.Module, dataset: Any, teacher_key: Optional[str] = None,
+            feature_layer: Optional[str] = None) -> str:
+        """
+        Cache key of a teacher and dataset.
+
+        Args:
+            teacher: Teacher model
+            dataset: Input dataset
+            teacher_key: Known teacher hash (e.g. of its saved checkpoint),
+                instead of hashing the weights
+            feature_layer: Submodule whose outputs are stored
+
+        Returns:
+            Key string
+        """
+        key = f"{(teacher_key or teacher_hash(teacher))[:16]}-{dataset_hash(dataset)[:16]}"
+        return f"{key}-{feature_layer}" if feature_layer else key
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Open a cached entry.
+
+        Args:
+            key: Key from ``key``
+
+        Returns:
+            Dictionary with memory-mapped ``logits`` (and ``features``), or
+            None if not cached
+        """
+        path = os.path.join(self.directory, key)
+        meta_path = os.path.join(path, 'meta.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if 'logits' not in meta['arrays']:
+            # Incomplete entry (e.g. written for an empty dataset)
+            return None
+        return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in meta['arrays']}
+
+    def compute(self,
+                teacher: nn.Module,
+                dataset: Any,
+                key: str,
+                feature_layer: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Run the teacher over a dataset and store its outputs.
+
+        Args:
+            teacher: Teacher model
+            dataset: Input dataset with ``gather``
+            key: Key from ``key``
+            feature_layer: Submodule whose outputs are stored as features
+
+        Returns:
+            Dictionary with memory-mapped ``logits`` (and ``features``)
+
+        Raises:
+            ValueError: If the dataset is empty
+        """
+        if len(dataset) == 0:
+            raise ValueError("Cannot compute teacher outputs for an empty dataset")
+        start = time.perf_counter()
+        tmp_path = os.path.join(self.directory, f".{key}.{os.getpid()}.tmp")
+        ensure_directory(tmp_path)
+
+        captured = {}
+        hook = None
+        if feature_layer:
+            module = dict(teacher.named_modules())[feature_layer]
+            hook = module.register_forward_hook(lambda _module, _inputs, output: captured.update(features=output))
+
+        n = len(dataset)
+        loader = WindowLoader(dataset, batch_size=self.batch_size, shuffle=False,
+                              num_workers=self.num_workers, as_torch=True)
+        arrays: Dict[str, np.ndarray] = {}
+        was_training = teacher.training
+        teacher.eval()
+        try:
+            row = 0
+            with torch.inference_mode():
+                for batch in loader:
+                    outputs = {'logits': teacher(batch['x'])}
+                    if feature_layer:
+                        outputs['features'] = captured['features'].reshape(len(batch['x']), -1)
+                    for name, values in outputs.items():
+                        values = values.float().numpy()
+                        if name not in arrays:
+                            arrays[name] = np.lib.format.open_memmap(
+                                os.path.join(tmp_path, f"{name}.npy"), mode='w+',
+                                dtype=np.float32, shape=(n, *values.shape[1:]))
+                        arrays[name][row:row + len(values)] = values
+                    row += len(batch['x'])
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+        finally:
+            teacher.train(was_training)
+            if hook is not None:
+                hook.remove()
+
+        for values in arrays.values():
+            values.flush()
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump({'arrays': list(arrays), 'rows': n, 'feature_layer': feature_layer}, f)
+        del arrays
+
+        path = os.path.join(self.directory, key)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Another run stored the same entry first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.teacher_time += time.perf_counter() - start
+        return self.get(key)
+
+    def get_or_compute(self,
+                       teacher: nn.Module,
+                       dataset: Any,
+                       teacher_key: Optional[str] = None,
+                       feature_layer: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Open cached teacher outputs, computing them on a miss.
+
+        Args:
+            teacher: Teacher model
+            dataset: Input dataset with ``gather``
+            teacher_key: Known teacher hash, instead of hashing the weights
+            feature_layer: Submodule whose outputs are stored as features
+
+        Returns:
+            Dictionary with memory-mapped ``logits`` (and ``features``)
+        """
+        key = self.key(teacher, dataset, teacher_key, feature_layer)
+        outputs = self.get(key)
+        if outputs is not None:
+            self.hits += 1
+            return outputs
+        self.misses += 1
+        logger.info(f"Computing teacher outputs for {len(dataset)} rows ({key})")
+        return self.compute(teacher, dataset, key, feature_layer)
+
+    def clear(self) -> None:
+        """Delete all cached entries."""
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, time spent running the teacher
+            and bytes on disk
+        """
+        size = 0
+        for root, _, files in os.walk(self.directory):
+            size += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'teacher_time': self.teacher_time,
+            'disk_bytes': size
+        }
+
+class TeacherOutputDataset:
+    """
+    A dataset whose batches also carry the cached teacher outputs of
+    their rows, as ``teacher_logits`` (and ``teacher_features``).
+    """
+
+    def __init__(self, dataset: Any, outputs: Dict[str, np.ndarray]):
+        """
+        Initialize dataset.
+
+        Args:
+            dataset: Input dataset with ``gather``
+            outputs: Teacher outputs from TeacherOutputCache
+        """
+        if len(outputs['logits']) != len(dataset):
+            raise ValueError("Teacher outputs do not match the dataset length")
+        self.dataset = dataset
+        self.outputs = outputs
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def gather(self, indices: np.ndarray, dtype: Any = np.float32) -> Dict[str, np.ndarray]:
+        indices = np.asarray(indices)
+        batch = self.dataset.gather(indices, dtype)
+        # Sorted reads keep memory-mapped access sequential
+        order = np.argsort(indices, kind='stable')
+        for name, values in self.outputs.items():
+            rows = np.empty((len(indices), *values.shape[1:]), dtype=dtype)
+            rows[order] = values[indices[order]]
+            batch[f"teacher_{name}"] = rows
+        return batch
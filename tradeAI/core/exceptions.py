@@ -2,6 +2,8 @@
 Core exceptions for the NexisAI framework.
 """
 
+from typing import Optional
+
 class NexisAIError(Exception):
     """Base exception for all NexisAI errors."""
     pass
@@ -63,6 +65,18 @@ class APIKeyError(APIError):
     """Raised when there are issues with API keys."""
     pass
 
+class APIResponseError(APIError):
+    """Raised when an API returns an error status."""
+    
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class RateLimitError(APIResponseError):
+    """Raised when an API rejects a request for exceeding its rate limit."""
+    pass
+
 class DataSourceError(DataError):
     """Raised when there are issues with data sources."""
     pass
@@ -1,5 +1,95 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+# Confidence assumed for decisions that do not report one
+DEFAULT_CONFIDENCE = 1.0
+
+StateBatch = Union[np.ndarray, pd.DataFrame, Sequence[Dict[str, Any]]]
+
+def states_to_array(states: StateBatch,
+                    feature_names: Optional[Sequence[str]] = None,
+                    dtype: Any = np.float32) -> np.ndarray:
+    """
+    Convert a batch of states to a contiguous 2-D feature array.
+    
+    Args:
+        states: Array of shape (n, n_features), DataFrame or list of state dicts
+        feature_names: Feature order for DataFrame and dict inputs
+        dtype: Output dtype
+        
+    Returns:
+        Array of shape (n, n_features)
+    """
+    if isinstance(states, np.ndarray):
+        array = states
+    elif isinstance(states, pd.DataFrame):
+        array = states[list(feature_names)].to_numpy() if feature_names else states.to_numpy()
+    else:
+        if feature_names is None:
+            feature_names = list(states[0].keys()) if len(states) else []
+        array = np.array([[state[name] for name in feature_names] for state in states])
+    return np.ascontiguousarray(np.atleast_2d(array), dtype=dtype)
+
+def stack_decisions(decisions: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Stack per-state decision dicts into per-key arrays.
+    
+    Decisions without a ``confidence`` get ``DEFAULT_CONFIDENCE`` and other
+    keys missing from some decisions are filled with None, so every array
+    has one entry per decision.
+    
+    Args:
+        decisions: Decisions as returned by ``predict``
+        
+    Returns:
+        Dictionary mapping each decision key to an array
+        
+    Raises:
+        ValueError: If a decision has no ``action``
+    """
+    keys: Dict[str, None] = {'action': None, 'confidence': None}
+    for i, decision in enumerate(decisions):
+        if 'action' not in decision:
+            raise ValueError(f"Decision {i} has no 'action': {decision!r}")
+        keys.update(dict.fromkeys(decision))
+    
+    defaults = {'confidence': DEFAULT_CONFIDENCE}
+    result = {
+        key: np.asarray([decision.get(key, defaults.get(key)) for decision in decisions])
+        for key in keys
+    }
+    if not len(decisions):
+        result['action'] = np.empty(0, dtype=object)
+    result['confidence'] = result['confidence'].astype(float)
+    return result
+
+def unstack_decisions(batch: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Split per-key decision arrays into per-state decision dicts.
+    
+    Args:
+        batch: Decisions as returned by ``predict_batch``
+        
+    Returns:
+        List of decision dicts with native Python scalars
+        
+    Raises:
+        ValueError: If the arrays do not all have the same length
+    """
+    n = len(batch['action']) if 'action' in batch else len(next(iter(batch.values()), []))
+    lengths = {key: len(values) for key, values in batch.items()}
+    if any(length != n for length in lengths.values()):
+        raise ValueError(f"Decision arrays have different lengths: {lengths}")
+    return [
+        {
+            key: values[i].item() if isinstance(values[i], np.generic) else values[i]
+            for key, values in batch.items()
+        }
+        for i in range(n)
+    ]
 
 class BaseStrategy(ABC):
     """
@@ -18,11 +108,28 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def partial_fit(self, data: Dict[str, Any], **kwargs) -> None:
+        """
+        Update the strategy model incrementally with a mini-batch.
+        
+        Used by ``OnlineTrainer`` to adapt to new market data without a
+        full ``train`` run.
+        
+        Args:
+            data: Dictionary containing the mini-batch (``bars`` DataFrame)
+            **kwargs: Additional training parameters
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental training")
+
     @abstractmethod
     def predict(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate trading decisions based on current market state.
         
+        ``state`` may be a plain dict or a read-only ``StateRecord``
+        mapping (see ``strategy.state``); latency-sensitive strategies can
+        also define ``predict_record`` for positional access.
+        
         Args:
             state: Current market state information
             
@@ -31,11 +138,57 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def predict_batch(self,
+                      states: StateBatch,
+                      feature_names: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Generate trading decisions for a batch of market states.
+        
+        The default implementation calls ``predict`` once per row. Strategies
+        backed by a batched model (e.g. a torch network) should override it
+        with a single forward pass over ``states_to_array(states, ...)``.
+        
+        Args:
+            states: Array of shape (n, n_features), DataFrame with one state
+                per row, or list of state dicts
+            feature_names: Column names for array rows; defaults to the
+                ``features`` entry of ``get_state_space()`` when available
+                
+        Returns:
+            Dictionary mapping each decision key (at least ``action`` and
+            ``confidence``) to an array of length n
+        """
+        rows = self._state_rows(states, feature_names)
+        return stack_decisions([self.predict(row) for row in rows])
+
+    def _state_rows(self,
+                    states: StateBatch,
+                    feature_names: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Convert a state batch to a list of state dicts."""
+        if isinstance(states, pd.DataFrame):
+            return states.to_dict('records')
+        if isinstance(states, np.ndarray):
+            names = feature_names or self._state_feature_names()
+            return [dict(zip(names, row)) for row in np.atleast_2d(states).tolist()]
+        return list(states)
+
+    def _state_feature_names(self) -> List[str]:
+        """Feature names used to label rows of array state batches."""
+        get_state_space = getattr(self, 'get_state_space', None)
+        if get_state_space is not None:
+            features = get_state_space().get('features')
+            if features:
+                return list(features)
+        raise ValueError("feature_names is required for array states of this strategy")
+
     @abstractmethod
     def save(self, path: str) -> None:
         """
         Save strategy model to disk.
         
+        Implementations should prefer ``save_checkpoint`` over pickling
+        whole models, so loads are memory-mapped instead of deserialized.
+        
         Args:
             path: Path to save the model
         """
@@ -51,6 +204,71 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def get_parameters(self) -> Dict[str, Any]:
+        """
+        Get the model parameters as named arrays or tensors.
+        
+        Returns:
+            Mapping of parameter name to NumPy array or torch tensor
+            (e.g. a torch ``state_dict()``)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not expose its parameters")
+
+    def set_parameters(self, parameters: Dict[str, Any]) -> None:
+        """
+        Replace the model parameters.
+        
+        Args:
+            parameters: Mapping as returned by ``get_parameters``
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not accept parameters")
+
+    def get_checkpoint_metadata(self) -> Dict[str, Any]:
+        """
+        Get JSON-serializable metadata stored with checkpoints.
+        
+        Returns:
+            Metadata dictionary (hyperparameters, training step, ...)
+        """
+        return {}
+
+    def save_checkpoint(self, path: str, background: bool = False) -> Union[str, Future]:
+        """
+        Save ``get_parameters()`` in the memory-mapped checkpoint format.
+        
+        Args:
+            path: Checkpoint file
+            background: Write on a background thread and return immediately
+            
+        Returns:
+            Content hash, or a Future resolving to it when ``background``
+        """
+        from .checkpoint import AsyncCheckpointWriter, save_checkpoint
+        
+        metadata = {'strategy': type(self).__name__, **self.get_checkpoint_metadata()}
+        if not background:
+            return save_checkpoint(path, self.get_parameters(), metadata)
+        if getattr(self, '_checkpoint_writer', None) is None:
+            self._checkpoint_writer = AsyncCheckpointWriter()
+        return self._checkpoint_writer.save(path, self.get_parameters(), metadata)
+
+    def load_checkpoint(self, path: str, verify: bool = False) -> Dict[str, Any]:
+        """
+        Memory-map a checkpoint and pass its tensors to ``set_parameters``.
+        
+        Args:
+            path: Checkpoint file
+            verify: Check the content hash before loading
+            
+        Returns:
+            Checkpoint metadata including its ``content_hash``
+        """
+        from .checkpoint import load_checkpoint
+        
+        checkpoint = load_checkpoint(path, verify=verify)
+        self.set_parameters(checkpoint.tensors)
+        return {**checkpoint.metadata, 'content_hash': checkpoint.content_hash}
+
 class RLStrategy(BaseStrategy):
     """
     Base class for reinforcement learning based trading strategies.
@@ -89,4 +307,27 @@ class RLStrategy(BaseStrategy):
         Returns:
             Reward value
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def get_reward_batch(self,
+                         states: Dict[str, np.ndarray],
+                         actions: np.ndarray) -> np.ndarray:
+        """
+        Calculate rewards for a batch of state-action pairs.
+        
+        The default implementation calls ``get_reward`` per row; override it
+        with array arithmetic for vectorized environments.
+        
+        Args:
+            states: Mapping of state field to array of length n
+            actions: Array of n action names
+            
+        Returns:
+            Array of n reward values
+        """
+        n = len(actions)
+        rewards = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            state = {key: values[i] for key, values in states.items()}
+            rewards[i] = self.get_reward(state, {'action': actions[i]})
+        return rewards 
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Micro-batching inference front-end for concurrent strategy predictions.
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .base import BaseStrategy, unstack_decisions
+from ..monitoring.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """
+    Gathers concurrent ``predict`` calls into batches for ``predict_batch``.
+
+    A batch is dispatched as soon as ``max_batch_size`` requests are queued
+    or ``max_wait_ms`` has passed since the first request of the batch
+    arrived, which bounds the queueing delay added to each call.
+    """
+
+    def __init__(self,
+                 strategy: BaseStrategy,
+                 max_batch_size: int = 64,
+                 max_wait_ms: float = 2.0,
+                 feature_names: Optional[Sequence[str]] = None,
+                 offload: bool = True,
+                 window_size: int = 1000):
+        """
+        Initialize micro-batcher.
+
+        Args:
+            strategy: Strategy serving the batched forward pass
+            max_batch_size: Maximum number of requests per batch
+            max_wait_ms: Maximum time to wait for a batch to fill
+            feature_names: Feature order passed to ``predict_batch``
+            offload: Run forward passes in a worker thread so the event loop
+                keeps collecting the next batch meanwhile
+            window_size: Size of sliding window for latency statistics
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        self.strategy = strategy
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.feature_names = feature_names
+        self.offload = offload
+
+        self.metrics = MetricsCollector(window_size)
+        self.batch_sizes = deque(maxlen=window_size)
+        self.total_requests = 0
+        self.started_at: Optional[float] = None
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Requests taken off the queue whose futures are not yet resolved
+        self._in_flight: List[Tuple[Dict[str, Any], asyncio.Future, float]] = []
+
+    async def __aenter__(self) -> 'MicroBatcher':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the batching loop."""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self.started_at = time.perf_counter()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching loop, failing requests being batched or still queued."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        pending = self._in_flight
+        self._in_flight = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("MicroBatcher stopped"))
+
+    @staticmethod
+    def _fail(requests: List[Tuple[Dict[str, Any], asyncio.Future, float]], error: Exception) -> None:
+        """Resolve every unfinished request with an error."""
+        for _, future, _ in requests:
+            if not future.done():
+                future.set_exception(error)
+
+    async def predict(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit one state and wait for its decision.
+
+        Args:
+            state: Current market state information
+
+        Returns:
+            Dictionary containing trading decisions
+        """
+        if self._worker is None:
+            raise RuntimeError("MicroBatcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((state, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Dict[str, Any], asyncio.Future, float]]:
+        """Collect the next batch under the size and wait limits.
+
+        Requests are tracked in ``_in_flight`` as soon as they leave the
+        queue, so ``stop`` can fail them if the loop is cancelled.
+        """
+        batch = self._in_flight = []
+        batch.append(await self._queue.get())
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Batching loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            states = [state for state, _, _ in batch]
+
+            try:
+                if self.offload:
+                    decisions = await loop.run_in_executor(
+                        None, self.strategy.predict_batch, states, self.feature_names
+                    )
+                else:
+                    decisions = self.strategy.predict_batch(states, self.feature_names)
+                results = unstack_decisions(decisions)
+                if len(results) != len(batch):
+                    raise ValueError(f"predict_batch returned {len(results)} decisions for {len(batch)} states")
+            except Exception as e:
+                logger.error(f"Batched prediction failed: {e}")
+                self._fail(batch, e)
+                self._in_flight = []
+                continue
+
+            now = time.perf_counter()
+            for (_, future, enqueued), decision in zip(batch, results):
+                if not future.done():
+                    future.set_result(decision)
+                self.metrics.record_latency((now - enqueued) * 1000)
+            self._in_flight = []
+
+            self.batch_sizes.append(len(batch))
+            self.total_requests += len(batch)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Get batching and latency statistics.
+
+        Returns:
+            Dictionary with latency percentiles (ms), batch sizes and throughput
+        """
+        stats = self.metrics.get_statistics()
+        if self.batch_sizes:
+            stats.update({
+                'avg_batch_size': float(np.mean(self.batch_sizes)),
+                'max_batch_size': int(np.max(self.batch_sizes)),
+                'batch_count': len(self.batch_sizes)
+            })
+        if self.started_at is not None:
+            elapsed = time.perf_counter() - self.started_at
+            stats['throughput'] = self.total_requests / elapsed if elapsed > 0 else 0.0
+        stats['total_requests'] = self.total_requests
+        return stats
@@ -0,0 +1,244 @@
+"""
+Prediction cache keyed on quantized strategy state.
+"""
+
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .base import BaseStrategy, StateBatch, stack_decisions, unstack_decisions
+
+logger = logging.getLogger(__name__)
+
+class PredictionCache:
+    """
+    LRU cache with TTL for strategy decisions.
+
+    Numeric state values are quantized with per-feature tolerances before
+    hashing, so states that differ by less than the tolerance share an entry.
+    """
+
+    def __init__(self,
+                 max_size: int = 10000,
+                 ttl: Optional[float] = 1.0,
+                 tolerances: Optional[Dict[str, float]] = None,
+                 default_tolerance: float = 0.0):
+        """
+        Initialize prediction cache.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl: Entry lifetime in seconds (None disables expiry)
+            tolerances: Quantization step per feature
+            default_tolerance: Quantization step for other numeric features
+                (0 means exact match)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.tolerances = dict(tolerances or {})
+        self.default_tolerance = default_tolerance
+
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def make_key(self, state: Dict[str, Any]) -> Hashable:
+        """
+        Build the cache key of a state.
+
+        Args:
+            state: Market state information
+
+        Returns:
+            Hashable tuple of quantized (feature, value) pairs
+        """
+        key = []
+        for name in sorted(state):
+            value = state[name]
+            if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+                tolerance = self.tolerances.get(name, self.default_tolerance)
+                if tolerance > 0 and math.isfinite(value):
+                    value = round(float(value) / tolerance)
+                else:
+                    value = float(value)
+            elif isinstance(value, (list, np.ndarray)):
+                value = tuple(np.asarray(value).ravel().tolist())
+            key.append((name, value))
+        return tuple(key)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Look up a decision.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached decision or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, decision = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return decision
+
+    def put(self, key: Hashable, decision: Dict[str, Any]) -> None:
+        """
+        Store a decision.
+
+        Args:
+            key: Cache key from ``make_key``
+            decision: Decision returned by the strategy
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), decision)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._entries),
+            'max_size': self.max_size
+        }
+
+class CachedStrategy(BaseStrategy):
+    """
+    Opt-in memoization wrapper around a strategy's predictions.
+
+    Cache hits return the stored decision without running the model.
+    Training or loading a new model clears the cache.
+    """
+
+    def __init__(self, strategy: BaseStrategy, cache: Optional[PredictionCache] = None, **cache_kwargs):
+        """
+        Initialize cached strategy.
+
+        Args:
+            strategy: Strategy to wrap
+            cache: Prediction cache (built from ``cache_kwargs`` if omitted)
+            **cache_kwargs: Arguments for PredictionCache
+        """
+        self.strategy = strategy
+        self.cache = cache or PredictionCache(**cache_kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped strategy's own methods (e.g. get_state_space)
+        strategy = self.__dict__.get('strategy')
+        if strategy is None:
+            raise AttributeError(name)
+        return getattr(strategy, name)
+
+    def train(self, data: Dict[str, Any], **kwargs) -> None:
+        """
+        Train the wrapped strategy and clear the cache.
+
+        Args:
+            data: Dictionary containing training data
+            **kwargs: Additional training parameters
+        """
+        self.strategy.train(data, **kwargs)
+        self.cache.clear()
+
+    def predict(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the cached decision for a state, predicting on a miss.
+
+        Args:
+            state: Current market state information
+
+        Returns:
+            Copy of the (possibly cached) decision
+        """
+        key = self.cache.make_key(state)
+        decision = self.cache.get(key)
+        if decision is None:
+            decision = self.strategy.predict(state)
+            self.cache.put(key, decision)
+        return dict(decision)
+
+    def predict_batch(self,
+                      states: StateBatch,
+                      feature_names: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Predict a batch, running the model once over the distinct cache misses.
+
+        Args:
+            states: Array of shape (n, n_features), DataFrame with one state
+                per row, or list of state dicts
+            feature_names: Column names for array rows
+
+        Returns:
+            Dictionary mapping each decision key to an array of length n
+        """
+        rows = self.strategy._state_rows(states, feature_names)
+        keys = [self.cache.make_key(row) for row in rows]
+        decisions: List[Optional[Dict[str, Any]]] = [self.cache.get(key) for key in keys]
+
+        # Run the model once over the distinct missing states
+        missing: Dict[Hashable, List[int]] = {}
+        for i, decision in enumerate(decisions):
+            if decision is None:
+                missing.setdefault(keys[i], []).append(i)
+        if missing:
+            first_rows = [rows[indices[0]] for indices in missing.values()]
+            computed = unstack_decisions(self.strategy.predict_batch(first_rows))
+            for (key, indices), decision in zip(missing.items(), computed):
+                self.cache.put(key, decision)
+                for i in indices:
+                    decisions[i] = decision
+
+        return stack_decisions(decisions)
+
+    def save(self, path: str) -> None:
+        """
+        Save the wrapped strategy.
+
+        Args:
+            path: Path to save the model
+        """
+        self.strategy.save(path)
+
+    def load(self, path: str) -> None:
+        """
+        Load the wrapped strategy and clear the cache.
+
+        Args:
+            path: Path to load the model from
+        """
+        self.strategy.load(path)
+        self.cache.clear()
@@ -0,0 +1,295 @@
+"""
+Memory-mapped strategy checkpoint format.
+
+Layout::
+
+    MAGIC (8 bytes) | header length (uint64 LE) | JSON header | padding |
+    tensor blob | padding | tensor blob | ...
+
+Every blob starts on a 64-byte boundary, so on load each tensor is a view
+into one copy-on-write memory map and parameter data is only paged in
+when it is touched.
+"""
+
+import os
+import json
+import struct
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+import numpy as np
+import torch
+
+from ...utils.tools import compute_hash
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'TAICKPT1'
+ALIGNMENT = 64
+FORMAT_VERSION = 1
+
+Tensor = Union[np.ndarray, torch.Tensor]
+
+@dataclass
+class Checkpoint:
+    """A loaded checkpoint."""
+    tensors: Dict[str, Tensor]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    content_hash: str = ''
+    path: Optional[str] = None
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _to_numpy(value: Tensor) -> np.ndarray:
+    """Contiguous NumPy view (or copy) of a tensor."""
+    if isinstance(value, torch.Tensor):
+        value = value.detach().cpu().contiguous()
+        if value.dtype == torch.bfloat16:
+            # NumPy has no bfloat16; store the raw bits
+            return value.view(torch.int16).numpy()
+        return value.numpy()
+    return np.ascontiguousarray(value)
+
+def _raw_bytes(array: np.ndarray) -> memoryview:
+    """Byte view of a contiguous array."""
+    return memoryview(array.reshape(-1).view(np.uint8))
+
+def checkpoint_hash(arrays: Mapping[str, np.ndarray], metadata: Optional[Dict[str, Any]] = None) -> str:
+    """Content hash over tensor names, dtypes, shapes, bytes and metadata.
+
+    Args:
+        arrays: Contiguous arrays by name
+        metadata: JSON-serializable metadata
+
+    Returns:
+        Hash string
+    """
+    return compute_hash({
+        'tensors': {
+            name: [str(array.dtype), list(array.shape), compute_hash(_raw_bytes(array))]
+            for name, array in arrays.items()
+        },
+        'metadata': metadata or {}
+    })
+
+def _read_header(f: Any, path: str) -> Tuple[Dict[str, Any], int]:
+    """Parse the header from an open file; returns it with the data offset."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{path} is not a strategy checkpoint")
+    header_len, = struct.unpack('<Q', f.read(8))
+    return json.loads(f.read(header_len)), _align(len(MAGIC) + 8 + header_len)
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Read only the JSON header of a checkpoint.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        Header dictionary
+    """
+    with open(path, 'rb') as f:
+        return _read_header(f, path)[0]
+
+def save_checkpoint(path: str,
+                    tensors: Mapping[str, Tensor],
+                    metadata: Optional[Dict[str, Any]] = None,
+                    skip_unchanged: bool = True) -> str:
+    """Write tensors and metadata to a checkpoint file.
+
+    The file is written next to ``path`` and renamed into place, so readers
+    never see a partial checkpoint.
+
+    Args:
+        path: Destination file
+        tensors: NumPy arrays or torch tensors by name
+        metadata: JSON-serializable metadata (hyperparameters, step, ...)
+        skip_unchanged: Do not rewrite ``path`` if it already holds a
+            checkpoint with the same content hash
+
+    Returns:
+        Content hash of the checkpoint
+    """
+    metadata = metadata or {}
+    arrays = {}
+    torch_dtypes = {}
+    for name, value in tensors.items():
+        arrays[name] = _to_numpy(value)
+        if isinstance(value, torch.Tensor):
+            torch_dtypes[name] = str(value.dtype).replace('torch.', '')
+
+    content_hash = checkpoint_hash(arrays, metadata)
+    if skip_unchanged and os.path.exists(path):
+        try:
+            if read_header(path).get('content_hash') == content_hash:
+                logger.debug(f"Checkpoint {path} unchanged, skipping write")
+                return content_hash
+        except (ValueError, OSError, json.JSONDecodeError):
+            pass
+
+    entries = {}
+    offset = end = 0
+    for name, array in arrays.items():
+        entries[name] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset,
+            'nbytes': int(array.nbytes)
+        }
+        if name in torch_dtypes:
+            entries[name]['torch_dtype'] = torch_dtypes[name]
+        end = offset + array.nbytes
+        offset = _align(end)
+
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'content_hash': content_hash,
+        'metadata': metadata,
+        'tensors': entries
+    }).encode()
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + entries[name]['offset'])
+                f.write(_raw_bytes(array))
+            f.truncate(data_start + end)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return content_hash
+
+def load_checkpoint(path: str,
+                    mmap: bool = True,
+                    as_torch: Optional[bool] = None,
+                    verify: bool = False) -> Checkpoint:
+    """Load a checkpoint, memory-mapping tensor data by default.
+
+    Memory-mapped tensors are copy-on-write: in-place updates stay private
+    to the process and never modify the file.
+
+    Args:
+        path: Checkpoint file
+        mmap: Map the file instead of reading it into memory
+        as_torch: Return torch tensors (sharing memory with the map); by
+            default each tensor comes back as the type it was saved from
+        verify: Recompute the content hash and compare it with the header
+
+    Returns:
+        Checkpoint
+    """
+    with open(path, 'rb') as f:
+        header, data_start = _read_header(f, path)
+        if mmap:
+            buffer = np.memmap(f, dtype=np.uint8, mode='c')
+        else:
+            f.seek(0)
+            buffer = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+
+    arrays = {}
+    for name, entry in header['tensors'].items():
+        start = data_start + entry['offset']
+        blob = buffer[start:start + entry['nbytes']]
+        arrays[name] = blob.view(np.dtype(entry['dtype'])).reshape(entry['shape'])
+
+    if verify and checkpoint_hash(arrays, header['metadata']) != header['content_hash']:
+        raise ValueError(f"Checkpoint {path} failed integrity check")
+
+    tensors: Dict[str, Tensor] = {}
+    for name, array in arrays.items():
+        torch_dtype = header['tensors'][name].get('torch_dtype')
+        if as_torch or (as_torch is None and torch_dtype is not None):
+            tensor = torch.from_numpy(array)
+            if torch_dtype == 'bfloat16':
+                tensor = tensor.view(torch.bfloat16)
+            tensors[name] = tensor
+        else:
+            tensors[name] = array
+
+    return Checkpoint(
+        tensors=tensors,
+        metadata=header['metadata'],
+        content_hash=header['content_hash'],
+        path=path
+    )
+
+class AsyncCheckpointWriter:
+    """
+    Saves checkpoints on a background thread.
+
+    Tensors are snapshotted when ``save`` is called, so training can keep
+    updating parameters while the file is written.
+    """
+
+    def __init__(self, max_pending: int = 2):
+        """Initialize writer.
+
+        Args:
+            max_pending: Maximum queued saves before ``save`` blocks
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkpoint')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: Dict[Future, str] = {}
+        self._lock = threading.Lock()
+
+    def save(self,
+             path: str,
+             tensors: Mapping[str, Tensor],
+             metadata: Optional[Dict[str, Any]] = None) -> Future:
+        """Schedule a checkpoint save.
+
+        Args:
+            path: Destination file
+            tensors: NumPy arrays or torch tensors by name
+            metadata: JSON-serializable metadata
+
+        Returns:
+            Future resolving to the content hash
+        """
+        snapshot = {
+            name: value.detach().clone() if isinstance(value, torch.Tensor) else np.array(value, copy=True)
+            for name, value in tensors.items()
+        }
+        metadata = json.loads(json.dumps(metadata or {}))
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(save_checkpoint, path, snapshot, metadata)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending[future] = path
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            path = self._pending.pop(future, None)
+        self._slots.release()
+        if future.exception() is not None:
+            logger.error(f"Background checkpoint save to {path} failed: {future.exception()}")
+
+    def wait(self) -> None:
+        """Block until all scheduled saves finish."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Finish pending saves and stop the writer thread."""
+        self._executor.shutdown(wait=True)
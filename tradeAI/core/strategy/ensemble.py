@@ -0,0 +1,346 @@
+"""
+Multi-strategy ensemble runner with shared feature computation.
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from .base import BaseStrategy, stack_decisions, unstack_decisions
+from ..monitoring.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# name -> (func, params), the same shape as MarketDataStream.add_indicator
+FeatureSpec = Tuple[Callable[..., Any], Dict[str, Any]]
+
+Combiner = Callable[[Dict[str, Dict[str, Any]], Dict[str, float]], Dict[str, Any]]
+
+def _feature_key(spec: FeatureSpec) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Identity of a feature computation, independent of its name."""
+    func, params = spec
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    return name, tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+def weighted_vote(decisions: Dict[str, Dict[str, Any]], weights: Dict[str, float]) -> Dict[str, Any]:
+    """Combine decisions by confidence-weighted voting.
+
+    Each member adds ``weight * confidence`` to the score of its action; the
+    action with the highest score wins and the ensemble confidence is its
+    share of the total weight.
+
+    Args:
+        decisions: Member name to decision
+        weights: Member name to weight
+
+    Returns:
+        Combined decision with per-action ``scores``
+    """
+    scores: Dict[str, float] = {}
+    total = 0.0
+    for name, decision in decisions.items():
+        weight = weights.get(name, 1.0)
+        total += weight
+        action = decision.get('action', 'hold')
+        scores[action] = scores.get(action, 0.0) + weight * float(decision.get('confidence', 1.0))
+    if not scores or total <= 0:
+        return {'action': 'hold', 'confidence': 0.0, 'scores': scores}
+    action = max(scores, key=scores.get)
+    return {'action': action, 'confidence': scores[action] / total, 'scores': scores}
+
+_worker_strategies: Dict[str, BaseStrategy] = {}
+
+def _init_worker(strategies: Dict[str, BaseStrategy]) -> None:
+    """Install process-dispatched strategies once per worker."""
+    global _worker_strategies
+    _worker_strategies = strategies
+
+def _worker_predict(name: str, state: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+    start = time.perf_counter()
+    decision = _worker_strategies[name].predict(state)
+    return decision, time.perf_counter() - start
+
+def _worker_predict_batch(name: str, states: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], float]:
+    start = time.perf_counter()
+    decisions = _worker_strategies[name].predict_batch(states)
+    return decisions, time.perf_counter() - start
+
+def _timed(func: Callable, *args) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+@dataclass
+class EnsembleMember:
+    """A registered strategy."""
+    name: str
+    strategy: BaseStrategy
+    weight: float = 1.0
+    features: List[str] = field(default_factory=list)
+    dispatch: str = 'thread'
+
+class EnsembleRunner:
+    """
+    Runs many strategies on the same bars, computing each feature once.
+
+    Strategies declare the features they need as ``name -> (func, params)``
+    specs (the ``MarketDataStream.add_indicator`` convention), either at
+    registration or via an optional ``get_required_features()`` method.
+    Specs are deduplicated across strategies by function and parameters,
+    so twenty strategies asking for ``calculate_rsi(period=14)`` under
+    different names cost one computation.
+
+    Predictions are dispatched concurrently: ``thread`` members share a
+    thread pool (best for models that release the GIL, e.g. torch or
+    NumPy), ``process`` members run in a process pool holding a copy of
+    each such strategy.
+    """
+
+    def __init__(self,
+                 combiner: Optional[Combiner] = None,
+                 max_threads: Optional[int] = None,
+                 max_processes: Optional[int] = None,
+                 window_size: int = 1000):
+        """Initialize ensemble runner.
+
+        Args:
+            combiner: Function combining member decisions (defaults to
+                ``weighted_vote``)
+            max_threads: Thread pool size
+            max_processes: Process pool size
+            window_size: Size of sliding window for latency statistics
+        """
+        self.combiner = combiner or weighted_vote
+        self.max_threads = max_threads or min(32, (os.cpu_count() or 1) + 4)
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.window_size = window_size
+
+        self.members: Dict[str, EnsembleMember] = {}
+        self.feature_specs: Dict[str, FeatureSpec] = {}
+        self._aliases: Dict[str, str] = {}
+        self._spec_owner: Dict[Tuple, str] = {}
+        self.metrics: Dict[str, MetricsCollector] = {}
+        self.feature_time = 0.0
+        self.feature_calls = 0
+
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'EnsembleRunner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def register(self,
+                 name: str,
+                 strategy: BaseStrategy,
+                 weight: float = 1.0,
+                 features: Optional[Dict[str, FeatureSpec]] = None,
+                 dispatch: str = 'thread') -> None:
+        """Register a strategy.
+
+        Args:
+            name: Member name
+            strategy: Strategy instance (must be picklable for ``process``)
+            weight: Ensemble weight
+            features: Feature specs the strategy needs; defaults to its
+                ``get_required_features()`` if defined
+            dispatch: ``thread`` or ``process``
+        """
+        if dispatch not in ('thread', 'process'):
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+        if name in self.members:
+            raise ValueError(f"Strategy {name} already registered")
+        if self._processes is not None and dispatch == 'process':
+            raise RuntimeError("Register process strategies before the first prediction")
+
+        if features is None:
+            get_required_features = getattr(strategy, 'get_required_features', None)
+            features = get_required_features() if get_required_features else {}
+
+        for feature_name, spec in features.items():
+            self._add_feature(feature_name, spec)
+
+        self.members[name] = EnsembleMember(name, strategy, weight, list(features), dispatch)
+        self.metrics[name] = MetricsCollector(self.window_size)
+
+    def _add_feature(self, name: str, spec: FeatureSpec) -> None:
+        """Add a feature spec, aliasing duplicates of an existing computation."""
+        key = _feature_key(spec)
+        if name in self._aliases or name in self.feature_specs:
+            existing = self._aliases.get(name, name)
+            if _feature_key(self.feature_specs[existing]) != key:
+                raise ValueError(f"Feature {name} is already registered with a different computation")
+            return
+        owner = self._spec_owner.get(key)
+        if owner is not None:
+            self._aliases[name] = owner
+        else:
+            self._spec_owner[key] = name
+            self.feature_specs[name] = spec
+
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        """Update member weights.
+
+        Args:
+            weights: Member name to weight
+        """
+        for name, weight in weights.items():
+            self.members[name].weight = weight
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        return {name: member.weight for name, member in self.members.items()}
+
+    def compute_features(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """Compute the union of member features over a bar history.
+
+        Multi-column outputs (e.g. ``calculate_macd``) are expanded into
+        ``<name>_<column>`` columns.
+
+        Args:
+            bars: OHLCV bars
+
+        Returns:
+            Bars with one column per feature (aliases included)
+        """
+        start = time.perf_counter()
+        columns: Dict[str, Any] = {}
+        suffixes: Dict[str, List[str]] = {}
+        for name, (func, params) in self.feature_specs.items():
+            values = func(bars, **params)
+            if isinstance(values, pd.DataFrame):
+                suffixes[name] = [f"_{column}" for column in values.columns]
+                for column, suffix in zip(values.columns, suffixes[name]):
+                    columns[name + suffix] = values[column].to_numpy()
+            else:
+                suffixes[name] = ['']
+                columns[name] = np.asarray(values)
+        for alias, name in self._aliases.items():
+            for suffix in suffixes[name]:
+                columns[alias + suffix] = columns[name + suffix]
+        self.feature_time += time.perf_counter() - start
+        self.feature_calls += 1
+        features = pd.DataFrame(columns, index=bars.index)
+        return pd.concat([bars, features], axis=1)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix='ensemble')
+        return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            strategies = {m.name: m.strategy for m in self.members.values() if m.dispatch == 'process'}
+            self._processes = ProcessPoolExecutor(
+                max_workers=min(self.max_processes, len(strategies)),
+                initializer=_init_worker,
+                initargs=(strategies,)
+            )
+        return self._processes
+
+    def _submit(self, member: EnsembleMember, batch: bool, payload: Any) -> Future:
+        if member.dispatch == 'process':
+            func = _worker_predict_batch if batch else _worker_predict
+            return self._process_pool().submit(func, member.name, payload)
+        func = member.strategy.predict_batch if batch else member.strategy.predict
+        return self._thread_pool().submit(_timed, func, payload)
+
+    def _gather(self, futures: Dict[str, Future]) -> Dict[str, Any]:
+        results = {}
+        for name, future in futures.items():
+            try:
+                result, latency = future.result()
+            except Exception as e:
+                logger.error(f"Strategy {name} failed: {e}")
+                continue
+            self.metrics[name].record_latency(latency * 1000)
+            results[name] = result
+        return results
+
+    def predict(self, bars: pd.DataFrame) -> Dict[str, Any]:
+        """Compute features over the history and predict on its last bar.
+
+        Args:
+            bars: Bar history ending at the current bar
+
+        Returns:
+            Combined decision with the individual ``members`` decisions
+        """
+        state = self.compute_features(bars).iloc[-1].to_dict()
+        futures = {name: self._submit(member, False, state) for name, member in self.members.items()}
+        decisions = self._gather(futures)
+        combined = self.combiner(decisions, {name: self.members[name].weight for name in decisions})
+        combined['members'] = decisions
+        return combined
+
+    def predict_batch(self, bars: pd.DataFrame) -> Dict[str, Any]:
+        """Predict every bar of a history with each member's ``predict_batch``.
+
+        Args:
+            bars: Bar history
+
+        Returns:
+            Dictionary with stacked combined decisions under ``ensemble`` and
+            each member's stacked decisions under ``members``
+        """
+        states = self.compute_features(bars)
+        futures = {name: self._submit(member, True, states) for name, member in self.members.items()}
+        batches = self._gather(futures)
+
+        rows = {}
+        for name, batch in list(batches.items()):
+            try:
+                rows[name] = unstack_decisions(batch)
+                if len(rows[name]) != len(states):
+                    raise ValueError(f"{len(rows[name])} decisions for {len(states)} bars")
+            except ValueError as e:
+                logger.error(f"Strategy {name} returned a malformed batch: {e}")
+                rows.pop(name, None)
+                del batches[name]
+
+        combined = []
+        for i in range(len(states)):
+            decisions = {name: member_rows[i] for name, member_rows in rows.items()}
+            decision = self.combiner(decisions, {name: self.members[name].weight for name in decisions})
+            decision.pop('scores', None)
+            combined.append(decision)
+        return {'ensemble': stack_decisions(combined), 'members': batches}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get feature sharing and per-member latency statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        requested = sum(len(member.features) for member in self.members.values())
+        return {
+            'n_strategies': len(self.members),
+            'n_features_requested': requested,
+            'n_features_computed': len(self.feature_specs),
+            'feature_time': self.feature_time,
+            'feature_calls': self.feature_calls,
+            'members': {
+                name: {
+                    'dispatch': member.dispatch,
+                    'weight': member.weight,
+                    **self.metrics[name].get_statistics()
+                }
+                for name, member in self.members.items()
+            }
+        }
+
+    def close(self) -> None:
+        """Shut down the worker pools."""
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=True)
+            self._processes = None
@@ -0,0 +1,189 @@
+"""
+Vectorized multi-environment market simulator for RL strategies.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .base import RLStrategy
+
+logger = logging.getLogger(__name__)
+
+# NaN keeps the previous position, as in the vectorized backtester
+DEFAULT_ACTION_POSITIONS = {'buy': 1.0, 'long': 1.0, 'hold': np.nan, 'flat': 0.0, 'sell': -1.0, 'short': -1.0}
+
+class VectorizedTradingEnv:
+    """
+    Steps N independent market episodes at once as NumPy arrays.
+
+    Each environment replays a random window of the price history. Actions
+    are indices into the action space and map to target positions ('hold',
+    or any action mapped to NaN, keeps the current position); the
+    reward for moving to a position is its PnL over the next bar minus
+    trading costs, or whatever the strategy's ``get_reward_batch`` returns.
+    Finished environments are reset automatically (gym vector-env style).
+    """
+
+    def __init__(self,
+                 prices: Union[np.ndarray, pd.Series],
+                 features: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+                 n_envs: int = 64,
+                 episode_length: int = 256,
+                 fee_rate: float = 0.0,
+                 strategy: Optional[RLStrategy] = None,
+                 actions: Optional[Sequence[str]] = None,
+                 action_positions: Optional[Dict[str, float]] = None,
+                 feature_names: Optional[Sequence[str]] = None,
+                 use_strategy_reward: bool = True,
+                 seed: Optional[int] = None):
+        """
+        Initialize environment.
+
+        Args:
+            prices: Price history of shape (T,)
+            features: Observation features of shape (T, n_features)
+            n_envs: Number of parallel environments
+            episode_length: Steps per episode
+            fee_rate: Proportional cost per unit of position change
+            strategy: RL strategy supplying the action space and rewards
+            actions: Action names (defaults to the strategy's action space)
+            action_positions: Target position per action name (NaN keeps
+                the current position); every action needs one, either here
+                or in ``DEFAULT_ACTION_POSITIONS``
+            feature_names: Names of the feature columns
+            use_strategy_reward: Use the strategy's ``get_reward_batch``
+                instead of the built-in PnL reward
+            seed: Random seed
+        """
+        self.prices = np.asarray(prices, dtype=np.float64)
+        if features is None:
+            features = np.zeros((len(self.prices), 0))
+        if isinstance(features, pd.DataFrame):
+            feature_names = feature_names or list(features.columns)
+        self.features = np.asarray(features, dtype=np.float32)
+        if len(self.features) != len(self.prices):
+            raise ValueError("features and prices must have the same length")
+        if episode_length >= len(self.prices):
+            raise ValueError("episode_length must be shorter than the price history")
+
+        self.strategy = strategy
+        self.use_strategy_reward = use_strategy_reward
+        if actions is None:
+            actions = strategy.get_action_space()['actions'] if strategy is not None else ['sell', 'hold', 'buy']
+        self.actions = np.asarray(actions)
+        positions = {**DEFAULT_ACTION_POSITIONS, **(action_positions or {})}
+        unknown = [str(a) for a in self.actions if str(a) not in positions]
+        if unknown:
+            raise ValueError(f"No target position for actions {unknown}; pass them in action_positions")
+        self.positions_by_action = np.array([positions[str(a)] for a in self.actions])
+        if feature_names is None and strategy is not None:
+            feature_names = strategy.get_state_space().get('features')
+        self.feature_names = list(feature_names or [f"feature_{i}" for i in range(self.features.shape[1])])
+
+        self.n_envs = n_envs
+        self.episode_length = episode_length
+        self.fee_rate = fee_rate
+        self.rng = np.random.default_rng(seed)
+
+        self.start = np.zeros(n_envs, dtype=np.int64)
+        self.t = np.zeros(n_envs, dtype=np.int64)
+        self.position = np.zeros(n_envs)
+        self.equity = np.ones(n_envs)
+        self.episode_return = np.zeros(n_envs)
+
+    @property
+    def observation_shape(self) -> Tuple[int]:
+        """Shape of one observation: features plus current position."""
+        return (self.features.shape[1] + 1,)
+
+    @property
+    def n_actions(self) -> int:
+        """Number of discrete actions."""
+        return len(self.actions)
+
+    def _observe(self) -> np.ndarray:
+        """Build observations for all environments."""
+        obs = np.empty((self.n_envs,) + self.observation_shape, dtype=np.float32)
+        obs[:, :-1] = self.features[self.t]
+        obs[:, -1] = self.position
+        return obs
+
+    def _reset_envs(self, mask: np.ndarray) -> None:
+        """Start new episodes for the selected environments."""
+        n = int(mask.sum())
+        if n == 0:
+            return
+        self.start[mask] = self.rng.integers(0, len(self.prices) - self.episode_length, n)
+        self.t[mask] = self.start[mask]
+        self.position[mask] = 0.0
+        self.equity[mask] = 1.0
+        self.episode_return[mask] = 0.0
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Reset all environments.
+
+        Args:
+            seed: Optional new random seed
+
+        Returns:
+            Observations of shape (n_envs, n_features + 1)
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.ones(self.n_envs, dtype=bool))
+        return self._observe()
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Advance every environment by one bar.
+
+        Args:
+            actions: Action indices of shape (n_envs,)
+
+        Returns:
+            Tuple of (observations, rewards, dones, info)
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        target = self.positions_by_action[actions]
+        new_position = np.where(np.isnan(target), self.position, target)
+
+        price = self.prices[self.t]
+        next_price = self.prices[self.t + 1]
+        costs = np.abs(new_position - self.position) * self.fee_rate
+        pnl = new_position * (next_price / price - 1) - costs
+
+        if self.strategy is not None and self.use_strategy_reward:
+            states = {
+                'price': price,
+                'next_price': next_price,
+                'position': self.position,
+                'new_position': new_position,
+                'costs': costs,
+                **{name: self.features[self.t, i] for i, name in enumerate(self.feature_names)}
+            }
+            rewards = np.asarray(self.strategy.get_reward_batch(states, self.actions[actions]), dtype=np.float64)
+        else:
+            rewards = pnl
+
+        self.equity *= 1 + pnl
+        self.episode_return += rewards
+        self.position = new_position
+        self.t += 1
+
+        dones = self.t - self.start >= self.episode_length
+        info = {
+            'pnl': pnl,
+            'equity': self.equity.copy(),
+            'position': self.position.copy()
+        }
+        if dones.any():
+            info['final_observation'] = self._observe()[dones]
+            info['episode_return'] = self.episode_return[dones].copy()
+            info['final_equity'] = self.equity[dones].copy()
+            self._reset_envs(dones)
+
+        return self._observe(), rewards, dones, info
+
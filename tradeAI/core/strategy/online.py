@@ -0,0 +1,232 @@
+"""
+Online incremental training for strategies fed from a data stream.
+"""
+
+import copy
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+from .base import BaseStrategy
+from .checkpoint import AsyncCheckpointWriter
+from ..data.stream import DataStream
+
+logger = logging.getLogger(__name__)
+
+class OnlineTrainer:
+    """
+    Trains a strategy with ``partial_fit`` in the background while serving.
+
+    Stream items are accumulated into mini-batches of ``batch_size`` rows
+    and handed to a worker thread that updates a private learner copy of
+    the strategy. After every ``publish_every`` updates the learner is
+    copied and the copy replaces the serving strategy with a single
+    reference assignment, so ``predict`` never waits for training and never
+    sees half-updated weights.
+
+    The worker sleeps after each update so that training uses at most
+    ``max_cpu_share`` of one core on average.
+    """
+
+    def __init__(self,
+                 strategy: BaseStrategy,
+                 batch_size: int = 256,
+                 max_cpu_share: float = 0.5,
+                 publish_every: int = 1,
+                 max_pending: int = 4,
+                 checkpoint_path: Optional[str] = None,
+                 window_size: int = 1000):
+        """Initialize online trainer.
+
+        Args:
+            strategy: Strategy implementing ``partial_fit``
+            batch_size: Rows per mini-batch
+            max_cpu_share: Fraction of time the worker may spend training
+            publish_every: Updates between swaps of the serving strategy
+            max_pending: Queued mini-batches before the oldest are dropped
+            checkpoint_path: Save a background checkpoint on each publish
+            window_size: Size of sliding window for update timings
+        """
+        if not 0 < max_cpu_share <= 1:
+            raise ValueError("max_cpu_share must be in (0, 1]")
+        self.batch_size = batch_size
+        self.max_cpu_share = max_cpu_share
+        self.publish_every = publish_every
+        self.checkpoint_path = checkpoint_path
+
+        self._live = strategy
+        self._learner = copy.deepcopy(strategy)
+        self._rows: List[Any] = []
+        self._pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
+        self._writer = AsyncCheckpointWriter() if checkpoint_path else None
+
+        self.version = 0
+        self.n_updates = 0
+        self.n_samples = 0
+        self.dropped_batches = 0
+        self.failed_updates = 0
+        self.train_time = 0.0
+        self.throttle_time = 0.0
+        self.update_times = deque(maxlen=window_size)
+
+    @property
+    def strategy(self) -> BaseStrategy:
+        """The strategy currently serving predictions."""
+        return self._live
+
+    def predict(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Predict with the latest published strategy.
+
+        Args:
+            state: Current market state
+
+        Returns:
+            Dictionary containing trading decisions
+        """
+        return self._live.predict(state)
+
+    def attach(self, stream: DataStream) -> None:
+        """Consume processed items from a (market) data stream.
+
+        Args:
+            stream: Stream whose output feeds the mini-batches
+        """
+        stream.add_consumer(self.feed)
+
+    def start(self) -> None:
+        """Start the training worker."""
+        if self._running:
+            return
+        self._running = True
+        self._worker = threading.Thread(target=self._run, name='online-trainer', daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker after the batch it is training on.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker
+        """
+        self._running = False
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+        if self._writer is not None:
+            self._writer.wait()
+
+    def feed(self, data: Any) -> None:
+        """Add stream output (a row dict, list of rows or DataFrame).
+
+        Never blocks: when the worker falls behind, the oldest pending
+        mini-batch is dropped in favour of the newest.
+
+        Args:
+            data: Processed stream item
+        """
+        if isinstance(data, pd.DataFrame):
+            self._rows.extend(data.to_dict('records'))
+        elif isinstance(data, list):
+            self._rows.extend(data)
+        else:
+            self._rows.append(data)
+
+        while len(self._rows) >= self.batch_size:
+            batch = pd.DataFrame(self._rows[:self.batch_size])
+            del self._rows[:self.batch_size]
+            self._enqueue(batch)
+
+    def _enqueue(self, batch: pd.DataFrame) -> None:
+        while True:
+            try:
+                self._pending.put_nowait(batch)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                    self.dropped_batches += 1
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        """Worker loop."""
+        while self._running:
+            try:
+                batch = self._pending.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self.update(batch)
+
+    def update(self, batch: pd.DataFrame) -> bool:
+        """Train on one mini-batch and publish if due.
+
+        Runs on the worker thread; may be called directly for synchronous
+        updates when no worker is started.
+
+        Args:
+            batch: Mini-batch of rows
+
+        Returns:
+            Whether the update succeeded
+        """
+        start = time.perf_counter()
+        try:
+            self._learner.partial_fit({'bars': batch})
+        except Exception as e:
+            self.failed_updates += 1
+            logger.error(f"Online update failed: {e}")
+            return False
+
+        self.n_updates += 1
+        self.n_samples += len(batch)
+        if self.n_updates % self.publish_every == 0:
+            self.publish()
+
+        elapsed = time.perf_counter() - start
+        self.train_time += elapsed
+        self.update_times.append(elapsed)
+
+        # Duty cycle: train for `elapsed`, then idle so the share holds
+        pause = elapsed * (1 - self.max_cpu_share) / self.max_cpu_share
+        if pause > 0 and self._running:
+            time.sleep(pause)
+            self.throttle_time += pause
+        return True
+
+    def publish(self) -> None:
+        """Swap a snapshot of the learner in as the serving strategy."""
+        snapshot = copy.deepcopy(self._learner)
+        self._live = snapshot
+        self.version += 1
+        if self.checkpoint_path:
+            try:
+                metadata = {'strategy': type(snapshot).__name__, 'version': self.version,
+                            **snapshot.get_checkpoint_metadata()}
+                self._writer.save(self.checkpoint_path, snapshot.get_parameters(), metadata)
+            except NotImplementedError:
+                logger.warning(f"{type(snapshot).__name__} cannot be checkpointed")
+                self.checkpoint_path = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get training statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        busy = self.train_time + self.throttle_time
+        return {
+            'version': self.version,
+            'n_updates': self.n_updates,
+            'n_samples': self.n_samples,
+            'failed_updates': self.failed_updates,
+            'dropped_batches': self.dropped_batches,
+            'pending_batches': self._pending.qsize(),
+            'buffered_rows': len(self._rows),
+            'mean_update_time': sum(self.update_times) / len(self.update_times) if self.update_times else 0.0,
+            'cpu_share': self.train_time / busy if busy > 0 else 0.0
+        }
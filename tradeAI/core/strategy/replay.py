@@ -0,0 +1,347 @@
+"""
+Array-backed experience replay buffers for RL training.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+import numpy as np
+
+from ...utils.tools import ensure_directory
+
+logger = logging.getLogger(__name__)
+
+class SumTree:
+    """
+    Binary sum tree over leaf priorities stored in a flat array.
+
+    Leaves live at ``[n_leaves, 2 * n_leaves)`` with ``n_leaves`` a power of
+    two and the root at index 1. Updates and prefix-sum lookups touch one
+    node per level (O(log n)) and are vectorized across a batch.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize sum tree.
+
+        Args:
+            capacity: Number of leaves
+        """
+        self.capacity = capacity
+        self.n_leaves = 1 << max(0, int(np.ceil(np.log2(max(capacity, 1)))))
+        self.depth = int(np.log2(self.n_leaves))
+        self.tree = np.zeros(2 * self.n_leaves, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        """Sum of all priorities."""
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Get leaf priorities.
+
+        Args:
+            indices: Leaf indices
+
+        Returns:
+            Priorities
+        """
+        return self.tree[np.asarray(indices) + self.n_leaves]
+
+    def update(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Set leaf priorities and refresh their ancestors.
+
+        Args:
+            indices: Leaf indices
+            priorities: New priorities
+        """
+        nodes = np.asarray(indices, dtype=np.int64) + self.n_leaves
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Find the leaves whose cumulative priority range contains each value.
+
+        Args:
+            values: Prefix sums in ``[0, total)``
+
+        Returns:
+            Leaf indices
+        """
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values >= left_sum
+            values -= np.where(go_right, left_sum, 0.0)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.n_leaves
+
+class ReplayBuffer:
+    """
+    Circular experience buffer on preallocated arrays.
+
+    With ``storage_dir`` the arrays are ``np.memmap`` files, so buffers larger
+    than RAM are paged by the OS and can be reopened after a restart. Stored
+    files are only reused when their capacity, shapes and dtypes all match;
+    otherwise the buffer starts empty.
+    """
+
+    FIELDS = ('states', 'actions', 'rewards', 'next_states', 'dones')
+
+    def __init__(self,
+                 capacity: int,
+                 state_shape: Sequence[int],
+                 action_shape: Sequence[int] = (),
+                 state_dtype: Any = np.float32,
+                 action_dtype: Any = np.int64,
+                 storage_dir: Optional[str] = None,
+                 seed: Optional[int] = None):
+        """Initialize replay buffer.
+
+        Args:
+            capacity: Maximum number of transitions
+            state_shape: Shape of one state
+            action_shape: Shape of one action (``()`` for discrete actions)
+            state_dtype: Dtype for states and next states
+            action_dtype: Dtype for actions
+            storage_dir: Directory for memory-mapped storage (in RAM if None)
+            seed: Random seed for sampling
+        """
+        self.capacity = capacity
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+        self.rng = np.random.default_rng(seed)
+        self.size = 0
+        self.position = 0
+
+        specs = {
+            'states': ((capacity, *state_shape), state_dtype),
+            'actions': ((capacity, *action_shape), action_dtype),
+            'rewards': ((capacity,), np.float32),
+            'next_states': ((capacity, *state_shape), state_dtype),
+            'dones': ((capacity,), np.bool_)
+        }
+        self._specs = {name: (tuple(shape), np.dtype(dtype)) for name, (shape, dtype) in specs.items()}
+        self._meta = self._load_meta()
+        self._arrays = {name: self._allocate(name, shape, dtype) for name, (shape, dtype) in self._specs.items()}
+
+    def _load_meta(self) -> Optional[Dict[str, Any]]:
+        """Read stored metadata if the stored files match this buffer's layout."""
+        if self.storage_dir is None:
+            return None
+        ensure_directory(str(self.storage_dir))
+        meta_path = self.storage_dir / 'meta.json'
+        if not meta_path.exists():
+            return None
+
+        meta = json.loads(meta_path.read_text())
+        fields = meta.get('fields', {})
+        for name, (shape, dtype) in self._specs.items():
+            path = self.storage_dir / f"{name}.dat"
+            stored = fields.get(name)
+            if (meta.get('capacity') != self.capacity or
+                    (stored is not None and (tuple(stored[0]) != shape or np.dtype(stored[1]) != dtype)) or
+                    not path.exists() or path.stat().st_size != int(np.prod(shape)) * dtype.itemsize):
+                logger.warning(f"Stored replay buffer in {self.storage_dir} does not match "
+                               f"{name} {shape} {dtype}; starting empty")
+                return None
+        self.size, self.position = meta['size'], meta['position']
+        return meta
+
+    def _allocate(self, name: str, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        """Allocate one field in RAM or as a memory-mapped file."""
+        if self.storage_dir is None:
+            return np.zeros(shape, dtype=dtype)
+        mode = 'r+' if self._meta is not None else 'w+'
+        return np.memmap(self.storage_dir / f"{name}.dat", dtype=dtype, mode=mode, shape=shape)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        arrays = self.__dict__.get('_arrays', {})
+        if name in arrays:
+            return arrays[name]
+        raise AttributeError(name)
+
+    def add(self, state: Any, action: Any, reward: float, next_state: Any, done: bool) -> int:
+        """Add one transition.
+
+        Returns:
+            Index the transition was written to
+        """
+        indices = self.add_batch(
+            np.asarray(state)[None], np.asarray(action)[None], np.asarray([reward]),
+            np.asarray(next_state)[None], np.asarray([done])
+        )
+        return int(indices[0])
+
+    def add_batch(self,
+                  states: np.ndarray,
+                  actions: np.ndarray,
+                  rewards: np.ndarray,
+                  next_states: np.ndarray,
+                  dones: np.ndarray) -> np.ndarray:
+        """Add a batch of transitions, e.g. one step of a vectorized env.
+
+        Returns:
+            Indices the transitions were written to
+        """
+        n = len(rewards)
+        if n > self.capacity:
+            # Only the newest transitions survive a batch larger than the buffer
+            states, actions, rewards, next_states, dones = (
+                x[-self.capacity:] for x in (states, actions, rewards, next_states, dones)
+            )
+            n = self.capacity
+        indices = (self.position + np.arange(n)) % self.capacity
+        for name, values in zip(self.FIELDS, (states, actions, rewards, next_states, dones)):
+            self._arrays[name][indices] = values
+        self.position = int((self.position + n) % self.capacity)
+        self.size = min(self.size + n, self.capacity)
+        return indices
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        """Draw uniform random indices."""
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty buffer")
+        return self.rng.integers(0, self.size, batch_size)
+
+    def get(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        """Gather transitions into contiguous batch arrays."""
+        batch = {name: np.asarray(array[indices]) for name, array in self._arrays.items()}
+        batch['indices'] = indices
+        return batch
+
+    def sample(self, batch_size: int) -> Dict[str, np.ndarray]:
+        """Sample a uniform batch.
+
+        Args:
+            batch_size: Number of transitions
+
+        Returns:
+            Dictionary of batch arrays plus their ``indices``
+        """
+        return self.get(self.sample_indices(batch_size))
+
+    def flush(self) -> None:
+        """Persist memory-mapped storage and buffer metadata."""
+        if self.storage_dir is None:
+            return
+        for array in self._arrays.values():
+            array.flush()
+        (self.storage_dir / 'meta.json').write_text(json.dumps(self._state()))
+
+    def _state(self) -> Dict[str, Any]:
+        """Metadata written by ``flush``."""
+        return {
+            'capacity': self.capacity,
+            'size': self.size,
+            'position': self.position,
+            'fields': {name: [list(shape), dtype.str] for name, (shape, dtype) in self._specs.items()}
+        }
+
+    def memory_usage(self) -> int:
+        """Bytes occupied by the buffer arrays."""
+        return int(sum(array.nbytes for array in self._arrays.values()))
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """
+    Proportional prioritized experience replay.
+
+    Sampling probability is ``p_i ** alpha / sum(p ** alpha)``; batches are
+    drawn by stratified prefix-sum lookups in a sum tree and returned with
+    normalized importance-sampling weights. With ``storage_dir`` the tree's
+    priorities are saved by ``flush``; buffers stored without them are
+    reopened with every transition at the maximum priority.
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 state_shape: Sequence[int],
+                 alpha: float = 0.6,
+                 beta: float = 0.4,
+                 epsilon: float = 1e-6,
+                 **kwargs):
+        """Initialize prioritized replay buffer.
+
+        Args:
+            capacity: Maximum number of transitions
+            state_shape: Shape of one state
+            alpha: Priority exponent (0 is uniform)
+            beta: Importance-sampling exponent
+            epsilon: Added to priorities so no transition is starved
+            **kwargs: Arguments for ReplayBuffer
+        """
+        super().__init__(capacity, state_shape, **kwargs)
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+        if self._meta is not None and self.size > 0:
+            self._load_priorities()
+
+    def _load_priorities(self) -> None:
+        """Restore the sum tree of a reopened buffer."""
+        self.max_priority = self._meta.get('max_priority', self.max_priority)
+        path = self.storage_dir / 'priorities.npy'
+        priorities = np.load(path) if path.exists() else None
+        if priorities is None or priorities.shape != (self.capacity,):
+            priorities = np.zeros(self.capacity)
+            priorities[:self.size] = self.max_priority ** self.alpha
+        self.tree.update(np.arange(self.capacity), priorities)
+
+    def add_batch(self, states, actions, rewards, next_states, dones) -> np.ndarray:
+        indices = super().add_batch(states, actions, rewards, next_states, dones)
+        # New transitions get the highest priority so they are seen at least once
+        self.tree.update(indices, np.full(len(indices), self.max_priority ** self.alpha))
+        return indices
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty buffer")
+        segment = self.tree.total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        return np.minimum(self.tree.find(values), self.size - 1)
+
+    def sample(self, batch_size: int, beta: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Sample a prioritized batch.
+
+        Args:
+            batch_size: Number of transitions
+            beta: Importance-sampling exponent (defaults to ``self.beta``)
+
+        Returns:
+            Dictionary of batch arrays plus ``indices`` and ``weights``
+        """
+        beta = self.beta if beta is None else beta
+        indices = self.sample_indices(batch_size)
+        batch = self.get(indices)
+
+        probabilities = self.tree.get(indices) / self.tree.total
+        weights = (self.size * probabilities) ** (-beta)
+        batch['weights'] = (weights / weights.max()).astype(np.float32)
+        return batch
+
+    def flush(self) -> None:
+        super().flush()
+        if self.storage_dir is not None:
+            np.save(self.storage_dir / 'priorities.npy', self.tree.get(np.arange(self.capacity)))
+
+    def _state(self) -> Dict[str, Any]:
+        return {**super()._state(), 'max_priority': self.max_priority}
+
+    def update_priorities(self, indices: np.ndarray, priorities: np.ndarray) -> None:
+        """Update priorities, typically with absolute TD errors.
+
+        Args:
+            indices: Transition indices from ``sample``
+            priorities: New priorities
+        """
+        priorities = np.abs(np.asarray(priorities, dtype=np.float64)) + self.epsilon
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities ** self.alpha)
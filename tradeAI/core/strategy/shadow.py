@@ -0,0 +1,279 @@
+"""
+Shadow-mode evaluation of candidate strategies on the live stream.
+"""
+
+import time
+import queue
+import logging
+import multiprocessing as mp
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+
+from .base import BaseStrategy
+from ..data.stream import DataStream
+
+logger = logging.getLogger(__name__)
+
+def _shadow_worker(name: str, strategy: BaseStrategy, inbox: Any, outbox: Any) -> None:
+    """Candidate process: predict on mirrored items and report back."""
+    while True:
+        item = inbox.get()
+        if item is None:
+            break
+        seq, sent_at, data = item
+        received_at = time.time()
+        start = time.perf_counter()
+        try:
+            decision, error = strategy.predict(data), None
+        except Exception as e:
+            decision, error = None, str(e)
+        latency = time.perf_counter() - start
+        outbox.put((name, seq, decision, error, latency, received_at - sent_at))
+
+@dataclass
+class _Candidate:
+    name: str
+    process: Any
+    inbox: Any
+    mirrored: int = 0
+    dropped: int = 0
+    processed: int = 0
+    errors: int = 0
+    agreements: int = 0
+    compared: int = 0
+    latencies: deque = field(default_factory=deque)
+    queue_delays: deque = field(default_factory=deque)
+    decisions: deque = field(default_factory=deque)
+
+class ShadowRunner:
+    """
+    Mirrors stream items to candidate strategies running in other processes.
+
+    ``mirror`` only enqueues with ``put_nowait`` on a bounded queue per
+    candidate; when a candidate falls behind, items are dropped for that
+    candidate instead of slowing the caller. Serialization to the worker
+    happens on the queue's feeder thread, so the primary path pays for an
+    append and nothing else. Would-be decisions, model latency and queue
+    delay come back on a bounded shared result queue and are collected with
+    ``collect``; if results are not collected, candidates stall and their
+    items are dropped like any other backlog. Primary decisions recorded with ``record_primary`` are
+    compared to measure agreement.
+    """
+
+    def __init__(self,
+                 candidates: Dict[str, BaseStrategy],
+                 queue_size: int = 1024,
+                 history_size: int = 10000,
+                 start_method: Optional[str] = None):
+        """Initialize shadow runner.
+
+        Args:
+            candidates: Candidate name to strategy (must be picklable)
+            queue_size: Items buffered per candidate before dropping
+            history_size: Decisions and timings kept per candidate
+            start_method: multiprocessing start method (platform default
+                if None)
+        """
+        self.strategies = dict(candidates)
+        self.queue_size = queue_size
+        self.history_size = history_size
+        self._context = mp.get_context(start_method)
+        self._outbox: Any = None
+        self._candidates: Dict[str, _Candidate] = {}
+        self._primary: Dict[int, Any] = {}
+        self._seq = 0
+        self.running = False
+
+    def __enter__(self) -> 'ShadowRunner':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def attach(self, stream: DataStream) -> None:
+        """Mirror every processed item of a data stream.
+
+        Args:
+            stream: Stream to shadow
+        """
+        stream.add_consumer(self.mirror)
+
+    def start(self) -> None:
+        """Start one process per candidate."""
+        if self.running:
+            return
+        self._outbox = self._context.Queue(maxsize=self.queue_size * max(1, len(self.strategies)))
+        for name, strategy in self.strategies.items():
+            inbox = self._context.Queue(maxsize=self.queue_size)
+            process = self._context.Process(
+                target=_shadow_worker,
+                args=(name, strategy, inbox, self._outbox),
+                name=f"shadow-{name}",
+                daemon=True
+            )
+            process.start()
+            self._candidates[name] = _Candidate(
+                name, process, inbox,
+                latencies=deque(maxlen=self.history_size),
+                queue_delays=deque(maxlen=self.history_size),
+                decisions=deque(maxlen=self.history_size)
+            )
+        self.running = True
+
+    def mirror(self, data: Any) -> int:
+        """Offer a stream item to every candidate without blocking.
+
+        Args:
+            data: Stream item (a state dict)
+
+        Returns:
+            Sequence number of the item
+        """
+        seq = self._seq
+        self._seq += 1
+        if not self.running:
+            return seq
+        item = (seq, time.time(), data)
+        for candidate in self._candidates.values():
+            try:
+                candidate.inbox.put_nowait(item)
+                candidate.mirrored += 1
+            except queue.Full:
+                candidate.dropped += 1
+        return seq
+
+    def record_primary(self, seq: int, decision: Dict[str, Any]) -> None:
+        """Record the production decision for an item, for agreement stats.
+
+        Args:
+            seq: Sequence number returned by ``mirror``
+            decision: Decision of the primary strategy
+        """
+        self._primary[seq] = decision.get('action')
+        if len(self._primary) > self.history_size:
+            self._primary.pop(next(iter(self._primary)))
+
+    def collect(self, timeout: float = 0.0) -> int:
+        """Drain results returned by candidates.
+
+        Args:
+            timeout: Seconds to wait for the first result
+
+        Returns:
+            Number of results collected
+        """
+        if self._outbox is None:
+            return 0
+        n = 0
+        block = timeout > 0
+        while True:
+            try:
+                name, seq, decision, error, latency, delay = self._outbox.get(block, timeout)
+            except queue.Empty:
+                return n
+            block = False
+            n += 1
+            candidate = self._candidates[name]
+            candidate.processed += 1
+            candidate.latencies.append(latency)
+            candidate.queue_delays.append(delay)
+            if error is not None:
+                candidate.errors += 1
+                logger.warning(f"Shadow {name} failed on item {seq}: {error}")
+                continue
+            candidate.decisions.append({'seq': seq, 'latency': latency, 'queue_delay': delay, **decision})
+            if seq in self._primary:
+                candidate.compared += 1
+                candidate.agreements += decision.get('action') == self._primary[seq]
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        """Collect until every mirrored item has been processed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Whether all candidates caught up
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if all(c.processed >= c.mirrored for c in self._candidates.values()):
+                return True
+            self.collect(timeout=0.05)
+        return False
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop candidate processes and collect their last results.
+
+        Results are drained while the workers shut down, since a worker
+        cannot exit while its output is still buffered for the result queue.
+        Workers still alive after ``timeout`` are terminated.
+
+        Args:
+            timeout: Seconds to wait for the processes to exit
+        """
+        if not self.running:
+            return
+        self.running = False
+        deadline = time.time() + timeout
+        pending = list(self._candidates.values())
+        while pending:
+            for candidate in list(pending):
+                try:
+                    candidate.inbox.put_nowait(None)
+                    pending.remove(candidate)
+                except queue.Full:
+                    if time.time() >= deadline:
+                        candidate.process.terminate()
+                        pending.remove(candidate)
+            if pending:
+                self.collect(timeout=0.01)
+
+        alive = [candidate.process for candidate in self._candidates.values()]
+        while alive and time.time() < deadline:
+            self.collect(timeout=0.01)
+            alive = [process for process in alive if process.is_alive()]
+        for process in alive:
+            process.terminate()
+        for candidate in self._candidates.values():
+            candidate.process.join()
+        self.collect()
+
+    def decisions(self, name: str) -> pd.DataFrame:
+        """Would-be decisions of a candidate.
+
+        Args:
+            name: Candidate name
+
+        Returns:
+            DataFrame with one row per processed item
+        """
+        return pd.DataFrame(list(self._candidates[name].decisions))
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get per-candidate throughput, drop rate, latency and agreement.
+
+        Returns:
+            Dictionary keyed by candidate name
+        """
+        report = {}
+        for name, c in self._candidates.items():
+            offered = c.mirrored + c.dropped
+            latencies = np.array(c.latencies) * 1000
+            delays = np.array(c.queue_delays) * 1000
+            report[name] = {
+                'mirrored': c.mirrored,
+                'dropped': c.dropped,
+                'drop_rate': c.dropped / offered if offered else 0.0,
+                'processed': c.processed,
+                'errors': c.errors,
+                'latency_ms_mean': float(latencies.mean()) if len(latencies) else 0.0,
+                'latency_ms_p99': float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+                'queue_delay_ms_mean': float(delays.mean()) if len(delays) else 0.0,
+                'agreement': c.agreements / c.compared if c.compared else None
+            }
+        return report
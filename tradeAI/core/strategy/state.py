@@ -0,0 +1,250 @@
+"""
+Fixed-schema state records for the strategy hot path.
+"""
+
+import logging
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+import numpy as np
+
+from .base import BaseStrategy, RLStrategy
+
+logger = logging.getLogger(__name__)
+
+class StateRecord(Mapping):
+    """
+    One market state stored as a row of a NumPy array.
+
+    Fields are available positionally (``record[0]``), as attributes
+    (``record.price``) and by name (``record['price']``), so strategies
+    written against ``Dict[str, Any]`` states keep working unchanged.
+    Records are views: updating ``values`` in place is how a producer
+    publishes the next tick without allocating anything.
+    """
+
+    __slots__ = ('schema', 'values')
+
+    def __init__(self, schema: 'StateSchema', values: np.ndarray):
+        self.schema = schema
+        self.values = values
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        if isinstance(key, str):
+            try:
+                key = self.schema.index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return self.values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.fields)
+
+    def __len__(self) -> int:
+        return len(self.schema.fields)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.schema.index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the record into a plain dict."""
+        return dict(zip(self.schema.fields, self.values.tolist()))
+
+class StateSchema:
+    """
+    Ordered, typed field list of a strategy's state.
+
+    Field order is fixed once, so a state is a flat array and every access
+    on the hot path is positional instead of a string hash lookup.
+    """
+
+    def __init__(self, fields: Sequence[str], dtype: Any = np.float64, name: str = 'State'):
+        """Initialize schema.
+
+        Args:
+            fields: Field names in positional order
+            dtype: Dtype of the state values
+            name: Name used for the generated record class
+        """
+        if len(set(fields)) != len(fields):
+            raise ValueError("Duplicate state fields")
+        self.fields = tuple(fields)
+        self.dtype = np.dtype(dtype)
+        self.index = {field: i for i, field in enumerate(self.fields)}
+
+        # Per-schema record class with one attribute per field
+        attributes = {'__slots__': ()}
+        for i, field in enumerate(self.fields):
+            if field.isidentifier() and not hasattr(StateRecord, field):
+                attributes[field] = property(lambda self, _i=i: self.values[_i])
+        self.record_type = type(f"{name}Record", (StateRecord,), attributes)
+
+    @classmethod
+    def from_state_space(cls,
+                         state_space: Dict[str, Any],
+                         extra_fields: Sequence[str] = (),
+                         dtype: Any = np.float64) -> 'StateSchema':
+        """Build a schema from a ``get_state_space()`` description.
+
+        Args:
+            state_space: Dictionary with a ``features`` list
+            extra_fields: Fields appended after the features (e.g. ``position``)
+            dtype: Dtype of the state values
+
+        Returns:
+            StateSchema
+        """
+        features = list(state_space.get('features') or [])
+        if not features:
+            raise ValueError("State space does not list its features")
+        return cls(features + [f for f in extra_fields if f not in features], dtype)
+
+    @classmethod
+    def from_strategy(cls, strategy: BaseStrategy, **kwargs) -> 'StateSchema':
+        """Build a schema from a strategy's ``get_state_space()``."""
+        get_state_space = getattr(strategy, 'get_state_space', None)
+        if get_state_space is None:
+            raise ValueError(f"{type(strategy).__name__} does not define a state space")
+        return cls.from_state_space(get_state_space(), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    @property
+    def structured_dtype(self) -> np.dtype:
+        """Equivalent structured dtype, for record arrays and memmaps."""
+        return np.dtype([(field, self.dtype) for field in self.fields])
+
+    def getter(self, *fields: str) -> itemgetter:
+        """Positional getter for fields, resolved once outside the hot path.
+
+        Returns:
+            ``operator.itemgetter`` over the field positions, usable on
+            ``record.values`` or any row array
+        """
+        return itemgetter(*(self.index[field] for field in fields))
+
+    def empty(self, n: Optional[int] = None) -> np.ndarray:
+        """Allocate a zeroed state (or batch of n states)."""
+        shape = (len(self.fields),) if n is None else (n, len(self.fields))
+        return np.zeros(shape, dtype=self.dtype)
+
+    def record(self, values: Optional[np.ndarray] = None) -> StateRecord:
+        """Wrap a row (without copying) or a new zeroed state in a record."""
+        if values is None:
+            values = self.empty()
+        elif len(values) != len(self.fields):
+            raise ValueError(f"Expected {len(self.fields)} values, got {len(values)}")
+        return self.record_type(self, values)
+
+    def from_dict(self, state: Dict[str, Any], out: Optional[np.ndarray] = None) -> StateRecord:
+        """Pack a state dict into a record; missing fields are NaN.
+
+        Args:
+            state: State dictionary
+            out: Array to write into instead of allocating
+
+        Returns:
+            StateRecord
+        """
+        values = np.empty(len(self.fields), dtype=self.dtype) if out is None else out
+        for i, field in enumerate(self.fields):
+            values[i] = state.get(field, np.nan)
+        return self.record(values)
+
+    def records(self, batch: np.ndarray) -> List[StateRecord]:
+        """Wrap each row of a (n, n_fields) array, sharing its memory."""
+        batch = np.asarray(batch)
+        if batch.ndim != 2 or batch.shape[1] != len(self.fields):
+            raise ValueError(f"Expected shape (n, {len(self.fields)}), got {batch.shape}")
+        return [self.record_type(self, row) for row in batch]
+
+    def to_structured(self, batch: np.ndarray) -> np.ndarray:
+        """View a contiguous (n, n_fields) array as a structured array."""
+        batch = np.ascontiguousarray(batch, dtype=self.dtype)
+        return batch.view(self.structured_dtype).reshape(len(batch))
+
+class RecordStrategyAdapter:
+    """
+    Feeds fixed-schema records to a strategy.
+
+    Strategies that define ``predict_record(record)`` (and, for RL,
+    ``get_reward_record(record, action)``) receive records directly and can
+    use positional access. Plain dict-based strategies receive the same
+    record through ``predict``; records implement the read-only mapping
+    interface, so they need no changes. One record instance is reused for
+    every array row, so the hot path allocates nothing per tick.
+    """
+
+    def __init__(self, strategy: BaseStrategy, schema: Optional[StateSchema] = None):
+        """Initialize adapter.
+
+        Args:
+            strategy: Strategy to feed
+            schema: State schema (defaults to the strategy's state space)
+        """
+        self.strategy = strategy
+        self.schema = schema or StateSchema.from_strategy(strategy)
+        self._buffer = self.schema.empty()
+        self._record = self.schema.record(self._buffer)
+        self._predict = getattr(strategy, 'predict_record', None) or strategy.predict
+        self._reward = getattr(strategy, 'get_reward_record', None)
+        if self._reward is None and isinstance(strategy, RLStrategy):
+            self._reward = strategy.get_reward
+
+    def _as_record(self, state: Union[StateRecord, np.ndarray, Dict[str, Any]]) -> StateRecord:
+        if isinstance(state, StateRecord):
+            return state
+        if isinstance(state, np.ndarray):
+            self._record.values = state
+            return self._record
+        self.schema.from_dict(state, out=self._buffer)
+        self._record.values = self._buffer
+        return self._record
+
+    def predict(self, state: Union[StateRecord, np.ndarray, Dict[str, Any]]) -> Dict[str, Any]:
+        """Predict from a record, a row array or a state dict.
+
+        Args:
+            state: Current market state
+
+        Returns:
+            Dictionary containing trading decisions
+        """
+        return self._predict(self._as_record(state))
+
+    def get_reward(self,
+                   state: Union[StateRecord, np.ndarray, Dict[str, Any]],
+                   action: Dict[str, Any]) -> float:
+        """Reward for a state-action pair.
+
+        Args:
+            state: Current state
+            action: Action taken by the agent
+
+        Returns:
+            Reward value
+        """
+        if self._reward is None:
+            raise TypeError(f"{type(self.strategy).__name__} does not define rewards")
+        return self._reward(self._as_record(state), action)
+
+    def predict_rows(self, batch: np.ndarray) -> List[Dict[str, Any]]:
+        """Predict each row of a (n, n_fields) array.
+
+        Args:
+            batch: State rows in schema order
+
+        Returns:
+            List of decisions
+        """
+        record = self._record
+        predict = self._predict
+        decisions = []
+        for row in np.asarray(batch, dtype=self.schema.dtype):
+            record.values = row
+            decisions.append(predict(record))
+        return decisions
@@ -0,0 +1,367 @@
+"""
+Parallel hyperparameter search with successive halving and Hyperband.
+"""
+
+import os
+import math
+import time
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+import psutil
+
+from .base import BaseStrategy
+from .checkpoint import load_checkpoint, save_checkpoint
+from ..backtest.vectorized import BacktestConfig, VectorizedBacktester
+from ..backtest.walkforward import expand_param_grid
+from ...utils.tools import compute_hash, ensure_directory
+
+logger = logging.getLogger(__name__)
+
+# (params, budget, checkpoint_path) -> metrics
+TrialObjective = Callable[[Dict[str, Any], float, str], Dict[str, float]]
+
+ParamSpace = Union[Dict[str, Sequence[Any]], Sequence[Dict[str, Any]], Callable[[np.random.Generator], Dict[str, Any]]]
+
+@dataclass
+class Trial:
+    """One hyperparameter configuration and its progress."""
+    trial_id: str
+    params: Dict[str, Any]
+    checkpoint: str
+    bracket: int = 0
+    rung: int = -1
+    budget: float = 0.0
+    score: float = float('nan')
+    metrics: Dict[str, float] = field(default_factory=dict)
+    status: str = 'pending'
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss: int = 0
+
+class BudgetedStrategyObjective:
+    """
+    Trains a strategy on the first ``budget`` training bars and backtests
+    it on the validation bars.
+
+    Survivors resume from their checkpoint: parameters are restored with
+    ``set_parameters`` and only the newly granted bars are fed to
+    ``partial_fit``. Strategies without these hooks are retrained from
+    scratch on the whole span each rung.
+
+    Bars are read from ``<column>.npy`` files in ``data_dir`` with
+    ``mmap_mode='r'``, so worker processes share the page cache.
+    """
+
+    def __init__(self,
+                 strategy_factory: Callable[..., BaseStrategy],
+                 feature_columns: Sequence[str],
+                 data_dir: str,
+                 train_size: int,
+                 backtest_config: Optional[BacktestConfig] = None):
+        """Initialize objective.
+
+        Args:
+            strategy_factory: Module-level callable building a strategy from
+                a parameter set
+            feature_columns: Bar columns passed to the strategy as state
+            data_dir: Directory of ``.npy`` bar columns
+            train_size: Bars available for training; the rest validate
+            backtest_config: Backtest configuration for validation
+        """
+        self.strategy_factory = strategy_factory
+        self.feature_columns = list(feature_columns)
+        self.data_dir = data_dir
+        self.train_size = train_size
+        self.backtest_config = backtest_config or BacktestConfig()
+        self._bars: Optional[Dict[str, np.ndarray]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_bars'] = None
+        return state
+
+    @staticmethod
+    def save_bars(bars: Union[pd.DataFrame, Dict[str, np.ndarray]], data_dir: str) -> None:
+        """Write bar columns as ``.npy`` files for memory-mapping.
+
+        Args:
+            bars: Bar data
+            data_dir: Destination directory
+        """
+        ensure_directory(data_dir)
+        columns = bars.keys() if isinstance(bars, dict) else bars.columns
+        for name in columns:
+            np.save(os.path.join(data_dir, f"{name}.npy"), np.asarray(bars[name], dtype=np.float64))
+
+    def _load(self) -> Dict[str, np.ndarray]:
+        if self._bars is None:
+            self._bars = {
+                name[:-4]: np.load(os.path.join(self.data_dir, name), mmap_mode='r')
+                for name in os.listdir(self.data_dir) if name.endswith('.npy')
+            }
+        return self._bars
+
+    def __call__(self, params: Dict[str, Any], budget: float, checkpoint_path: str) -> Dict[str, float]:
+        bars = self._load()
+        n_train = min(int(budget), self.train_size)
+        strategy = self.strategy_factory(**params)
+
+        trained = 0
+        if os.path.exists(checkpoint_path):
+            checkpoint = load_checkpoint(checkpoint_path)
+            try:
+                strategy.set_parameters(checkpoint.tensors)
+                trained = int(checkpoint.metadata.get('budget', 0))
+            except NotImplementedError:
+                trained = 0
+
+        if 0 < trained < n_train:
+            span = {name: values[trained:n_train] for name, values in bars.items()}
+            try:
+                strategy.partial_fit({'bars': span})
+            except NotImplementedError:
+                strategy.train({'bars': {name: values[:n_train] for name, values in bars.items()}})
+        elif trained == 0:
+            strategy.train({'bars': {name: values[:n_train] for name, values in bars.items()}})
+
+        try:
+            save_checkpoint(checkpoint_path, strategy.get_parameters(), {'params': params, 'budget': n_train})
+        except NotImplementedError:
+            pass
+
+        test = {name: values[self.train_size:] for name, values in bars.items()}
+        states = np.column_stack([test[name] for name in self.feature_columns])
+        result = VectorizedBacktester(self.backtest_config).run(
+            test, strategy=strategy, states=states, feature_names=self.feature_columns
+        )
+        return {**result.stats, 'train_bars': n_train}
+
+def _run_trial(
+    objective: TrialObjective,
+    params: Dict[str, Any],
+    budget: float,
+    checkpoint_path: str
+) -> Tuple[Dict[str, float], float, float, int]:
+    """Run one trial rung in a worker process and measure its resources."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    metrics = objective(params, budget, checkpoint_path)
+    return (
+        metrics,
+        time.perf_counter() - wall_start,
+        time.process_time() - cpu_start,
+        psutil.Process().memory_info().rss
+    )
+
+class SuccessiveHalvingSearch:
+    """
+    Successive halving over a process pool.
+
+    All trials start with ``min_budget`` (training steps, bars, ... as
+    interpreted by the objective). After each rung only the best
+    ``1 / eta`` continue, with ``eta`` times the budget, until
+    ``max_budget``. Survivors keep their checkpoint so the objective can
+    resume instead of retraining; checkpoints of stopped trials are
+    removed unless ``keep_checkpoints`` is set.
+    """
+
+    def __init__(self,
+                 objective: TrialObjective,
+                 param_space: ParamSpace,
+                 work_dir: str,
+                 min_budget: float,
+                 max_budget: float,
+                 eta: int = 3,
+                 n_trials: Optional[int] = None,
+                 metric: str = 'sharpe',
+                 mode: str = 'max',
+                 max_workers: Optional[int] = None,
+                 keep_checkpoints: bool = False,
+                 seed: Optional[int] = None):
+        """Initialize search.
+
+        Args:
+            objective: Picklable callable ``(params, budget, checkpoint_path)``
+                returning metrics
+            param_space: Parameter grid, list of parameter sets, or a
+                sampler ``rng -> params``
+            work_dir: Directory for trial checkpoints
+            min_budget: Budget of the first rung
+            max_budget: Budget of the last rung
+            eta: Reduction factor between rungs
+            n_trials: Trials to start (defaults to the grid size, or
+                ``eta ** n_rungs`` for samplers)
+            metric: Metric to rank trials by
+            mode: ``max`` or ``min``
+            max_workers: Number of worker processes
+            keep_checkpoints: Keep checkpoints of stopped trials
+            seed: Random seed for sampling
+        """
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        if mode not in ('max', 'min'):
+            raise ValueError("mode must be 'max' or 'min'")
+        self.objective = objective
+        self.param_space = param_space
+        self.work_dir = work_dir
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.eta = eta
+        self.n_trials = n_trials
+        self.metric = metric
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.keep_checkpoints = keep_checkpoints
+        self.rng = np.random.default_rng(seed)
+        self.trials: Dict[str, Trial] = {}
+
+    @property
+    def n_rungs(self) -> int:
+        """Rungs from ``min_budget`` to ``max_budget``."""
+        return int(math.floor(math.log(self.max_budget / self.min_budget, self.eta) + 1e-9)) + 1
+
+    def sample_params(self, n: int) -> List[Dict[str, Any]]:
+        """Draw n parameter sets from the parameter space.
+
+        Args:
+            n: Number of parameter sets
+
+        Returns:
+            List of parameter dicts (distinct when drawn from a grid)
+        """
+        if callable(self.param_space):
+            return [self.param_space(self.rng) for _ in range(n)]
+        candidates = expand_param_grid(self.param_space)
+        if n >= len(candidates):
+            return candidates
+        return [candidates[i] for i in self.rng.choice(len(candidates), n, replace=False)]
+
+    def _new_trials(self, n: int, bracket: int) -> List[Trial]:
+        ensure_directory(self.work_dir)
+        trials = []
+        for params in self.sample_params(n):
+            trial_id = compute_hash({'params': params, 'bracket': bracket})[:12]
+            if trial_id in self.trials:
+                continue
+            trial = Trial(trial_id, params, os.path.join(self.work_dir, f"{trial_id}.ckpt"), bracket)
+            self.trials[trial_id] = trial
+            trials.append(trial)
+        return trials
+
+    def _score(self, metrics: Dict[str, float]) -> float:
+        score = float(metrics.get(self.metric, float('nan')))
+        return score if not math.isnan(score) else float('-inf') if self.mode == 'max' else float('inf')
+
+    def _run_rung(self, pool: ProcessPoolExecutor, trials: List[Trial], rung: int, budget: float) -> None:
+        futures = {
+            pool.submit(_run_trial, self.objective, trial.params, budget, trial.checkpoint): trial
+            for trial in trials
+        }
+        for future in as_completed(futures):
+            trial = futures[future]
+            trial.rung = rung
+            trial.budget = budget
+            try:
+                metrics, wall, cpu, rss = future.result()
+            except Exception as e:
+                logger.error(f"Trial {trial.trial_id} failed at budget {budget}: {e}")
+                trial.status = 'failed'
+                continue
+            trial.metrics = metrics
+            trial.score = self._score(metrics)
+            trial.wall_time += wall
+            trial.cpu_time += cpu
+            trial.peak_rss = max(trial.peak_rss, rss)
+            trial.status = 'running'
+
+    def _run_bracket(self, pool: ProcessPoolExecutor, trials: List[Trial], min_budget: float) -> None:
+        """Successive halving of ``trials`` starting at ``min_budget``."""
+        live = trials
+        rung = 0
+        budget = min_budget
+        while live:
+            budget = min(budget, self.max_budget)
+            logger.info(f"Rung {rung}: {len(live)} trials at budget {budget:g}")
+            self._run_rung(pool, live, rung, budget)
+            live = [t for t in live if t.status == 'running']
+            if budget >= self.max_budget * (1 - 1e-9):
+                for trial in live:
+                    trial.status = 'completed'
+                break
+
+            live.sort(key=lambda t: t.score, reverse=self.mode == 'max')
+            keep = max(1, len(live) // self.eta)
+            for trial in live[keep:]:
+                trial.status = 'stopped'
+                if not self.keep_checkpoints and os.path.exists(trial.checkpoint):
+                    os.remove(trial.checkpoint)
+            live = live[:keep]
+            budget *= self.eta
+            rung += 1
+
+    def run(self) -> pd.DataFrame:
+        """Run the search.
+
+        Returns:
+            Leaderboard, best first
+        """
+        n = self.n_trials or (self.eta ** (self.n_rungs - 1) if callable(self.param_space) else len(expand_param_grid(self.param_space)))
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            self._run_bracket(pool, self._new_trials(n, 0), self.min_budget)
+        return self.leaderboard()
+
+    def leaderboard(self) -> pd.DataFrame:
+        """Rank trials by furthest rung reached, then by score.
+
+        Returns:
+            DataFrame with params, score, status and resource usage per trial
+        """
+        if not self.trials:
+            return pd.DataFrame()
+        rows = [{
+            'trial_id': t.trial_id,
+            'bracket': t.bracket,
+            'rung': t.rung,
+            'budget': t.budget,
+            'score': t.score,
+            'status': t.status,
+            'params': t.params,
+            'wall_time': t.wall_time,
+            'cpu_time': t.cpu_time,
+            'peak_rss_mb': t.peak_rss / 2 ** 20,
+            'checkpoint': t.checkpoint if os.path.exists(t.checkpoint) else None,
+            **{f"metric_{k}": v for k, v in t.metrics.items()}
+        } for t in self.trials.values()]
+        board = pd.DataFrame(rows)
+        return board.sort_values(
+            ['budget', 'score'], ascending=[False, self.mode == 'min']
+        ).reset_index(drop=True)
+
+class HyperbandSearch(SuccessiveHalvingSearch):
+    """
+    Hyperband: successive halving brackets trading trial count for budget.
+
+    Bracket ``s`` starts ``ceil((s_max + 1) / (s + 1) * eta ** s)`` trials
+    at ``max_budget * eta ** -s``, from the most exploratory bracket down
+    to one that runs a few trials on the full budget. All brackets share one
+    process pool.
+    """
+
+    def run(self) -> pd.DataFrame:
+        """Run every bracket.
+
+        Returns:
+            Leaderboard, best first
+        """
+        s_max = self.n_rungs - 1
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            for s in range(s_max, -1, -1):
+                n = int(math.ceil((s_max + 1) / (s + 1) * self.eta ** s))
+                min_budget = self.max_budget * self.eta ** -s
+                logger.info(f"Hyperband bracket {s}: {n} trials from budget {min_budget:g}")
+                self._run_bracket(pool, self._new_trials(n, s), min_budget)
+        return self.leaderboard()
@@ -70,12 +70,14 @@ def compute_hash(data: Any) -> str:
     Compute SHA256 hash of data.
     
     Args:
-        data: Data to hash
+        data: JSON-serializable data, or raw bytes (hashed as-is)
         
     Returns:
         Hash string
     """
     try:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(data).hexdigest()
         data_str = json.dumps(data, sort_keys=True)
         return hashlib.sha256(data_str.encode()).hexdigest()
     except Exception as e:
@@ -156,29 +158,96 @@ def parse_timeframe(timeframe: str) -> int:
         logger.error(f"Failed to parse timeframe {timeframe}: {str(e)}")
         raise
 
-def retry(max_attempts: int = 3, delay: float = 1.0):
+def backoff_delay(
+    attempt: int,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    max_delay: Optional[float] = None,
+    jitter: bool = False,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Compute the wait before a retry.
+    
+    Args:
+        attempt: Number of failed attempts so far, minus one
+        delay: Base delay in seconds
+        backoff: Multiplier applied per attempt (1.0 keeps the delay fixed)
+        max_delay: Upper bound of the backoff delay
+        jitter: Draw uniformly between 0 and the backoff delay, so clients
+            that failed together do not retry together
+        retry_after: Server-requested wait, used as a lower bound
+    
+    Returns:
+        Seconds to wait
     """
-    Retry decorator for functions.
+    import random
+    
+    wait = delay * backoff ** attempt
+    if max_delay is not None:
+        wait = min(wait, max_delay)
+    if jitter:
+        wait = random.uniform(0, wait)
+    if retry_after is not None:
+        # Spread the herd released when Retry-After elapses
+        wait = max(wait, retry_after + (random.uniform(0, delay) if jitter else 0.0))
+    return wait
+
+def retry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 1.0,
+    max_delay: Optional[float] = None,
+    jitter: bool = False,
+    exceptions: tuple = (Exception,)
+):
+    """
+    Retry decorator for functions and coroutine functions.
+    
+    Exceptions with a ``retry_after`` attribute (e.g. RateLimitError) wait
+    at least that long before the next attempt.
     
     Args:
         max_attempts: Maximum number of attempts
         delay: Delay between attempts in seconds
+        backoff: Delay multiplier per attempt (1.0 keeps a fixed delay)
+        max_delay: Upper bound of the delay
+        jitter: Randomize delays to avoid synchronized retries
+        exceptions: Exception types that are retried
     """
     from functools import wraps
+    import asyncio
     import time
     
+    def wait_for(attempts: int, e: Exception) -> float:
+        logger.warning(f"Attempt {attempts} failed: {str(e)}")
+        return backoff_delay(attempts - 1, delay, backoff, max_delay, jitter, getattr(e, 'retry_after', None))
+    
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempts = 0
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        attempts += 1
+                        if attempts >= max_attempts:
+                            raise
+                        await asyncio.sleep(wait_for(attempts, e))
+            return async_wrapper
+    
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempts = 0
-            while attempts < max_attempts:
+            while True:
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     attempts += 1
-                    if attempts == max_attempts:
+                    if attempts >= max_attempts:
                         raise
-                    logger.warning(f"Attempt {attempts} failed: {str(e)}")
-                    time.sleep(delay)
+                    time.sleep(wait_for(attempts, e))
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
\ No newline at end of file